@@ -0,0 +1,227 @@
+# augmentation.py
+# Batched random augmentation of hand poses for training-set generation.
+from __future__ import annotations
+from typing import Iterator, Literal, Optional, Sequence
+import numpy as np
+
+from handposeutils.calculations import transforms
+from handposeutils.data.constants import FINGER_MAPPING
+from handposeutils.data.handpose_batch import HandPoseBatch
+
+_MIRRORED_SIDE = {"left_hand": "right_hand", "right_hand": "left_hand"}
+_BLOCK_ROWS = 1024  # Augmented rows per random stream, independent of the chunk size
+
+
+class Augmenter:
+    """
+    Generates randomly augmented copies of hand poses, many poses at a time.
+
+    Each augmented copy goes through, in order: random finger straightening, scale jitter,
+    a random rotation, a random mirror, and per-landmark Gaussian noise. Scaling, rotation
+    and mirroring happen about each pose's centroid, so augmented poses stay where their
+    source was. Every step runs vectorized over a whole chunk of poses.
+
+    Random values are drawn from a separate stream for each block of 1024 augmented rows,
+    derived from the seed, so a seed gives the same poses however they are chunked.
+
+    Parameters
+    ----------
+    max_rotation_degrees : float, default=180.0
+        Largest rotation angle. With the default of 180 and no `rotation_axis`, rotations
+        are drawn uniformly over all 3D orientations (random unit quaternions); otherwise the
+        angle is drawn uniformly from [-max_rotation_degrees, max_rotation_degrees].
+        Set to 0 to disable rotation.
+    rotation_axis : {'x', 'y', 'z'} or array-like of length 3, optional
+        Fixed axis to rotate around. By default a random axis is drawn for every copy.
+    mirror_probability : float, default=0.0
+        Chance that a copy is mirrored across `mirror_axis`. Mirrored copies have their
+        side flipped between 'left_hand' and 'right_hand'.
+    mirror_axis : {'x', 'y', 'z'}, default='x'
+        Axis to mirror across.
+    scale_jitter : float, default=0.0
+        Copies are scaled by a factor drawn uniformly from [1 - scale_jitter, 1 + scale_jitter].
+    straighten_probability : float, default=0.0
+        Chance, per finger and per copy, that the finger is straightened
+        (see `transforms.straighten_fingers`).
+    noise_std : float, default=0.0
+        Standard deviation of the Gaussian noise added to every landmark coordinate,
+        in the units of the input poses.
+
+    Example
+    -------
+    >>> augmenter = Augmenter(max_rotation_degrees=30, mirror_probability=0.5, noise_std=0.01)
+    >>> for chunk in augmenter.iter_augmented(batch, copies=10, chunk_size=4096, rng=42):
+    ...     train_on(chunk.array)
+    """
+
+    def __init__(self, max_rotation_degrees: float = 180.0,
+                 rotation_axis: Optional[Literal['x', 'y', 'z'] | Sequence[float]] = None,
+                 mirror_probability: float = 0.0, mirror_axis: Literal['x', 'y', 'z'] = 'x',
+                 scale_jitter: float = 0.0, straighten_probability: float = 0.0, noise_std: float = 0.0):
+        if mirror_axis not in transforms._AXIS_INDEX:
+            raise ValueError("Axis must be 'x', 'y', or 'z'")
+        if isinstance(rotation_axis, str):
+            if rotation_axis not in transforms._AXIS_INDEX:
+                raise ValueError("Axis must be 'x', 'y', or 'z'")
+            rotation_axis = np.eye(3)[transforms._AXIS_INDEX[rotation_axis]]
+        elif rotation_axis is not None:
+            rotation_axis = np.asarray(rotation_axis, dtype=np.float64)
+
+        self.max_rotation_degrees = max_rotation_degrees
+        self.rotation_axis = rotation_axis
+        self.mirror_probability = mirror_probability
+        self.mirror_axis = mirror_axis
+        self.scale_jitter = scale_jitter
+        self.straighten_probability = straighten_probability
+        self.noise_std = noise_std
+
+    def augment(self, poses, copies: int = 1, rng=None) -> HandPoseBatch:
+        """
+        Produce all augmented copies at once.
+
+        Parameters
+        ----------
+        poses : HandPoseBatch or np.ndarray
+            Source poses, as a batch or an (N, 21, 3) array.
+        copies : int, default=1
+            Number of augmented copies per source pose.
+        rng : int, np.random.SeedSequence, np.random.Generator, or None
+            Seed or generator. The same seed gives the same output, also when streamed
+            with `iter_augmented`.
+
+        Returns
+        -------
+        HandPoseBatch
+            Batch of N * copies poses; rows i * copies to (i + 1) * copies - 1 come from pose i.
+        """
+        return self._concatenate(list(self.iter_augmented(poses, copies, chunk_size=None, rng=rng)))
+
+    def iter_augmented(self, poses, copies: int = 1, chunk_size: Optional[int] = 4096,
+                       rng=None) -> Iterator[HandPoseBatch]:
+        """
+        Stream augmented copies in fixed-size chunks, keeping memory bounded.
+
+        Parameters
+        ----------
+        poses : HandPoseBatch or np.ndarray
+            Source poses, as a batch or an (N, 21, 3) array.
+        copies : int, default=1
+            Number of augmented copies per source pose.
+        chunk_size : int or None, default=4096
+            Number of augmented poses per yielded batch (the last one may be smaller).
+            None yields everything as a single chunk.
+        rng : int, np.random.SeedSequence, np.random.Generator, or None
+            Seed or generator. The same seed gives the same output, whatever the chunk size.
+
+        Yields
+        ------
+        HandPoseBatch
+            Consecutive chunks of the N * copies augmented poses, in source order.
+        """
+        if not isinstance(poses, HandPoseBatch):
+            poses = HandPoseBatch.from_array(poses, copy=False)
+        seed = _seed_sequence(rng)
+        total = len(poses) * copies
+        chunk_size = total if chunk_size is None else chunk_size
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        blocks = {}  # Draws of the blocks the current chunk overlaps, by block index
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            first, last = start // _BLOCK_ROWS, (stop - 1) // _BLOCK_ROWS
+            blocks = {b: blocks[b] if b in blocks else self._draw_block(seed, b, total)
+                      for b in range(first, last + 1)}
+            rows = slice(start - first * _BLOCK_ROWS, stop - first * _BLOCK_ROWS)
+            draws = {key: np.concatenate([blocks[b][key] for b in range(first, last + 1)])[rows]
+                     for key in blocks[first]}
+            source = np.arange(start, stop) // copies
+            yield self._augment_chunk(poses, source, draws)
+
+    # --- Internals ---
+
+    def _draw_block(self, seed: np.random.SeedSequence, block: int, total: int) -> dict:
+        """Every random value used by the augmented rows of one block, from its own stream."""
+        rng = np.random.default_rng(np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key + (block,)))
+        m = min(_BLOCK_ROWS, total - block * _BLOCK_ROWS)
+        draws = {}
+        if self.straighten_probability > 0:
+            draws["straighten"] = rng.random((m, len(FINGER_MAPPING))) < self.straighten_probability
+        if self.scale_jitter > 0:
+            draws["scale"] = rng.uniform(1 - self.scale_jitter, 1 + self.scale_jitter, m)
+        if self.max_rotation_degrees:
+            draws["rotation"] = self._random_rotations(m, rng)
+        if self.mirror_probability > 0:
+            draws["mirror"] = rng.random(m) < self.mirror_probability
+        if self.noise_std > 0:
+            draws["noise"] = rng.normal(0.0, self.noise_std, (m, 21, 3))
+        return draws
+
+    def _augment_chunk(self, poses: HandPoseBatch, source: np.ndarray, draws: dict) -> HandPoseBatch:
+        points = poses.array[source]  # fancy indexing copies, so the sources are never touched
+        sides = poses.sides[source]
+        m = len(source)
+
+        if "straighten" in draws:
+            # Straighten every finger of every row once, then keep the straightened joints
+            # only where that finger was picked
+            chosen = draws["straighten"]
+            joints = np.zeros((m, 21), dtype=bool)
+            for f, indices in enumerate(FINGER_MAPPING.values()):
+                joints[:, indices.start:indices.stop] = chosen[:, f:f + 1]
+            points = np.where(joints[..., None], transforms.straighten_fingers(points), points)
+
+        centroids = points.mean(axis=1, keepdims=True)
+        points -= centroids
+
+        if "scale" in draws:
+            points *= draws["scale"][:, None, None]
+
+        if "rotation" in draws:
+            points = np.einsum('nij,nkj->nki', draws["rotation"], points)
+
+        if "mirror" in draws:
+            mirrored = draws["mirror"]
+            points[mirrored, :, transforms._AXIS_INDEX[self.mirror_axis]] *= -1
+            sides = sides.copy()
+            sides[mirrored] = [_MIRRORED_SIDE.get(side, side) for side in sides[mirrored]]
+
+        points += centroids
+        if "noise" in draws:
+            points += draws["noise"]
+
+        return HandPoseBatch.from_array(points, sides, poses.names[source], copy=False)
+
+    def _random_rotations(self, m: int, rng: np.random.Generator) -> np.ndarray:
+        if self.rotation_axis is None and self.max_rotation_degrees >= 180:
+            # Normalized 4D Gaussians are uniformly distributed unit quaternions
+            return transforms.quaternion_to_matrix(rng.normal(size=(m, 4)))
+
+        if self.rotation_axis is None:
+            axes = rng.normal(size=(m, 3))
+        else:
+            axes = np.broadcast_to(self.rotation_axis, (m, 3))
+        degrees = rng.uniform(-self.max_rotation_degrees, self.max_rotation_degrees, m)
+        return transforms.axis_angle_to_matrix(axes, degrees)
+
+    @staticmethod
+    def _concatenate(chunks) -> HandPoseBatch:
+        if not chunks:
+            return HandPoseBatch.from_array(np.empty((0, 21, 3)), copy=False)
+        if len(chunks) == 1:
+            return chunks[0]
+        return HandPoseBatch.from_array(
+            np.concatenate([c.array for c in chunks]),
+            np.concatenate([c.sides for c in chunks]),
+            np.concatenate([c.names for c in chunks]),
+            copy=False
+        )
+
+
+def _seed_sequence(rng) -> np.random.SeedSequence:
+    """Turn an int, SeedSequence, Generator or None into the SeedSequence the block streams derive from."""
+    if isinstance(rng, np.random.SeedSequence):
+        return rng
+    if isinstance(rng, np.random.Generator):
+        return np.random.SeedSequence(rng.integers(2 ** 63, size=4))
+    return np.random.SeedSequence(rng)
@@ -17,7 +17,7 @@ def vector_between(c1, c2):
     np.array
         A NumPy array representing the vector from c1 to c2.
     """
-    return np.array([c2.x - c1.x, c2.y - c1.y, c2.z - c1.z])
+    return np.asarray(c2, dtype=float) - np.asarray(c1, dtype=float)
 
 
 
@@ -199,7 +199,7 @@ def get_hand_aspect_ratio(pose) -> float:
     float
         Ratio of hand width to height in the XY plane.
     """
-    coords = np.array([c.as_tuple() for c in pose.get_all_coordinates()])
+    coords = pose.array
     min_x, max_x = coords[:, 0].min(), coords[:, 0].max()
     min_y, max_y = coords[:, 1].min(), coords[:, 1].max()
 
@@ -226,7 +226,7 @@ def get_pose_flatness(pose, axis='z') -> float:
     float
         Standard deviation along the specified axis. Lower values mean flatter pose.
     """
-    coords = np.array([c.as_tuple() for c in pose.get_all_coordinates()])
+    coords = pose.array
     axis_map = {'x': 0, 'y': 1, 'z': 2}
     return np.std(coords[:, axis_map[axis]])
 
@@ -271,9 +271,9 @@ def get_palm_normal_vector(pose) -> np.ndarray:
     numpy.ndarray
         Normalized 3D vector representing the palm normal.
     """
-    a = np.array(pose[0].as_tuple())   # Wrist
-    b = np.array(pose[5].as_tuple())   # Index MCP
-    c = np.array(pose[17].as_tuple())  # Pinky MCP
+    a = np.asarray(pose[0], dtype=float)   # Wrist
+    b = np.asarray(pose[5], dtype=float)   # Index MCP
+    c = np.asarray(pose[17], dtype=float)  # Pinky MCP
 
     # Cross product of two vectors from wrist to edges of palm
     v1 = b - a
@@ -281,6 +281,59 @@ def get_palm_normal_vector(pose) -> np.ndarray:
     normal = np.cross(v1, v2)
     return normal / (np.linalg.norm(normal) + 1e-6)
 
+def get_palm_frame(pose, chunk_size=None) -> np.ndarray:
+    """
+    Compute an orthonormal reference frame attached to the palm.
+
+    The frame's y-axis points from the wrist to the middle-finger MCP, its z-axis is the
+    palm normal (as in `get_palm_normal_vector`, made perpendicular to y), and its x-axis
+    completes a right-handed frame. Works on a single pose or on a whole batch at once.
+
+    Parameters
+    ----------
+    pose : HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        A pose, a batch or sequence of poses, or a raw array of shape (..., 21, 3).
+    chunk_size : int, optional
+        For (N, 21, 3) input, compute the frames of this many poses at a time, so only
+        one chunk is held in working memory and memory-mapped libraries are never loaded
+        whole. By default all poses are processed at once.
+
+    Returns
+    -------
+    numpy.ndarray
+        Rotation matrices of shape (..., 3, 3) whose rows are the frame's x, y and z axes,
+        so `frame @ v` expresses a vector `v` in palm coordinates. Poses too degenerate
+        to define a frame (coincident or collinear palm landmarks) get the identity.
+    """
+    points = pose if isinstance(pose, np.ndarray) else pose.array
+    if chunk_size is None or points.ndim != 3:
+        return _palm_frame(points)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    frames = np.empty((len(points), 3, 3))
+    for start in range(0, len(points), chunk_size):
+        frames[start:start + chunk_size] = _palm_frame(points[start:start + chunk_size])
+    return frames
+
+def _palm_frame(points: np.ndarray) -> np.ndarray:
+    """`get_palm_frame` of a (..., 21, 3) array, in one pass."""
+    wrist = points[..., 0, :]
+    up = points[..., 9, :] - wrist  # Wrist -> middle MCP
+    normal = np.cross(points[..., 5, :] - wrist, points[..., 17, :] - wrist)
+
+    # Gram-Schmidt: drop the part of the normal along `up`, then complete the frame
+    up_norm = np.linalg.norm(up, axis=-1, keepdims=True)
+    y_axis = np.divide(up, up_norm, out=np.zeros_like(up), where=up_norm > 1e-12)
+    normal = normal - np.sum(normal * y_axis, axis=-1, keepdims=True) * y_axis
+    normal_norm = np.linalg.norm(normal, axis=-1, keepdims=True)
+    z_axis = np.divide(normal, normal_norm, out=np.zeros_like(normal), where=normal_norm > 1e-12)
+    x_axis = np.cross(y_axis, z_axis)
+
+    frame = np.stack([x_axis, y_axis, z_axis], axis=-2)
+    degenerate = (up_norm[..., 0] <= 1e-12) | (normal_norm[..., 0] <= 1e-12)
+    frame[degenerate] = np.eye(3)
+    return frame
+
 def get_cross_finger_angles(pose) -> dict[str, float]:
     """
     Measure the angle between direction vectors of adjacent fingers.
@@ -1,6 +1,7 @@
 import numpy as np
 from typing import Tuple, List
 from handposeutils.data.handpose import HandPose
+from handposeutils.calculations.transforms import canonicalize
 
 def procrustes_alignment(pose1: HandPose, pose2: HandPose) -> Tuple[np.ndarray, np.ndarray, float]:
     """
@@ -40,9 +41,9 @@ def procrustes_alignment(pose1: HandPose, pose2: HandPose) -> Tuple[np.ndarray,
     - The Procrustes distance is **not** invariant to landmark correspondence errors.
     """
 
-    # Step 1: Convert HandPoses to N x 3 numpy arrays
-    p1 = np.array([coord.as_tuple() for coord in pose1.get_all_coordinates()])
-    p2 = np.array([coord.as_tuple() for coord in pose2.get_all_coordinates()])
+    # Step 1: Take the N x 3 landmark arrays backing each HandPose
+    p1 = pose1.array
+    p2 = pose2.array
 
     if p1.shape != p2.shape:
         raise ValueError(f"Shape mismatch: pose1 has shape {p1.shape}, pose2 has shape {p2.shape}")
@@ -74,6 +75,87 @@ def procrustes_alignment(pose1: HandPose, pose2: HandPose) -> Tuple[np.ndarray,
 
     return p1_aligned, p2_aligned, distance
 
+def _canonical_shapes(points: np.ndarray) -> np.ndarray:
+    """Canonicalize (..., 21, 3) points, then center and scale each pose to unit Frobenius norm."""
+    shapes = canonicalize(points)
+    shapes -= shapes.mean(axis=-2, keepdims=True)
+    norms = np.linalg.norm(shapes, axis=(-2, -1), keepdims=True)
+    return np.divide(shapes, norms, out=np.zeros_like(shapes), where=norms > 0)
+
+def _stacked_points(poses) -> np.ndarray:
+    """Return the (N, 21, 3) points of a HandPoseBatch, an array, or a list of HandPoses."""
+    if isinstance(poses, np.ndarray):
+        return poses.reshape(-1, 21, 3)
+    if hasattr(poses, "array"):
+        return poses.array.reshape(-1, 21, 3)
+    return np.stack([pose.array for pose in poses]) if len(poses) else np.empty((0, 21, 3))
+
+def canonical_distance(pose1: HandPose, pose2: HandPose) -> float:
+    """
+    Compare two hand poses after moving each into its canonical palm frame.
+
+    Like `procrustes_alignment`, the comparison ignores translation, scale and rotation,
+    but the rotation comes from each pose's own palm frame instead of an SVD fitted to
+    the pair, so each pose's canonical shape can be computed once and reused.
+
+    Parameters
+    ----------
+    pose1 : HandPose
+        First hand pose.
+    pose2 : HandPose
+        Second hand pose.
+
+    Returns
+    -------
+    distance : float
+        Sum of squared differences between the canonical, unit-scaled poses.
+        Lower values indicate greater similarity.
+
+    See Also
+    --------
+    canonical_distance_matrix : The same distance between every pose and every template.
+    handposeutils.calculations.transforms.canonicalize
+    """
+    shape1 = _canonical_shapes(pose1.array)
+    shape2 = _canonical_shapes(pose2.array)
+    return float(np.sum((shape1 - shape2) ** 2))
+
+def canonical_distance_matrix(poses, templates, chunk_size: int = 4096) -> np.ndarray:
+    """
+    Compute `canonical_distance` between every pose and every template in one pass.
+
+    Each pose and template is canonicalized once, after which all distances come from a
+    single matrix product, which makes template matching against large libraries cheap.
+
+    Parameters
+    ----------
+    poses : HandPoseBatch, list of HandPose, or np.ndarray of shape (N, 21, 3)
+        Poses to match.
+    templates : HandPoseBatch, list of HandPose, or np.ndarray of shape (M, 21, 3)
+        Templates to match against.
+    chunk_size : int, optional
+        Poses canonicalized at a time (default 4096). Only one chunk of `poses` is held
+        in working memory, so memory-mapped libraries are never loaded whole.
+
+    Returns
+    -------
+    numpy.ndarray
+        Distances of shape (N, M); entry (i, j) compares pose i with template j.
+    """
+    points = _stacked_points(poses)
+    template_shapes = _canonical_shapes(_stacked_points(templates)).reshape(-1, 63)
+    template_norms = np.sum(template_shapes ** 2, axis=1)
+
+    distances = np.empty((len(points), len(template_shapes)))
+    for start in range(0, len(points), chunk_size):
+        shapes = _canonical_shapes(points[start:start + chunk_size]).reshape(-1, 63)
+        # |a - b|^2 = |a|^2 + |b|^2 - 2 a.b
+        block = distances[start:start + chunk_size]
+        np.matmul(shapes, template_shapes.T, out=block)
+        block *= -2
+        block += np.sum(shapes ** 2, axis=1)[:, None] + template_norms[None, :]
+    return np.maximum(distances, 0.0, out=distances)
+
 def euclidean_distance(pose1: HandPose, pose2: HandPose) -> float:
     """
     Compute the mean Euclidean distance between two hand poses.
@@ -102,8 +184,8 @@ def euclidean_distance(pose1: HandPose, pose2: HandPose) -> float:
     ValueError
         If the number of landmarks (or their dimensionality) differs between poses.
     """
-    p1 = np.array([coord.as_tuple() for coord in pose1.get_all_coordinates()])
-    p2 = np.array([coord.as_tuple() for coord in pose2.get_all_coordinates()])
+    p1 = pose1.array
+    p2 = pose2.array
 
     if p1.shape != p2.shape:
         raise ValueError(f"Shape mismatch: pose1 has shape {p1.shape}, pose2 has shape {p2.shape}")
@@ -137,14 +219,13 @@ def cosine_similarity(pose1: HandPose, pose2: HandPose) -> float:
 
     Notes
     -----
-    - This method normalizes translation by centering poses before comparison.
+    - This method normalizes translation by centering copies of the poses before comparison;
+      `pose1` and `pose2` are not modified.
     - Similarity is undefined for zero-length pose vectors (returns 0.0).
     """
-    pose1.normalize_position()
-    pose2.normalize_position()
-
-    vec1 = np.array([c for coord in pose1.get_all_coordinates() for c in coord.as_tuple()])
-    vec2 = np.array([c for coord in pose2.get_all_coordinates() for c in coord.as_tuple()])
+    # Center local copies; the input poses are left untouched
+    vec1 = (pose1.array - pose1.array.mean(axis=0)).ravel()
+    vec2 = (pose2.array - pose2.array.mean(axis=0)).ravel()
 
     dot = np.dot(vec1, vec2)
     norm1 = np.linalg.norm(vec1)
@@ -270,34 +351,26 @@ def compute_joint_angle_errors(pose1: HandPose, pose2: HandPose) -> List[float]:
     list of float
         Absolute differences in radians for each joint, ordered finger by finger.
     """
-    from math import acos
-    from numpy.linalg import norm
-
-    def angle_between(v1, v2):
-        dot = np.dot(v1, v2)
-        return acos(np.clip(dot / (norm(v1) * norm(v2) + 1e-6), -1.0, 1.0))
-
-    pairs = [
+    pairs = np.array([
         (1, 2, 3), (2, 3, 4),     # Thumb
         (5, 6, 7), (6, 7, 8),     # Index
         (9, 10, 11), (10, 11, 12),# Middle
         (13, 14, 15), (14, 15, 16),# Ring
         (17, 18, 19), (18, 19, 20) # Pinky
-    ]
-
-    angles1 = []
-    angles2 = []
+    ])
 
-    for a, b, c in pairs:
-        v1a = pose1[b] - pose1[a]
-        v1b = pose1[c] - pose1[b]
-        angles1.append(angle_between(v1a.as_tuple(), v1b.as_tuple()))
+    def angles_between_bones(points):
+        # Angle between bone a->b and bone b->c for every triplet at once
+        v1 = points[pairs[:, 1]] - points[pairs[:, 0]]
+        v2 = points[pairs[:, 2]] - points[pairs[:, 1]]
+        dot = np.einsum('ij,ij->i', v1, v2)
+        norms = np.linalg.norm(v1, axis=1) * np.linalg.norm(v2, axis=1)
+        return np.arccos(np.clip(dot / (norms + 1e-6), -1.0, 1.0))
 
-        v2a = pose2[b] - pose2[a]
-        v2b = pose2[c] - pose2[b]
-        angles2.append(angle_between(v2a.as_tuple(), v2b.as_tuple()))
+    angles1 = angles_between_bones(pose1.array)
+    angles2 = angles_between_bones(pose2.array)
 
-    return np.abs(np.array(angles1) - np.array(angles2))
+    return np.abs(angles1 - angles2)
 
 
 def pose_similarity(pose1: HandPose, pose2: HandPose, method: str = 'procrustes') -> float:
@@ -307,6 +380,7 @@ def pose_similarity(pose1: HandPose, pose2: HandPose, method: str = 'procrustes'
     Supported methods
     -----------------
     - 'procrustes': Procrustes distance (lower = more similar)
+    - 'canonical' : Distance between canonical palm-frame poses (lower = more similar)
     - 'euclidean' : Euclidean distance
     - 'cosine'    : Cosine similarity
     - 'joint_angle': Mean squared joint angle difference
@@ -334,6 +408,8 @@ def pose_similarity(pose1: HandPose, pose2: HandPose, method: str = 'procrustes'
     if method == 'procrustes':
         _, _, distance = procrustes_alignment(pose1, pose2)
         return distance
+    elif method == 'canonical':
+        return canonical_distance(pose1, pose2)
     elif method == 'euclidean':
         return euclidean_distance(pose1, pose2)
     elif method == 'cosine':
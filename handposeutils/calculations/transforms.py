@@ -1,9 +1,122 @@
 # transforms.py
+# Every transform works on anything exposing an `.array` of shape (..., 21, 3) -- a single
+# HandPose, or a HandPoseBatch or HandPoseSequence where the same operation is applied to
+# each pose -- as well as on a raw ndarray of that shape.
+#
+# By default a transform leaves its input untouched and returns a new pose (or array) built
+# with one vectorized operation, so shared template poses can be used from several threads.
+# Pass `inplace=True` to modify the input instead, or `out=` to write into a preallocated
+# pose/array of the same shape.
 from __future__ import annotations
 import math
 from typing import Literal
+import numpy as np
+from handposeutils.calculations.geometry import get_palm_frame
 
-def normalize_handpose_positioning(pose: "HandPose") -> "HandPose":
+_AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2}
+
+def _axis_rotation_matrix(degrees: float, axis: Literal['x', 'y', 'z']) -> np.ndarray:
+    """Return the 3x3 matrix rotating points by `degrees` around the given coordinate axis."""
+    if axis not in _AXIS_INDEX:
+        raise ValueError("Axis must be 'x', 'y', or 'z'")
+    radians = math.radians(degrees)
+    cos_a = math.cos(radians)
+    sin_a = math.sin(radians)
+
+    if axis == 'x':
+        return np.array([[1, 0, 0], [0, cos_a, -sin_a], [0, sin_a, cos_a]])
+    elif axis == 'y':
+        return np.array([[cos_a, 0, sin_a], [0, 1, 0], [-sin_a, 0, cos_a]])
+    return np.array([[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]])
+
+def quaternion_to_matrix(quaternion) -> np.ndarray:
+    """
+    Convert quaternions to rotation matrices.
+
+    Parameters
+    ----------
+    quaternion : array-like of shape (..., 4)
+        Quaternions in (w, x, y, z) order. They are normalized first, so any non-zero
+        quaternion is accepted.
+
+    Returns
+    -------
+    np.ndarray
+        Rotation matrices of shape (..., 3, 3), acting on column vectors.
+    """
+    q = np.asarray(quaternion, dtype=np.float64)
+    if q.shape[-1:] != (4,):
+        raise ValueError(f"Expected quaternions of shape (..., 4), got {q.shape}")
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    matrices = np.empty(q.shape[:-1] + (3, 3))
+    matrices[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    matrices[..., 0, 1] = 2 * (x * y - z * w)
+    matrices[..., 0, 2] = 2 * (x * z + y * w)
+    matrices[..., 1, 0] = 2 * (x * y + z * w)
+    matrices[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    matrices[..., 1, 2] = 2 * (y * z - x * w)
+    matrices[..., 2, 0] = 2 * (x * z - y * w)
+    matrices[..., 2, 1] = 2 * (y * z + x * w)
+    matrices[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return matrices
+
+def axis_angle_to_matrix(axis, degrees) -> np.ndarray:
+    """
+    Convert rotations about arbitrary axes to rotation matrices.
+
+    Parameters
+    ----------
+    axis : array-like of shape (..., 3)
+        Rotation axes; they need not be unit length.
+    degrees : float or array-like of shape (...)
+        Rotation angles in degrees, counter-clockwise when looking down the axis.
+
+    Returns
+    -------
+    np.ndarray
+        Rotation matrices of shape (..., 3, 3), acting on column vectors.
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    if axis.shape[-1:] != (3,):
+        raise ValueError(f"Expected axes of shape (..., 3), got {axis.shape}")
+    axis = axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+    half = np.radians(np.asarray(degrees, dtype=np.float64))[..., None] / 2
+    axis, half = np.broadcast_arrays(axis, half)
+    return quaternion_to_matrix(np.concatenate([np.cos(half[..., :1]), axis * np.sin(half)], axis=-1))
+
+def _points_of(pose) -> np.ndarray:
+    """Return the (..., 21, 3) array behind a pose, batch, or raw array."""
+    if isinstance(pose, np.ndarray):
+        return pose
+    return pose.array
+
+def _destination(pose, inplace: bool, out):
+    """
+    Resolve where a transform writes its result.
+
+    Returns
+    -------
+    result : HandPose, HandPoseBatch or np.ndarray
+        The object the transform returns.
+    dest : np.ndarray
+        The array to write into (the input's own array when `inplace` is True).
+    """
+    src = _points_of(pose)
+    if inplace:
+        if out is not None:
+            raise ValueError("Pass either inplace=True or out=, not both.")
+        return pose, src
+    if out is None:
+        dest = np.empty(src.shape, dtype=np.float64)
+        result = dest if isinstance(pose, np.ndarray) else pose._with_array(dest)
+        return result, dest
+    dest = _points_of(out)
+    if dest.shape != src.shape:
+        raise ValueError(f"out has shape {dest.shape}, expected {src.shape}")
+    return out, dest
+
+def normalize_handpose_positioning(pose: "HandPose", inplace: bool = False, out=None) -> "HandPose":
     """
     Translates a hand pose so that its centroid is at the origin.
 
@@ -12,26 +125,24 @@ def normalize_handpose_positioning(pose: "HandPose") -> "HandPose":
 
     Parameters
     ----------
-    pose : HandPose
-        The hand pose to normalize.
+    pose : HandPose, HandPoseBatch or np.ndarray
+        The hand pose (or batch of poses) to normalize.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
 
     Returns
     -------
     HandPose
         The translated hand pose, centered at the origin.
     """
-    coords = pose.get_all_coordinates()
-    center_x = sum(c.x for c in coords) / len(coords)
-    center_y = sum(c.y for c in coords) / len(coords)
-    center_z = sum(c.z for c in coords) / len(coords)
-
-    for coord in coords:
-        coord.x -= center_x
-        coord.y -= center_y
-        coord.z -= center_z
-    return pose
+    src = _points_of(pose)
+    result, dest = _destination(pose, inplace, out)
+    np.subtract(src, src.mean(axis=-2, keepdims=True), out=dest)
+    return result
 
-def normalize_handpose_scaling(pose: "HandPose") -> "HandPose":
+def normalize_handpose_scaling(pose: "HandPose", inplace: bool = False, out=None) -> "HandPose":
     """
     Scales a hand pose to fit within a [-1, 1] cube across all axes.
 
@@ -40,8 +151,12 @@ def normalize_handpose_scaling(pose: "HandPose") -> "HandPose":
 
     Parameters
     ----------
-    pose : HandPose
-        The hand pose to scale.
+    pose : HandPose, HandPoseBatch or np.ndarray
+        The hand pose (or batch of poses) to scale.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
 
     Returns
     -------
@@ -53,29 +168,25 @@ def normalize_handpose_scaling(pose: "HandPose") -> "HandPose":
     - If the maximum range is zero (all points are identical),
       the pose is returned unchanged.
     """
-    coords = pose.get_all_coordinates()
-    min_x = min(c.x for c in coords)
-    max_x = max(c.x for c in coords)
-    min_y = min(c.y for c in coords)
-    max_y = max(c.y for c in coords)
-    min_z = min(c.z for c in coords)
-    max_z = max(c.z for c in coords)
-
-    range_x = max_x - min_x
-    range_y = max_y - min_y
-    range_z = max_z - min_z
-    max_range = max(range_x, range_y, range_z)
-
-    if max_range == 0:
-        return pose
-
-    for coord in coords:
-        coord.x = (coord.x - min_x) / max_range * 2 - 1
-        coord.y = (coord.y - min_y) / max_range * 2 - 1
-        coord.z = (coord.z - min_z) / max_range * 2 - 1
-    return pose
-
-def normalize_handpose(pose: "HandPose") -> "HandPose":
+    src = _points_of(pose)
+    result, dest = _destination(pose, inplace, out)
+    mins = src.min(axis=-2, keepdims=True)
+    max_range = (src.max(axis=-2, keepdims=True) - mins).max(axis=-1, keepdims=True)
+
+    # Poses whose points are all identical are left unchanged
+    flat = max_range == 0
+    if flat.all():
+        dest[...] = src
+        return result
+    mins = np.where(flat, -1.0, mins)
+    max_range = np.where(flat, 2.0, max_range)
+
+    np.subtract(src, mins, out=dest)
+    dest *= 2 / max_range
+    dest -= 1
+    return result
+
+def normalize_handpose(pose: "HandPose", inplace: bool = False, out=None) -> "HandPose":
     """
     Normalizes a hand pose's position and scale.
 
@@ -85,8 +196,12 @@ def normalize_handpose(pose: "HandPose") -> "HandPose":
 
     Parameters
     ----------
-    pose : HandPose
-        The hand pose to normalize.
+    pose : HandPose, HandPoseBatch or np.ndarray
+        The hand pose (or batch of poses) to normalize.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
 
     Returns
     -------
@@ -98,20 +213,26 @@ def normalize_handpose(pose: "HandPose") -> "HandPose":
     normalize_handpose_positioning()
     normalize_handpose_scaling()
     """
-    pose = normalize_handpose_positioning(pose)
-    pose = normalize_handpose_scaling(pose)
-    return pose
+    # The second step runs in place on the first step's result, which is already a fresh
+    # pose unless the caller asked for inplace/out
+    pose = normalize_handpose_positioning(pose, inplace=inplace, out=out)
+    return normalize_handpose_scaling(pose, inplace=True)
 
-def mirror_pose(pose: "HandPose", axis: Literal['x', 'y', 'z'] = 'x') -> "HandPose":
+def mirror_pose(pose: "HandPose", axis: Literal['x', 'y', 'z'] = 'x', inplace: bool = False,
+                out=None) -> "HandPose":
     """
     Mirrors a hand pose across the specified axis.
 
     Parameters
     ----------
-    pose : HandPose
-        The hand pose to mirror.
+    pose : HandPose, HandPoseBatch or np.ndarray
+        The hand pose (or batch of poses) to mirror.
     axis : {'x', 'y', 'z'}, default='x'
         Axis to mirror around.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
 
     Returns
     -------
@@ -123,30 +244,33 @@ def mirror_pose(pose: "HandPose", axis: Literal['x', 'y', 'z'] = 'x') -> "HandPo
     ValueError
         If the axis is not 'x', 'y', or 'z'.
     """
-    coords = pose.get_all_coordinates()
-    for coord in coords:
-        if axis == 'x':
-            coord.x = -coord.x
-        elif axis == 'y':
-            coord.y = -coord.y
-        elif axis == 'z':
-            coord.z = -coord.z
-        else:
-            raise ValueError("Axis must be 'x', 'y', or 'z'")
-    return pose
-
-def rotate_pose_by_axis(pose: "HandPose", degrees: float, axis: Literal['x', 'y', 'z']) -> "HandPose":
+    if axis not in _AXIS_INDEX:
+        raise ValueError("Axis must be 'x', 'y', or 'z'")
+    signs = np.ones(3)
+    signs[_AXIS_INDEX[axis]] = -1
+
+    src = _points_of(pose)
+    result, dest = _destination(pose, inplace, out)
+    np.multiply(src, signs, out=dest)
+    return result
+
+def rotate_pose_by_axis(pose: "HandPose", degrees: float, axis: Literal['x', 'y', 'z'], inplace: bool = False,
+                        out=None) -> "HandPose":
     """
     Rotates a hand pose by a given angle around a specified axis.
 
     Parameters
     ----------
-    pose : HandPose
-        The hand pose to rotate.
+    pose : HandPose, HandPoseBatch or np.ndarray
+        The hand pose (or batch of poses) to rotate.
     degrees : float
         Rotation angle in degrees.
     axis : {'x', 'y', 'z'}
         Axis around which to rotate.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
 
     Returns
     -------
@@ -158,27 +282,242 @@ def rotate_pose_by_axis(pose: "HandPose", degrees: float, axis: Literal['x', 'y'
     ValueError
         If the axis is not 'x', 'y', or 'z'.
     """
-    radians = math.radians(degrees)
-    cos_a = math.cos(radians)
-    sin_a = math.sin(radians)
-    coords = pose.get_all_coordinates()
-
-    for c in coords:
-        x, y, z = c.x, c.y, c.z
-        if axis == 'x':
-            c.y = y * cos_a - z * sin_a
-            c.z = y * sin_a + z * cos_a
-        elif axis == 'y':
-            c.x = x * cos_a + z * sin_a
-            c.z = -x * sin_a + z * cos_a
-        elif axis == 'z':
-            c.x = x * cos_a - y * sin_a
-            c.y = x * sin_a + y * cos_a
-        else:
-            raise ValueError("Axis must be 'x', 'y', or 'z'")
-    return pose
+    rotation = _axis_rotation_matrix(degrees, axis)
+    src = _points_of(pose)
+    result, dest = _destination(pose, inplace, out)
+    np.matmul(src, rotation.T, out=dest)
+    return result
+
+def rotate_pose_by_matrix(pose, matrix, inplace: bool = False, out=None):
+    """
+    Rotates a hand pose (or every pose of a batch or sequence) by 3x3 matrices about the origin.
+
+    Parameters
+    ----------
+    pose : HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The pose(s) to rotate.
+    matrix : array-like of shape (3, 3) or (N, 3, 3)
+        Rotation matrices acting on column vectors. A single matrix is applied to every
+        pose; a stack of N matrices applies matrix i to pose i of a batch or sequence of N.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
+
+    Returns
+    -------
+    HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The rotated pose(s), of the same kind as `pose`.
+
+    Raises
+    ------
+    ValueError
+        If `matrix` is not (3, 3) or does not have one matrix per pose.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if matrix.shape[-2:] != (3, 3):
+        raise ValueError(f"Expected rotation matrices of shape (3, 3) or (N, 3, 3), got {matrix.shape}")
+
+    src = _points_of(pose)
+    if matrix.ndim > 2 and matrix.shape[:-2] != src.shape[:-2]:
+        raise ValueError(f"Got {matrix.shape[:-2]} rotations for poses of shape {src.shape}")
+    result, dest = _destination(pose, inplace, out)
+    # One 3x3 product per pose, broadcast over the batch; matmul cannot write over its own input
+    if np.shares_memory(src, dest):
+        dest[...] = np.matmul(src, np.swapaxes(matrix, -1, -2))
+    else:
+        np.matmul(src, np.swapaxes(matrix, -1, -2), out=dest)
+    return result
+
+def rotate_pose_by_axis_angle(pose, axis, degrees, inplace: bool = False, out=None):
+    """
+    Rotates a hand pose (or every pose of a batch or sequence) about an arbitrary axis through the origin.
+
+    Parameters
+    ----------
+    pose : HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The pose(s) to rotate.
+    axis : array-like of shape (3,) or (N, 3)
+        Rotation axis, shared by all poses or one per pose. Need not be unit length.
+    degrees : float or array-like of shape (N,)
+        Rotation angle in degrees, shared or one per pose.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
+
+    Returns
+    -------
+    HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The rotated pose(s), of the same kind as `pose`.
+
+    See Also
+    --------
+    rotate_pose_by_axis : Rotation about the x, y or z axis.
+    axis_angle_to_matrix
+    """
+    return rotate_pose_by_matrix(pose, axis_angle_to_matrix(axis, degrees), inplace=inplace, out=out)
+
+def rotate_pose_by_quaternion(pose, quaternion, inplace: bool = False, out=None):
+    """
+    Rotates a hand pose (or every pose of a batch or sequence) by quaternions about the origin.
+
+    Parameters
+    ----------
+    pose : HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The pose(s) to rotate.
+    quaternion : array-like of shape (4,) or (N, 4)
+        Rotation in (w, x, y, z) order, shared by all poses or one per pose.
+        Quaternions are normalized before use.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
+
+    Returns
+    -------
+    HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The rotated pose(s), of the same kind as `pose`.
+
+    See Also
+    --------
+    quaternion_to_matrix
+    """
+    return rotate_pose_by_matrix(pose, quaternion_to_matrix(quaternion), inplace=inplace, out=out)
+
+def _canonicalize_points(src: np.ndarray, left: np.ndarray, dest: np.ndarray):
+    """Write `src` (mirrored where `left`) into `dest`, expressed in each pose's palm frame."""
+    points = np.where(left[..., None, None], src * np.array([-1.0, 1.0, 1.0]), src) if left.any() else src
+    frame = get_palm_frame(points)
+    dest[...] = np.matmul(points - points[..., :1, :], np.swapaxes(frame, -1, -2))
+
+def canonicalize(pose, mirror_left: bool = False, inplace: bool = False, out=None):
+    """
+    Moves a hand pose (or every pose of a batch or sequence) into its canonical palm frame.
+
+    The wrist is translated to the origin and the pose is rotated so that the palm frame
+    from `geometry.get_palm_frame` lines up with the coordinate axes: the wrist-to-middle-MCP
+    direction becomes +y and the palm normal becomes +z. Canonical poses can be compared
+    directly, without solving for a rotation per pair of poses.
+
+    Parameters
+    ----------
+    pose : HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The pose(s) to canonicalize.
+    mirror_left : bool, default=False
+        Mirror left hands across x before aligning them, so they line up with right hands.
+        Mirrored poses have their side set to 'right_hand'. Needs side information, so it
+        is not available for raw arrays.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
+
+    Returns
+    -------
+    HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The canonicalized pose(s), of the same kind as `pose`.
 
-def straighten_finger(pose, finger: str) -> "HandPose":
+    Raises
+    ------
+    ValueError
+        If `mirror_left` is requested for a raw array.
+
+    See Also
+    --------
+    handposeutils.calculations.geometry.get_palm_frame
+    """
+    src = _points_of(pose)
+    if not mirror_left:
+        left = np.zeros(src.shape[:-2], dtype=bool)
+    elif isinstance(pose, np.ndarray):
+        raise ValueError("mirror_left needs side information; pass a HandPose, HandPoseBatch or HandPoseSequence.")
+    else:
+        sides = pose.sides if hasattr(pose, "sides") else np.array(pose.side, dtype=object)
+        left = np.asarray(sides == "left_hand", dtype=bool)
+
+    result, dest = _destination(pose, inplace, out)
+    _canonicalize_points(src, left, dest)
+    if left.any() and hasattr(result, "sides"):
+        result.sides[left] = "right_hand"
+    elif left.any() and hasattr(result, "side"):
+        result.side = "right_hand"
+    return result
+
+def _finger_indices(fingers) -> np.ndarray:
+    """Return the (F, J) landmark indices of the named fingers (all fingers when None)."""
+    from handposeutils.data.constants import FINGER_MAPPING
+    if fingers is None:
+        fingers = list(FINGER_MAPPING)
+    elif isinstance(fingers, str):
+        fingers = [fingers]
+    indices = []
+    for finger in fingers:
+        joints = FINGER_MAPPING.get(finger.upper())
+        if not joints or len(joints) < 2:
+            raise ValueError(f"Invalid or too-short finger: {finger}")
+        indices.append(list(joints))
+    return np.array(indices, dtype=np.intp).reshape(len(indices), -1)
+
+def straighten_fingers(pose, fingers=None, inplace: bool = False, out=None):
+    """
+    Straightens several fingers at once so that each finger's joints align in a straight line.
+
+    Every finger is laid out along its own base direction (from the base joint towards the
+    first joint that does not coincide with it), with each joint placed at its cumulative
+    segment length from the base, so original segment lengths are preserved. All requested
+    fingers of all poses are handled in one vectorized pass.
+
+    Parameters
+    ----------
+    pose : HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The hand pose(s) containing the fingers to straighten.
+    fingers : str or iterable of str, optional
+        Finger names to straighten, matching keys of
+        `handposeutils.data.constants.FINGER_MAPPING`. Defaults to all five fingers.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
+
+    Returns
+    -------
+    HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+        The pose(s) with the fingers straightened, of the same kind as `pose`.
+
+    Raises
+    ------
+    ValueError
+        If a finger name is invalid or has fewer than two joints.
+
+    Notes
+    -----
+    - A finger whose joints all coincide has no direction and is left where it is.
+    """
+    indices = _finger_indices(fingers)
+
+    src = _points_of(pose)
+    result, dest = _destination(pose, inplace, out)
+    joints = src[..., indices, :]  # (..., F, J, 3)
+
+    # Segment vectors and their cumulative lengths from the base joint
+    segments = np.diff(joints, axis=-2)
+    segment_lengths = np.linalg.norm(segments, axis=-1)
+    cumulative = np.concatenate([np.zeros_like(segment_lengths[..., :1]),
+                                 np.cumsum(segment_lengths, axis=-1)], axis=-1)
+
+    # Base direction: the first segment of non-zero length (zero if the whole finger is collapsed)
+    first = np.argmax(segment_lengths > 1e-12, axis=-1)[..., None, None]
+    direction = np.take_along_axis(segments, first, axis=-2)
+    norm = np.take_along_axis(segment_lengths[..., None], first, axis=-2)
+    direction = np.divide(direction, norm, out=np.zeros_like(direction), where=norm > 1e-12)
+
+    if dest is not src:
+        dest[...] = src
+    dest[..., indices, :] = joints[..., :1, :] + direction * cumulative[..., None]
+    return result
+
+def straighten_finger(pose, finger: str, inplace: bool = False, out=None) -> "HandPose":
     """
     Straightens a specified finger so that its joints align in a straight line.
 
@@ -188,53 +527,228 @@ def straighten_finger(pose, finger: str) -> "HandPose":
 
     Parameters
     ----------
-    pose : HandPose
-        The hand pose containing the finger to straighten.
+    pose : HandPose, HandPoseBatch or np.ndarray
+        The hand pose (or batch of poses) containing the finger to straighten.
     finger : str
         Finger name to straighten. Must match a key in
         `handposeutils.data.constants.FINGER_MAPPING`.
+    inplace : bool, default=False
+        Modify `pose` itself instead of returning a new pose.
+    out : HandPose, HandPoseBatch or np.ndarray, optional
+        Preallocated pose/array of the same shape to write the result into.
 
     Returns
     -------
     HandPose
-        The modified hand pose with the finger straightened.
+        The hand pose with the finger straightened.
 
     Raises
     ------
     ValueError
         If the finger name is invalid or has fewer than two joints.
+
+    See Also
+    --------
+    straighten_fingers : Straighten several fingers in one pass.
     """
-    from handposeutils.data.constants import FINGER_MAPPING
-    indices = FINGER_MAPPING.get(finger.upper())
-    if not indices or len(indices) < 2:
-        raise ValueError(f"Invalid or too-short finger: {finger}")
-
-    # Base and first joint determine direction
-    base = pose.get_coordinate_by_index(indices[0])
-    next_joint = pose.get_coordinate_by_index(indices[1])
-    direction = (next_joint - base).normalize()
-
-    # Step 1: Compute distances between each consecutive point
-    segment_lengths = []
-    total_length = 0.0
-    for i in range(1, len(indices)):
-        prev_coord = pose.get_coordinate_by_index(indices[i - 1])
-        curr_coord = pose.get_coordinate_by_index(indices[i])
-        dist = (curr_coord - prev_coord).magnitude()
-        segment_lengths.append(dist)
-        total_length += dist
-
-    # Step 2: Compute cumulative percentage position of each joint
-    cumulative = 0.0
-    new_positions = [base]
-    for length in segment_lengths:
-        cumulative += length
-        ratio = cumulative / total_length
-        new_coord = base + direction.scale(total_length * ratio)
-        new_positions.append(new_coord)
-
-    # Step 3: Update coordinates
-    for i in range(len(indices)):
-        pose.points[indices[i]]["coordinate"] = new_positions[i]
-
-    return pose
\ No newline at end of file
+    return straighten_fingers(pose, [finger], inplace=inplace, out=out)
+
+class TransformPipeline:
+    """
+    A chain of pose transforms that is compiled and applied in a single pass.
+
+    Steps are recorded with the chainable methods below and run in the order they were
+    added. Consecutive affine steps (translate, rotate, scale, mirror, affine) are folded
+    into one 4x4 homogeneous matrix. Data-dependent steps are evaluated per pose inside the
+    same pass: `center` is derived from each pose's original centroid without touching its
+    landmarks, while `normalize_scale` needs the transformed extents and so costs one extra
+    matrix multiply at that point in the chain.
+
+    Example
+    -------
+    >>> pipeline = TransformPipeline().center().rotate(30, 'x').rotate(10, 'z').mirror('x')
+    >>> new_pose = pipeline.apply(pose)            # HandPose -> HandPose
+    >>> new_batch = pipeline.apply(batch)          # HandPoseBatch -> HandPoseBatch
+    >>> points = pipeline.apply(array)             # (N, 21, 3) ndarray -> ndarray
+
+    See Also
+    --------
+    normalize_handpose_positioning
+    normalize_handpose_scaling
+    """
+
+    def __init__(self):
+        self._steps = []  # ("affine", 4x4 matrix) | ("center", None) | ("normalize_scale", None)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __repr__(self) -> str:
+        return f"TransformPipeline({', '.join(kind for kind, _ in self._steps)})"
+
+    # --- Recording steps ---
+
+    def affine(self, matrix: np.ndarray) -> "TransformPipeline":
+        """
+        Append an arbitrary affine step.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            A 3x3 linear map or a 4x4 homogeneous matrix, applied to column vectors.
+
+        Returns
+        -------
+        TransformPipeline
+            This pipeline, for chaining.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.shape == (3, 3):
+            homogeneous = np.eye(4)
+            homogeneous[:3, :3] = matrix
+            matrix = homogeneous
+        elif matrix.shape != (4, 4):
+            raise ValueError(f"Expected a 3x3 or 4x4 matrix, got shape {matrix.shape}")
+        self._steps.append(("affine", matrix))
+        return self
+
+    def translate(self, offset) -> "TransformPipeline":
+        """Append a translation by the (x, y, z) vector `offset`."""
+        matrix = np.eye(4)
+        matrix[:3, 3] = np.asarray(offset, dtype=np.float64)
+        return self.affine(matrix)
+
+    def rotate(self, degrees: float, axis: Literal['x', 'y', 'z'] = 'z') -> "TransformPipeline":
+        """Append a rotation by `degrees` around a coordinate axis, as in `rotate_pose_by_axis`."""
+        return self.affine(_axis_rotation_matrix(degrees, axis))
+
+    def rotate_axis_angle(self, axis, degrees: float) -> "TransformPipeline":
+        """Append a rotation by `degrees` around an arbitrary (x, y, z) axis, as in `rotate_pose_by_axis_angle`."""
+        return self.affine(axis_angle_to_matrix(axis, degrees))
+
+    def rotate_quaternion(self, quaternion) -> "TransformPipeline":
+        """Append a rotation by a (w, x, y, z) quaternion, as in `rotate_pose_by_quaternion`."""
+        return self.affine(quaternion_to_matrix(quaternion))
+
+    def scale(self, factor) -> "TransformPipeline":
+        """Append a scaling about the origin, uniform (float) or per axis ((sx, sy, sz))."""
+        return self.affine(np.diag(np.broadcast_to(np.asarray(factor, dtype=np.float64), (3,))))
+
+    def mirror(self, axis: Literal['x', 'y', 'z'] = 'x') -> "TransformPipeline":
+        """Append a mirror across a coordinate axis, as in `mirror_pose`."""
+        if axis not in _AXIS_INDEX:
+            raise ValueError("Axis must be 'x', 'y', or 'z'")
+        signs = np.ones(3)
+        signs[_AXIS_INDEX[axis]] = -1
+        return self.affine(np.diag(signs))
+
+    def center(self) -> "TransformPipeline":
+        """Append a per-pose translation of the centroid to the origin, as in `normalize_handpose_positioning`."""
+        self._steps.append(("center", None))
+        return self
+
+    def normalize_scale(self) -> "TransformPipeline":
+        """Append a per-pose fit into the [-1, 1] cube, as in `normalize_handpose_scaling`."""
+        self._steps.append(("normalize_scale", None))
+        return self
+
+    def normalize(self) -> "TransformPipeline":
+        """Append `center` followed by `normalize_scale`, as in `normalize_handpose`."""
+        return self.center().normalize_scale()
+
+    # --- Compiling and applying ---
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        The single 4x4 homogeneous matrix equivalent to the whole pipeline.
+
+        Raises
+        ------
+        ValueError
+            If the pipeline contains per-pose steps, which have no single matrix.
+        """
+        composed = np.eye(4)
+        for kind, matrix in self._steps:
+            if kind != "affine":
+                raise ValueError(f"Pipeline contains a per-pose '{kind}' step and has no single matrix.")
+            composed = matrix @ composed
+        return composed
+
+    def _compile(self, src: np.ndarray):
+        """
+        Fold every step into one linear part and one translation per pose.
+
+        Parameters
+        ----------
+        src : np.ndarray
+            Points of shape (N, 21, 3).
+
+        Returns
+        -------
+        linear : np.ndarray
+            Shape (3, 3), or (N, 3, 3) once a per-pose scale has been folded in.
+        translation : np.ndarray
+            Shape (N, 3).
+        """
+        linear = np.eye(3)
+        translation = np.zeros((src.shape[0], 3))
+        centroids = None
+
+        for kind, matrix in self._steps:
+            if kind == "affine":
+                linear = matrix[:3, :3] @ linear
+                translation = translation @ matrix[:3, :3].T + matrix[:3, 3]
+            elif kind == "center":
+                # Affine maps preserve centroids, so the transformed centroid is the original
+                # one pushed through the current map; only the translation changes.
+                if centroids is None:
+                    centroids = src.mean(axis=-2)
+                translation = -np.einsum('...ij,...j->...i', linear, centroids)
+            else:
+                current = src @ np.swapaxes(linear, -1, -2) + translation[:, None, :]
+                mins = current.min(axis=-2)
+                max_range = (current.max(axis=-2) - mins).max(axis=-1, keepdims=True)
+                flat = max_range == 0
+                mins = np.where(flat, -1.0, mins)
+                factor = 2 / np.where(flat, 2.0, max_range)
+                linear = factor[:, :, None] * linear
+                translation = factor * (translation - mins) - 1
+        return linear, translation
+
+    def apply(self, pose, inplace: bool = False, out=None):
+        """
+        Run the pipeline on a pose, batch, sequence or raw array.
+
+        Parameters
+        ----------
+        pose : HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+            What to transform. Arrays may have shape (21, 3) or (N, 21, 3).
+        inplace : bool, default=False
+            Modify `pose` itself instead of returning a new object.
+        out : HandPose, HandPoseBatch or np.ndarray, optional
+            Preallocated pose/array of the same shape to write the result into.
+
+        Returns
+        -------
+        HandPose, HandPoseBatch, HandPoseSequence or np.ndarray
+            The transformed object, of the same kind as `pose`.
+        """
+
+        src = _points_of(pose)
+        result, dest = _destination(pose, inplace, out)
+        flat_src = src.reshape(-1, 21, 3)
+        linear, translation = self._compile(flat_src)
+
+        flat_dest = dest.reshape(-1, 21, 3)
+        if not np.shares_memory(flat_dest, dest):
+            # A non-contiguous destination cannot be reshaped in place; compute, then copy in
+            flat_dest = np.empty(flat_src.shape)
+        linear_t = linear.T if linear.ndim == 2 else linear.transpose(0, 2, 1)
+        np.matmul(flat_src, linear_t, out=flat_dest)
+        flat_dest += translation[:, None, :]
+        if not np.shares_memory(flat_dest, dest):
+            dest[...] = flat_dest.reshape(dest.shape)
+        return result
+
+    __call__ = apply
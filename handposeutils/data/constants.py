@@ -13,4 +13,14 @@ FINGER_MAPPING = {
     "MIDDLE": range(9, 13),
     "RING": range(13, 17),
     "PINKY": range(17, 21)
-}
\ No newline at end of file
+}
+
+# Lookup tables derived from the two above, computed once and shared by every HandPose
+POINT_INDEX_BY_NAME = {name: i for i, name in enumerate(POINTS_NAMES_LIST)}
+
+FINGER_BY_INDEX = tuple(
+    next((fname for fname, idxs in FINGER_MAPPING.items() if i in idxs), "PALM")
+    for i in range(len(POINTS_NAMES_LIST))
+)
+
+FINGER_SLICES = {fname: slice(idxs.start, idxs.stop) for fname, idxs in FINGER_MAPPING.items()}
\ No newline at end of file
@@ -1,33 +1,193 @@
-from dataclasses import dataclass
 import math
+import numpy as np
+
 
-@dataclass
 class Coordinate:
-    x: float
-    y: float
-    z: float
+    """
+    A single 3D landmark position.
+
+    A Coordinate created directly stores its position as three plain floats. The
+    coordinates of a `HandPose` are `CoordinateView`s instead, which read and write one
+    row of the pose's (21, 3) array, so writing to `x`, `y` or `z` moves the landmark.
+
+    The class uses `__slots__`, so an instance holds nothing but its three floats. The
+    operators (`-`, `+`, `scale`, `normalize`) return new Coordinates; the `i`-prefixed
+    variants (`isub`, `iadd`, `iscale`, `inormalize`) and `-=` / `+=` update the
+    coordinate in place instead, which also moves the landmark when it is a pose view.
+    Coordinates work with NumPy: `np.asarray(coordinate)` gives a (3,) float64 array
+    (the pose row itself, without copying, for a view).
+
+    Parameters
+    ----------
+    x, y, z : float
+        Position of the point.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: float, y: float, z: float):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def view(cls, row: np.ndarray) -> "CoordinateView":
+        """
+        Wrap an existing (3,) float64 array without copying it.
+
+        Parameters
+        ----------
+        row : np.ndarray
+            Array of shape (3,), typically one row of a pose array.
+
+        Returns
+        -------
+        CoordinateView
+            A Coordinate whose x, y, z read and write `row`.
+        """
+        return CoordinateView(row)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array((self.x, self.y, self.z), dtype=dtype if dtype is not None else np.float64)
+
+    def copy(self) -> "Coordinate":
+        """Return an independent Coordinate, detached from any pose array."""
+        return Coordinate(self.x, self.y, self.z)
 
     def __sub__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x - other.x, self.y - other.y, self.z - other.z)
+        ox, oy, oz = _components(other)
+        return Coordinate(self.x - ox, self.y - oy, self.z - oz)
 
     def __add__(self, other: "Coordinate") -> "Coordinate":
-        return Coordinate(self.x + other.x, self.y + other.y, self.z + other.z)
+        ox, oy, oz = _components(other)
+        return Coordinate(self.x + ox, self.y + oy, self.z + oz)
+
+    def isub(self, other: "Coordinate") -> "Coordinate":
+        """Subtract `other` from this coordinate in place and return it."""
+        ox, oy, oz = _components(other)
+        self.x -= ox
+        self.y -= oy
+        self.z -= oz
+        return self
+
+    def iadd(self, other: "Coordinate") -> "Coordinate":
+        """Add `other` to this coordinate in place and return it."""
+        ox, oy, oz = _components(other)
+        self.x += ox
+        self.y += oy
+        self.z += oz
+        return self
+
+    def __isub__(self, other: "Coordinate") -> "Coordinate":
+        return self.isub(other)
+
+    def __iadd__(self, other: "Coordinate") -> "Coordinate":
+        return self.iadd(other)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Coordinate):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
 
     def scale(self, scalar: float) -> "Coordinate":
         return Coordinate(self.x * scalar, self.y * scalar, self.z * scalar)
 
+    def iscale(self, scalar: float) -> "Coordinate":
+        """Multiply this coordinate by `scalar` in place and return it."""
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+
     def magnitude(self) -> float:
-        return math.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+        x, y, z = self.as_tuple()
+        return math.sqrt(x ** 2 + y ** 2 + z ** 2)
 
     def normalize(self) -> "Coordinate":
         # technically a vector, but oopsie
+        return self.copy().inormalize()
+
+    def inormalize(self) -> "Coordinate":
+        """Scale this coordinate to unit length in place (zero stays zero) and return it."""
         mag = self.magnitude()
-        if mag == 0:
-            return Coordinate(0, 0, 0)
-        return Coordinate(self.x / mag, self.y / mag, self.z / mag)
+        return self.iscale(0.0 if mag == 0 else 1.0 / mag)
 
     def as_tuple(self) -> tuple:
         return (self.x, self.y, self.z)
 
     def __repr__(self) -> str:
         return f"Coordinate(x={self.x:.3f}, y={self.y:.3f}, z={self.z:.3f})"
+
+
+class CoordinateView(Coordinate):
+    """
+    A Coordinate that reads and writes one (3,) row of an array owned by someone else,
+    e.g. the (21, 3) array backing a `HandPose`. Create them with `Coordinate.view`.
+
+    In-place operations write straight through to the row, using NumPy.
+
+    Parameters
+    ----------
+    row : np.ndarray
+        Array of shape (3,) to wrap, without copying.
+    """
+
+    __slots__ = ("_row",)
+
+    def __init__(self, row: np.ndarray):
+        self._row = row
+
+    @property
+    def x(self) -> float:
+        return float(self._row[0])
+
+    @x.setter
+    def x(self, value: float):
+        self._row[0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._row[1])
+
+    @y.setter
+    def y(self, value: float):
+        self._row[1] = value
+
+    @property
+    def z(self) -> float:
+        return float(self._row[2])
+
+    @z.setter
+    def z(self, value: float):
+        self._row[2] = value
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        if copy:
+            return np.array(self._row, dtype=dtype)
+        return np.asarray(self._row, dtype=dtype)
+
+    def isub(self, other: "Coordinate") -> "CoordinateView":
+        """Subtract `other` from the row in place and return this view."""
+        self._row -= np.asarray(other, dtype=np.float64)
+        return self
+
+    def iadd(self, other: "Coordinate") -> "CoordinateView":
+        """Add `other` to the row in place and return this view."""
+        self._row += np.asarray(other, dtype=np.float64)
+        return self
+
+    def iscale(self, scalar: float) -> "CoordinateView":
+        """Multiply the row by `scalar` in place and return this view."""
+        self._row *= scalar
+        return self
+
+    def as_tuple(self) -> tuple:
+        return tuple(self._row.tolist())
+
+
+def _components(other) -> tuple:
+    """The (x, y, z) floats of a Coordinate or of any array-like of length 3."""
+    if isinstance(other, Coordinate):
+        return other.x, other.y, other.z
+    x, y, z = np.asarray(other, dtype=np.float64).tolist()
+    return x, y, z
@@ -1,10 +1,15 @@
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from .handpose import HandPose
 from .handpose_sequence import HandPoseSequence, TimedHandPose
+from .handpose_batch import HandPoseBatch
 from .coordinate import Coordinate
-from .constants import POINTS_NAMES_LIST, FINGER_MAPPING
-import os, json
+from .constants import POINTS_NAMES_LIST, FINGER_BY_INDEX
+import numpy as np
+import os, json, glob, re, threading
+from collections import deque
 ## The DataReader class for
 # I highkey don't think you'll ever need to convert from OpenPose to HandPoses,
 # but I somehow found myself in a situation where I did.
@@ -12,6 +17,38 @@ import os, json
 # However, json conversions are considered standard format for transfer and storage.
 # Functions are selfexplanatory.
 
+@dataclass
+class FolderLoadResult:
+    """
+    Poses loaded from a folder of per-frame JSON files by `DataReader.load_folder`.
+
+    Rows of every column are in the same deterministic order: files sorted by path,
+    with numbers compared numerically ('frame_2' before 'frame_10'), and the frames of
+    a shard in their order within it.
+
+    Attributes
+    ----------
+    batch : HandPoseBatch
+        Every successfully loaded pose, with its side and name.
+    files : list of str
+        Path of the file each row came from (repeated for every frame of a shard).
+    labels : list of str
+        Subfolder (relative to the loaded folder) each row came from, e.g. a gesture
+        class for 'rock/*.json'-style layouts; '' for files directly in the folder.
+    start_times, end_times : np.ndarray
+        Timing of each row from files saved by `save_frames_to_folder`; NaN where the
+        file has none.
+    errors : list of (str, str)
+        (path, error message) of every file that could not be loaded.
+    """
+    batch: HandPoseBatch
+    files: List[str]
+    labels: List[str]
+    start_times: np.ndarray
+    end_times: np.ndarray
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+
 class DataReader:
     # --- MediaPipe Conversion ---
     @staticmethod
@@ -40,7 +77,7 @@ class DataReader:
         The coordinate system is transformed so y is flipped vertically.
         """
         SCALE = 100  # scale 0–1 coordinates to 0–100 units to make them visible
-        coords = [Coordinate(lm.x * SCALE, (1-lm.y) * SCALE, lm.z * SCALE) for lm in mp_landmarks.landmark]
+        coords = np.array([(lm.x, 1 - lm.y, lm.z) for lm in mp_landmarks.landmark], dtype=np.float64) * SCALE
 
         match str(handedness):
             case "left":
@@ -197,6 +234,7 @@ class DataReader:
             JSON dictionary representing a hand pose, expected format:
             {
                 "side": "right_hand",            # optional, default to 'right_hand'
+                "name": "pose_name",             # optional
                 "landmarks": [
                     {"x": float, "y": float, "z": float},  # 21 landmarks
                     ...
@@ -221,8 +259,10 @@ class DataReader:
         except:
             landmarks = json_data["pose"]["landmarks"]
 
-        coords = [Coordinate(pt["x"], pt["y"], pt["z"]) for pt in landmarks]
-        return HandPose(coords, side)
+        coords = np.array([(pt["x"], pt["y"], pt["z"]) for pt in landmarks], dtype=np.float64)
+        if coords.shape != (21, 3):
+            raise ValueError("Expected 21 coordinates for hand landmarks (MediaPipe format).")
+        return HandPose.from_array(coords, side, json_data.get("name"), copy=False)
 
     @staticmethod
     def export_HandPose_to_json(pose: HandPose) -> Dict:
@@ -261,21 +301,7 @@ class DataReader:
         dict
             JSON-compatible dictionary describing the hand pose.
         """
-        data = {
-            "side": pose.side,
-            "name": pose.name,  # new field
-            "landmarks": []
-        }
-        for i in range(21):
-            coord = pose[i]
-            data["landmarks"].append({
-                "x": coord.x,
-                "y": coord.y,
-                "z": coord.z,
-                "name": POINTS_NAMES_LIST[i],
-                "finger": pose.points[i]["finger"]
-            })
-        return data
+        return _pose_json(pose.array, pose.side, pose.name)
 
     @staticmethod
     def convert_json_to_HandPoseSequence(json_data: Dict[str, Any]) -> HandPoseSequence:
@@ -329,18 +355,25 @@ class DataReader:
         HandPose
         HandPoseSequence
         """
-        sequence = []
-        for item in json_data["sequence"]:
+        items = sorted(json_data["sequence"], key=lambda item: item["start_time"])
+        points = np.empty((len(items), 21, 3), dtype=np.float64)
+        sides, names = [], []
+        for i, item in enumerate(items):
             try:
                 pose = DataReader.convert_json_to_HandPose(item["pose"])
             except:
                 pose = DataReader.convert_json_to_HandPose(item)
-            sequence.append(TimedHandPose(
-                pose=pose,
-                start_time=item["start_time"],
-                end_time=item["end_time"]
-            ))
-        return HandPoseSequence(sequence)
+            points[i] = pose.array
+            sides.append(pose.side)
+            names.append(pose.name)
+        return HandPoseSequence.from_arrays(
+            points,
+            start_times=[item["start_time"] for item in items],
+            end_times=[item["end_time"] for item in items],
+            sides=sides,
+            names=names,
+            copy=False
+        )
 
     @staticmethod
     def convert_HandPoseSequence_to_json(sequence: HandPoseSequence, fps: int = 30) -> Dict:
@@ -385,9 +418,122 @@ class DataReader:
             ]
         }
 
+    # --- JSON Lines Streaming ---
+
+    @staticmethod
+    def iter_sequence_jsonl(path: str) -> Iterator[TimedHandPose]:
+        """
+        Lazily read a JSON Lines sequence file, one frame at a time.
+
+        Each line holds one frame in the format of the items of
+        `convert_HandPoseSequence_to_json` ({"start_time", "end_time", "pose"}), as written
+        by `SequenceJsonlWriter`. Only the current line is held in memory, so processing
+        can start right away, even on multi-hour recordings.
+
+        Parameters
+        ----------
+        path : str
+            File to read.
+
+        Yields
+        ------
+        TimedHandPose
+            The frames, in file order.
+
+        Raises
+        ------
+        ValueError
+            If a complete line is not valid JSON.
+
+        Notes
+        -----
+        Blank lines are skipped. An unterminated last line, as left by a writer that is
+        still running or crashed mid-write, ends the iteration without an error.
+
+        Example
+        -------
+        >>> sequence = HandPoseSequence(list(DataReader.iter_sequence_jsonl("recording.jsonl")))
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.endswith("\n"):
+                    return  # Partially written last line
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise ValueError(f"Invalid JSON on line {line_number} of {path}: {error}") from error
+                yield TimedHandPose(DataReader.convert_json_to_HandPose(item["pose"]),
+                                    item["start_time"], item["end_time"])
+
+    @staticmethod
+    def load_folder(folder_name: str, pattern: str = "*.json", workers: Optional[int] = None,
+                    use_processes: bool = False) -> FolderLoadResult:
+        """
+        Load every matching HandPose JSON file of a folder in parallel.
+
+        Files can hold a HandPose (`export_HandPose_to_json`), a timed frame
+        (`save_frames_to_folder`), or a shard of several timed frames
+        (`save_frames_to_folder` with `frames_per_file`, i.e. the format of
+        `convert_HandPoseSequence_to_json`), which gives one row per frame. Files are read
+        and parsed across a pool of workers, and files that fail to load are reported in
+        `errors` instead of stopping the load.
+
+        Parameters
+        ----------
+        folder_name : str
+            Folder to load from.
+        pattern : str, optional
+            Glob pattern relative to `folder_name` (default '*.json'); '**' matches
+            subfolders, e.g. '*/*.json' for one subfolder per gesture class.
+        workers : int, optional
+            Pool size. Defaults to the executor's default for the machine.
+        use_processes : bool, optional
+            Parse in a process pool instead of a thread pool (default False). JSON parsing
+            holds the GIL, so processes scale better on many cores for large folders.
+
+        Returns
+        -------
+        FolderLoadResult
+            Batch of the loaded poses, with their files, labels, timing and any errors.
+
+        Example
+        -------
+        >>> result = DataReader.load_folder("saved_poses", "*/*.json", workers=8)
+        >>> embeddings = result.batch.normalize().array.reshape(len(result.batch), -1)
+        >>> classes = result.labels
+        """
+        paths = sorted(glob.glob(os.path.join(folder_name, pattern), recursive=True), key=_natural_sort_key)
+        paths = [path for path in paths if os.path.isfile(path)]
+
+        if use_processes:
+            # Send files to worker processes in batches, to save one round trip per file
+            chunksize = max(1, len(paths) // (8 * (workers or os.cpu_count() or 1)))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(_load_pose_file, paths, chunksize=chunksize))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded = list(executor.map(_load_pose_file, paths))
+
+        rows = [(path, frame) for path, frames in zip(paths, loaded) if not isinstance(frames, str)
+                for frame in frames]
+        points = np.empty((len(rows), 21, 3), dtype=np.float64)
+        for i, (_, frame) in enumerate(rows):
+            points[i] = frame[0]
+        return FolderLoadResult(
+            batch=HandPoseBatch.from_array(points, [f[1] for _, f in rows], [f[2] for _, f in rows], copy=False),
+            files=[path for path, _ in rows],
+            labels=[_folder_label(path, folder_name) for path, _ in rows],
+            start_times=np.array([f[3] for _, f in rows], dtype=np.float64),
+            end_times=np.array([f[4] for _, f in rows], dtype=np.float64),
+            errors=[(path, frames) for path, frames in zip(paths, loaded) if isinstance(frames, str)],
+        )
+
     @staticmethod
     def save_frames_to_folder(sequence: HandPoseSequence, folder_name: str, file_prefix: str,
-                              handpose_prefix_name: str, verbose: bool = True):
+                              handpose_prefix_name: str, verbose: bool = True, compact: bool = False,
+                              workers: int = 1, frames_per_file: Optional[int] = None):
         """
         Save each frame of a HandPoseSequence as an individual JSON file.
 
@@ -409,35 +555,352 @@ class DataReader:
         file_prefix : str
             Prefix for filenames, e.g., 'frame' produces files like 'frame_1.json'.
         handpose_prefix_name : str
-            Prefix to assign to HandPose.name for each saved frame.
+            Prefix of the pose name written for each saved frame, e.g. 'rock' gives
+            'rock_1', 'rock_2', ... The sequence itself is not modified.
         verbose : bool, optional
             Whether to print progress messages (default True).
+        compact : bool, optional
+            Write JSON without indentation or spaces (default False), which is smaller
+            and much faster to write.
+        workers : int, optional
+            Number of threads writing files (default 1: write on the calling thread).
+            At most twice this many files are being prepared or written at once.
+        frames_per_file : int, optional
+            Pack frames into shards of this many frames, saved as
+            {file_prefix}_{shard_index}.json in the format of
+            `convert_HandPoseSequence_to_json`, instead of one file per frame. Read them
+            back with `load_folder` (one row per frame) or `convert_json_to_HandPoseSequence`.
 
         Returns
         -------
         None
+
+        Notes
+        -----
+        Every file is first written under a temporary name and then renamed into place,
+        so readers never see a partially written file.
         """
         # Create folder if it doesn't exist
         os.makedirs(folder_name, exist_ok=True)
+        points, start_times, end_times, sides, names = sequence._columns()
+        indent = None if compact else 2
+        separators = (",", ":") if compact else None
 
-        for idx, timed_pose in enumerate(sequence.sequence, start=1):
-            # Give the pose a name
-            timed_pose.pose.name = f"{handpose_prefix_name}_{idx}"
-
-            # Convert to JSON
-            pose_json = DataReader.export_HandPose_to_json(timed_pose.pose)
-
+        def frame_data(i):
             # Include timing info so the saved data is fully reconstructable
-            frame_data = {
-                "start_time": timed_pose.start_time,
-                "end_time": timed_pose.end_time,
-                "pose": pose_json
+            return {
+                "start_time": float(start_times[i]),
+                "end_time": float(end_times[i]),
+                "pose": _pose_json(points[i], sides[i], f"{handpose_prefix_name}_{i + 1}")
             }
 
-            # Save to file
-            file_path = os.path.join(folder_name, f"{file_prefix}_{idx}.json")
-            with open(file_path, 'w') as f:
-                json.dump(frame_data, f, indent=2)
+        def write_file(file_index, rows):
+            if frames_per_file is None:
+                data = frame_data(rows.start)
+            else:
+                data = {"sequence": [frame_data(i) for i in rows]}
+            file_path = os.path.join(folder_name, f"{file_prefix}_{file_index}.json")
+            _write_json_atomic(file_path, data, indent, separators)
+
+        step = frames_per_file or 1
+        files = ((k, range(start, min(start + step, len(points))))
+                 for k, start in enumerate(range(0, len(points), step), start=1))
+        if workers <= 1:
+            for file_index, rows in files:
+                write_file(file_index, rows)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                in_flight = deque()
+                for file_index, rows in files:
+                    if len(in_flight) >= 2 * workers:
+                        in_flight.popleft().result()
+                    in_flight.append(executor.submit(write_file, file_index, rows))
+                for future in in_flight:
+                    future.result()
 
         if verbose:
-            print(f"[DataReader] Saved {len(sequence)} frames to '{folder_name}'")
\ No newline at end of file
+            print(f"[DataReader] Saved {len(points)} frames to '{folder_name}'")
+
+    # --- NumPy Binary Format ---
+
+    @staticmethod
+    def save_sequence_npz(sequence: HandPoseSequence, path: str, compress: bool = False):
+        """
+        Save a HandPoseSequence as typed NumPy arrays in a single .npz file.
+
+        The file holds the arrays 'points' (T, 21, 3) float64, 'start_times' and
+        'end_times' (T,) float64, and 'sides' and 'names' (T,) unicode strings, with
+        missing values stored as empty strings. This is close to the size of the raw
+        coordinates and loads without building per-landmark objects.
+
+        Parameters
+        ----------
+        sequence : HandPoseSequence
+            Sequence to save.
+        path : str
+            Output file path; NumPy appends '.npz' if it is missing.
+        compress : bool, optional
+            Deflate-compress the arrays (smaller, slower to save and load; default False).
+
+        Returns
+        -------
+        None
+        """
+        points, start_times, end_times, sides, names = sequence._columns()
+        savez = np.savez_compressed if compress else np.savez
+        savez(path, points=points, start_times=start_times, end_times=end_times,
+              sides=_labels_to_array(sides), names=_labels_to_array(names))
+
+    @staticmethod
+    def load_sequence_npz(path: str, fps: float = 30) -> HandPoseSequence:
+        """
+        Load a HandPoseSequence saved by `save_sequence_npz`, or a raw .npy pose array.
+
+        Parameters
+        ----------
+        path : str
+            A .npz file written by `save_sequence_npz`, or a .npy file holding a bare
+            (T, 21, 3) array of landmarks.
+        fps : float, optional
+            Frame rate used to time the frames of a raw .npy array (default 30);
+            frame i then starts at i / fps. Ignored for .npz files.
+
+        Returns
+        -------
+        HandPoseSequence
+            Sequence backed directly by the loaded arrays.
+
+        Raises
+        ------
+        ValueError
+            If the file does not hold a (T, 21, 3) landmark array.
+        """
+        data = np.load(path, allow_pickle=False)
+        if isinstance(data, np.ndarray):
+            start_times = np.arange(len(data)) / fps
+            return HandPoseSequence.from_arrays(data, start_times, start_times + 1.0 / fps, copy=False)
+        with data:
+            return HandPoseSequence.from_arrays(
+                data["points"], data["start_times"], data["end_times"],
+                sides=_array_to_labels(data["sides"]), names=_array_to_labels(data["names"]),
+                copy=False
+            )
+
+    @staticmethod
+    def save_HandPose_npz(pose: HandPose, path: str, compress: bool = False):
+        """
+        Save a HandPose as a .npz file with a 'points' (21, 3) array and 'side'/'name' strings.
+
+        Parameters
+        ----------
+        pose : HandPose
+            Pose to save.
+        path : str
+            Output file path; NumPy appends '.npz' if it is missing.
+        compress : bool, optional
+            Deflate-compress the arrays (default False).
+
+        Returns
+        -------
+        None
+        """
+        savez = np.savez_compressed if compress else np.savez
+        savez(path, points=pose.array, side=_labels_to_array([pose.side])[0], name=_labels_to_array([pose.name])[0])
+
+    @staticmethod
+    def load_HandPose_npz(path: str) -> HandPose:
+        """
+        Load a HandPose saved by `save_HandPose_npz`, or a raw (21, 3) .npy array.
+
+        Parameters
+        ----------
+        path : str
+            A .npz file written by `save_HandPose_npz`, or a .npy file holding a bare
+            (21, 3) array of landmarks (loaded with side 'right_hand').
+
+        Returns
+        -------
+        HandPose
+            Pose backed directly by the loaded array.
+        """
+        data = np.load(path, allow_pickle=False)
+        if isinstance(data, np.ndarray):
+            return HandPose.from_array(data, "right_hand", copy=False)
+        with data:
+            side, name = _array_to_labels(np.stack([data["side"], data["name"]]))
+            return HandPose.from_array(data["points"], side, name, copy=False)
+
+    # --- Memory-Mapped Pose Library ---
+
+    @staticmethod
+    def save_pose_library(poses, folder_name: str, chunk_size: int = 65536):
+        """
+        Save a HandPoseSequence or HandPoseBatch as a folder of .npy files that can be
+        memory-mapped with `open_pose_library`.
+
+        The folder holds 'points.npy' (N, 21, 3) float64, sides and names as a table of
+        their distinct values ('side_labels.npy', 'name_labels.npy', unicode, '' for None)
+        plus an (N,) int32 code per pose into it ('side_codes.npy', 'name_codes.npy') and,
+        for sequences, 'start_times.npy' and 'end_times.npy' (N,) float64. Points are
+        copied over in chunks, so a library can be re-saved from another memory-mapped
+        library without loading it.
+
+        Parameters
+        ----------
+        poses : HandPoseSequence or HandPoseBatch
+            Poses to save.
+        folder_name : str
+            Path to the directory to save into (created if missing).
+        chunk_size : int, optional
+            Poses copied per step (default 65536).
+
+        Returns
+        -------
+        None
+        """
+        os.makedirs(folder_name, exist_ok=True)
+        if isinstance(poses, HandPoseSequence):
+            points, start_times, end_times, sides, names = poses._columns()
+            np.save(os.path.join(folder_name, "start_times.npy"), start_times)
+            np.save(os.path.join(folder_name, "end_times.npy"), end_times)
+        else:
+            points, sides, names = poses.array, poses.sides, poses.names
+            for stale in ("start_times.npy", "end_times.npy"):
+                if os.path.exists(os.path.join(folder_name, stale)):
+                    os.remove(os.path.join(folder_name, stale))
+
+        out = np.lib.format.open_memmap(os.path.join(folder_name, "points.npy"), mode="w+",
+                                        dtype=np.float64, shape=points.shape)
+        for start in range(0, len(points), chunk_size):
+            out[start:start + chunk_size] = points[start:start + chunk_size]
+        out.flush()
+        del out
+        _save_label_codes(folder_name, "side", sides)
+        _save_label_codes(folder_name, "name", names)
+
+    @staticmethod
+    def open_pose_library(folder_name: str, mmap_mode: str = "r"):
+        """
+        Open a folder written by `save_pose_library` without reading the landmarks into memory.
+
+        The landmark and time arrays are memory-mapped, so frames are only paged in from
+        disk when they are accessed: indexing, `get_pose_at_time` (a binary search over
+        the mapped start times) and `iter_chunks` touch just the rows they need. Sides
+        and names are looked up from their small tables of distinct labels through the
+        mapped code columns, without sorting or string arrays the size of the library.
+
+        Parameters
+        ----------
+        folder_name : str
+            Folder written by `save_pose_library`.
+        mmap_mode : {'r', 'r+', 'c'} or None, optional
+            Passed to `numpy.load`. 'r' (default) maps read-only, so in-place transforms
+            must use `inplace=False`; 'r+' writes changes back to the files; 'c' keeps
+            changes in memory only; None loads everything into memory.
+
+        Returns
+        -------
+        HandPoseSequence or HandPoseBatch
+            A sequence if the library was saved from one, otherwise a batch, backed by
+            the mapped arrays.
+
+        Example
+        -------
+        >>> library = DataReader.open_pose_library("library")
+        >>> for chunk in library.iter_chunks(100_000):
+        ...     distances = canonical_distance_matrix(chunk, templates)
+        """
+        def load(name):
+            return np.load(os.path.join(folder_name, name), mmap_mode=mmap_mode, allow_pickle=False)
+
+        points = load("points.npy")
+        sides = _load_label_codes(folder_name, "side", mmap_mode)
+        names = _load_label_codes(folder_name, "name", mmap_mode)
+        if os.path.exists(os.path.join(folder_name, "start_times.npy")):
+            return HandPoseSequence.from_arrays(points, load("start_times.npy"), load("end_times.npy"),
+                                                sides, names, copy=False)
+        return HandPoseBatch.from_array(points, sides, names, copy=False)
+
+
+def _pose_json(points: np.ndarray, side: str, name: str) -> Dict:
+    """The `export_HandPose_to_json` dictionary, built straight from a (21, 3) array."""
+    return {
+        "side": side,
+        "name": name,
+        "landmarks": [
+            {"x": x, "y": y, "z": z, "name": POINTS_NAMES_LIST[i], "finger": FINGER_BY_INDEX[i]}
+            for i, (x, y, z) in enumerate(points.tolist())
+        ]
+    }
+
+
+def _write_json_atomic(path: str, data, indent: Optional[int], separators):
+    """Write JSON to a temporary file next to `path`, then rename it over `path`."""
+    temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temporary_path, "w") as f:
+            # json.dumps, unlike json.dump, can use the C encoder
+            f.write(json.dumps(data, indent=indent, separators=separators))
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def _load_pose_file(path: str):
+    """
+    Parse one pose file (a pose, a timed frame or a shard of frames) for `DataReader.load_folder`.
+
+    Returns a list of (points, side, name, start_time, end_time), one per frame, or an
+    error message string. Module-level so process pools can pickle it.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        frames = data["sequence"] if "sequence" in data else [data]
+        rows = []
+        for frame in frames:
+            pose = DataReader.convert_json_to_HandPose(frame if "landmarks" in frame else frame["pose"])
+            rows.append((pose.array, pose.side, pose.name,
+                         frame.get("start_time", np.nan), frame.get("end_time", np.nan)))
+        return rows
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+
+def _folder_label(path: str, folder_name: str) -> str:
+    """Subfolder of `folder_name` holding `path`, with '/' separators ('' for the folder itself)."""
+    label = os.path.relpath(os.path.dirname(path), folder_name)
+    return "" if label == "." else label.replace(os.sep, "/")
+
+
+def _natural_sort_key(path: str):
+    """Sort key comparing runs of digits numerically, so 'frame_2' sorts before 'frame_10'."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)]
+
+
+def _labels_to_array(labels) -> np.ndarray:
+    """Side/name labels as a unicode array, with None stored as ''."""
+    return np.array(["" if label is None else str(label) for label in labels], dtype=str)
+
+
+def _array_to_labels(array: np.ndarray) -> List:
+    """Inverse of `_labels_to_array`: '' becomes None."""
+    return [label or None for label in array.tolist()]
+
+
+def _save_label_codes(folder_name: str, key: str, labels):
+    """Save labels as '{key}_labels.npy' (distinct values, first seen first) and '{key}_codes.npy' (int32 per row)."""
+    table = {}
+    codes = np.fromiter((table.setdefault(label, len(table)) for label in labels), dtype=np.int32, count=len(labels))
+    np.save(os.path.join(folder_name, f"{key}_labels.npy"), _labels_to_array(table))
+    np.save(os.path.join(folder_name, f"{key}_codes.npy"), codes)
+
+
+def _load_label_codes(folder_name: str, key: str, mmap_mode: Optional[str]) -> np.ndarray:
+    """Inverse of `_save_label_codes` as an object array, sharing one str object per distinct label."""
+    table = np.load(os.path.join(folder_name, f"{key}_labels.npy"), allow_pickle=False)
+    labels = np.empty(len(table), dtype=object)
+    labels[:] = _array_to_labels(table)
+    return labels[np.load(os.path.join(folder_name, f"{key}_codes.npy"), mmap_mode=mmap_mode, allow_pickle=False)]
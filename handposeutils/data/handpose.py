@@ -1,6 +1,7 @@
 from typing import List, Literal, Dict
+import numpy as np
 from .coordinate import Coordinate
-from .constants import POINTS_NAMES_LIST, FINGER_MAPPING
+from .constants import POINTS_NAMES_LIST, POINT_INDEX_BY_NAME, FINGER_BY_INDEX
 from handposeutils.calculations import transforms
 
 
@@ -8,13 +9,17 @@ class HandPose:
     """
     Represents a single 3D hand pose with 21 landmarks in MediaPipe format.
 
-    Each landmark is stored along with its coordinate, side (left or right hand),
-    common anatomical name, and the finger grouping it belongs to.
+    The landmark positions are stored in a single contiguous (21, 3) float64 array,
+    available through `array`. Indexing the pose returns `Coordinate` views onto rows of
+    that array, so `pose[i].x = ...` edits the pose directly. A pose only stores its
+    coordinates, side and name; the per-landmark common names and finger groupings are
+    the shared tables in `handposeutils.data.constants`.
 
     Parameters
     ----------
-    coordinates : list of Coordinate
-        A list of exactly 21 `Coordinate` objects representing the hand's landmarks.
+    coordinates : list of Coordinate or array-like of shape (21, 3)
+        The hand's 21 landmarks, either as `Coordinate` objects or as raw xyz rows.
+        The values are copied into the pose's own array.
     side : {'left_hand', 'right_hand'}
         The handedness of the pose.
     name : str, optional
@@ -26,22 +31,107 @@ class HandPose:
         If `coordinates` does not contain exactly 21 elements.
     """
 
-    def __init__(self, coordinates: List[Coordinate], side: Literal["left_hand", "right_hand"], name: str = None):
+    __slots__ = ("_array", "_coordinates", "side", "name")
+
+    def __init__(self, coordinates: List[Coordinate] | np.ndarray, side: Literal["left_hand", "right_hand"],
+                 name: str = None):
         if len(coordinates) != 21:
             raise ValueError("Expected 21 coordinates for hand landmarks (MediaPipe format).")
 
+        if isinstance(coordinates, np.ndarray):
+            array = np.array(coordinates, dtype=np.float64)
+        else:
+            array = np.array([c.as_tuple() if isinstance(c, Coordinate) else c for c in coordinates],
+                             dtype=np.float64)
+        if array.shape != (21, 3):
+            raise ValueError(f"Expected landmark array of shape (21, 3), got {array.shape}")
+
+        self._init_from_array(array, side, name)
+
+    def _init_from_array(self, array: np.ndarray, side, name):
+        self._array = array
+        self._coordinates = None  # Coordinate views, built lazily on first access
         self.side = side
         self.name = name  # Optional identifier for the pose
-        self.points: Dict[int, Dict] = {}
 
-        for i, coord in enumerate(coordinates):
-            finger = next((fname for fname, idxs in FINGER_MAPPING.items() if i in idxs), "PALM")
-            self.points[i] = {
-                "coordinate": coord,
-                "side": side,
+    @classmethod
+    def from_array(cls, array: np.ndarray, side: Literal["left_hand", "right_hand"], name: str = None,
+                   copy: bool = True) -> "HandPose":
+        """
+        Build a HandPose directly from a (21, 3) array.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Landmark positions of shape (21, 3).
+        side : {'left_hand', 'right_hand'}
+            The handedness of the pose.
+        name : str, optional
+            An optional identifier for the pose.
+        copy : bool, default=True
+            If False and `array` is already a float64 array, the pose wraps it without
+            copying, so edits to the pose show up in `array` and vice versa.
+
+        Returns
+        -------
+        HandPose
+            The new pose.
+        """
+        array = np.array(array, dtype=np.float64, copy=True) if copy else np.asarray(array, dtype=np.float64)
+        if array.shape != (21, 3):
+            raise ValueError(f"Expected landmark array of shape (21, 3), got {array.shape}")
+        pose = cls.__new__(cls)
+        HandPose._init_from_array(pose, array, side, name)
+        return pose
+
+    def _with_array(self, array: np.ndarray) -> "HandPose":
+        """Return a new HandPose with this pose's side and name, wrapping `array` without copying."""
+        return HandPose.from_array(array, self.side, self.name, copy=False)
+
+    def copy(self) -> "HandPose":
+        """
+        Return an independent copy of the pose.
+
+        Returns
+        -------
+        HandPose
+            A new pose with its own landmark array and the same side and name.
+        """
+        return self._with_array(self._array.copy())
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        The (21, 3) float64 array holding the landmark positions.
+
+        This is the pose's own storage, not a copy: writing to it moves the landmarks.
+        """
+        return self._array
+
+    @property
+    def points(self) -> Dict[int, Dict]:
+        """
+        Per-landmark dictionaries of coordinate, side, common name and finger.
+
+        Kept for compatibility with older code; it is rebuilt from the shared lookup
+        tables on every access, so prefer `array`, `pose[i]` and
+        `handposeutils.data.constants.FINGER_BY_INDEX`.
+        """
+        coords = self._coordinate_views()
+        return {
+            i: {
+                "coordinate": coords[i],
+                "side": self.side,
                 "common_name": POINTS_NAMES_LIST[i],
-                "finger": finger
+                "finger": FINGER_BY_INDEX[i]
             }
+            for i in range(21)
+        }
+
+    def _coordinate_views(self) -> List[Coordinate]:
+        if self._coordinates is None:
+            self._coordinates = [Coordinate.view(row) for row in self._array]
+        return self._coordinates
 
     def get_coordinate_by_index(self, index: int) -> Coordinate:
         """
@@ -55,9 +145,9 @@ class HandPose:
         Returns
         -------
         Coordinate
-            The coordinate object at the specified index.
+            A view onto the landmark at the specified index.
         """
-        return self.points[index]["coordinate"]
+        return self._coordinate_views()[index]
 
     def get_index_by_common_name(self, name: str) -> int:
         """
@@ -78,10 +168,10 @@ class HandPose:
         ValueError
             If no landmark with the given name is found.
         """
-        for i, data in self.points.items():
-            if data["common_name"] == name:
-                return i
-        raise ValueError(f"No point found with common name {name}")
+        try:
+            return POINT_INDEX_BY_NAME[name]
+        except KeyError:
+            raise ValueError(f"No point found with common name {name}") from None
 
     def get_all_coordinates(self) -> List[Coordinate]:
         """
@@ -90,9 +180,9 @@ class HandPose:
         Returns
         -------
         list of Coordinate
-            All 21 coordinates in index order.
+            Views onto all 21 landmarks in index order.
         """
-        return [self.points[i]["coordinate"] for i in range(21)]
+        return list(self._coordinate_views())
 
     def get_handedness(self) -> Literal["left_hand", "right_hand"]:
         """
@@ -114,7 +204,7 @@ class HandPose:
         str
             String showing the handedness and number of landmarks.
         """
-        return f"<HandPose {self.side}, {len(self.points)} landmarks>"
+        return f"<HandPose {self.side}, {len(self._array)} landmarks>"
 
     def __getitem__(self, index_or_name: int | str) -> Coordinate:
         """
@@ -144,40 +234,72 @@ class HandPose:
             return self.get_coordinate_by_index(idx)
         raise TypeError("Index must be int (0–20) or common_name string.")
 
-    def normalize(self) -> "HandPose":
+    def __setitem__(self, index_or_name: int | str, value: Coordinate):
+        """
+        Overwrite a landmark's position, by index or common name.
+
+        Parameters
+        ----------
+        index_or_name : int or str
+            The landmark index (0–20) or the common name of the landmark.
+        value : Coordinate or array-like of length 3
+            The new position; its values are copied into the pose.
+        """
+        if isinstance(index_or_name, str):
+            index_or_name = self.get_index_by_common_name(index_or_name)
+        elif not isinstance(index_or_name, int):
+            raise TypeError("Index must be int (0–20) or common_name string.")
+        self._array[index_or_name] = np.asarray(value, dtype=np.float64)
+
+    def normalize(self, inplace: bool = True) -> "HandPose":
         """
         Normalize the pose in both position and scale.
 
+        Parameters
+        ----------
+        inplace : bool, default=True
+            Modify this pose itself. Pass False to leave it untouched and get a new HandPose.
+
         Returns
         -------
         HandPose
-            A new normalized `HandPose` instance.
+            This pose, or a new `HandPose` when `inplace` is False.
         """
-        return transforms.normalize_handpose(self)
+        return transforms.normalize_handpose(self, inplace=inplace)
 
-    def normalize_scaling(self) -> "HandPose":
+    def normalize_scaling(self, inplace: bool = True) -> "HandPose":
         """
         Normalize the scale of the pose (without changing position).
 
+        Parameters
+        ----------
+        inplace : bool, default=True
+            Modify this pose itself. Pass False to leave it untouched and get a new HandPose.
+
         Returns
         -------
         HandPose
-            A new `HandPose` instance scaled to a standard size.
+            This pose, or a new `HandPose` when `inplace` is False.
         """
-        return transforms.normalize_handpose_scaling(self)
+        return transforms.normalize_handpose_scaling(self, inplace=inplace)
 
-    def normalize_position(self) -> "HandPose":
+    def normalize_position(self, inplace: bool = True) -> "HandPose":
         """
         Normalize the position of the pose (without scaling).
 
+        Parameters
+        ----------
+        inplace : bool, default=True
+            Modify this pose itself. Pass False to leave it untouched and get a new HandPose.
+
         Returns
         -------
         HandPose
-            A new `HandPose` instance translated to a standard position.
+            This pose, or a new `HandPose` when `inplace` is False.
         """
-        return transforms.normalize_handpose_positioning(self)
+        return transforms.normalize_handpose_positioning(self, inplace=inplace)
 
-    def mirror(self, axis: Literal['x', 'y', 'z'] = 'x') -> "HandPose":
+    def mirror(self, axis: Literal['x', 'y', 'z'] = 'x', inplace: bool = True) -> "HandPose":
         """
         Mirror the pose across a specified axis.
 
@@ -185,15 +307,17 @@ class HandPose:
         ----------
         axis : {'x', 'y', 'z'}, default='x'
             The axis to mirror across.
+        inplace : bool, default=True
+            Modify this pose itself. Pass False to leave it untouched and get a new HandPose.
 
         Returns
         -------
         HandPose
-            A new mirrored `HandPose` instance.
+            This pose, or a new `HandPose` when `inplace` is False.
         """
-        return transforms.mirror_pose(self, axis)
+        return transforms.mirror_pose(self, axis, inplace=inplace)
 
-    def rotate(self, degrees: float, axis: Literal['x', 'y', 'z'] = 'z') -> "HandPose":
+    def rotate(self, degrees: float, axis: Literal['x', 'y', 'z'] = 'z', inplace: bool = True) -> "HandPose":
         """
         Rotate the pose around a specified axis.
 
@@ -203,15 +327,17 @@ class HandPose:
             The angle of rotation in degrees.
         axis : {'x', 'y', 'z'}, default='z'
             The axis to rotate around.
+        inplace : bool, default=True
+            Modify this pose itself. Pass False to leave it untouched and get a new HandPose.
 
         Returns
         -------
         HandPose
-            A new rotated `HandPose` instance.
+            This pose, or a new `HandPose` when `inplace` is False.
         """
-        return transforms.rotate_pose_by_axis(self, degrees, axis)
+        return transforms.rotate_pose_by_axis(self, degrees, axis, inplace=inplace)
 
-    def straighten_finger(self, finger: str) -> "HandPose":
+    def straighten_finger(self, finger: str, inplace: bool = True) -> "HandPose":
         """
         Straighten the specified finger in the pose.
 
@@ -219,10 +345,30 @@ class HandPose:
         ----------
         finger : str
             The name of the finger to straighten (e.g., "INDEX", "THUMB").
+        inplace : bool, default=True
+            Modify this pose itself. Pass False to leave it untouched and get a new HandPose.
+
+        Returns
+        -------
+        HandPose
+            This pose, or a new `HandPose` when `inplace` is False.
+        """
+        return transforms.straighten_finger(self, finger, inplace=inplace)
+
+    def straighten_fingers(self, fingers=None, inplace: bool = True) -> "HandPose":
+        """
+        Straighten several fingers in the pose in one pass.
+
+        Parameters
+        ----------
+        fingers : str or iterable of str, optional
+            The names of the fingers to straighten (e.g., ["INDEX", "MIDDLE"]). Defaults to all five.
+        inplace : bool, default=True
+            Modify this pose itself. Pass False to leave it untouched and get a new HandPose.
 
         Returns
         -------
         HandPose
-            A new `HandPose` instance with the specified finger straightened.
+            This pose, or a new `HandPose` when `inplace` is False.
         """
-        return transforms.straighten_finger(self, finger)
+        return transforms.straighten_fingers(self, fingers, inplace=inplace)
@@ -0,0 +1,341 @@
+from typing import Iterator, List, Literal, Optional, Sequence
+import numpy as np
+from .handpose import HandPose
+from handposeutils.calculations import transforms
+
+
+class HandPoseBatch:
+    """
+    A stack of N hand poses held in a single (N, 21, 3) float64 array.
+
+    The batch is the bulk counterpart of `HandPose`: the transforms (`normalize`, `mirror`,
+    `rotate`, `straighten_finger`, ...) run once over the whole array instead of once per
+    pose. Like the `transforms` functions, and unlike the `HandPose` methods, they return a
+    new batch unless called with `inplace=True`. Handedness and an optional name are kept
+    per row.
+
+    Parameters
+    ----------
+    array : array-like of shape (N, 21, 3)
+        Landmark positions of every pose. The values are copied into the batch.
+    sides : sequence of str, optional
+        Handedness of each pose ('left_hand' or 'right_hand'). Defaults to None for every row.
+    names : sequence of str, optional
+        Identifier of each pose. Defaults to None for every row.
+
+    Raises
+    ------
+    ValueError
+        If `array` is not of shape (N, 21, 3), or `sides`/`names` do not have N entries.
+
+    See Also
+    --------
+    HandPose
+        A single row of the batch.
+    """
+
+    def __init__(self, array: np.ndarray, sides: Optional[Sequence[str]] = None,
+                 names: Optional[Sequence[str]] = None):
+        self._init_columns(np.array(array, dtype=np.float64), sides, names)
+
+    def _init_columns(self, array: np.ndarray, sides, names):
+        if array.ndim != 3 or array.shape[1:] != (21, 3):
+            raise ValueError(f"Expected pose array of shape (N, 21, 3), got {array.shape}")
+        n = array.shape[0]
+        self._array = array
+        self.sides = self._column(sides, n, "sides")
+        self.names = self._column(names, n, "names")
+
+    @staticmethod
+    def _column(values, n: int, label: str) -> np.ndarray:
+        column = np.empty(n, dtype=object)
+        if values is None:
+            return column
+        if isinstance(values, str):
+            column[:] = values
+            return column
+        if len(values) != n:
+            raise ValueError(f"Expected {n} {label}, got {len(values)}")
+        column[:] = list(values)
+        return column
+
+    # --- Constructors ---
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, sides: Optional[Sequence[str]] = None,
+                   names: Optional[Sequence[str]] = None, copy: bool = True) -> "HandPoseBatch":
+        """
+        Build a batch from a raw (N, 21, 3) array.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Landmark positions of shape (N, 21, 3).
+        sides : sequence of str or str, optional
+            Handedness per pose, or one value for all of them.
+        names : sequence of str, optional
+            Identifier per pose.
+        copy : bool, default=True
+            If False and `array` is already float64, the batch wraps it without copying.
+
+        Returns
+        -------
+        HandPoseBatch
+            The new batch.
+        """
+        array = np.array(array, dtype=np.float64, copy=True) if copy else np.asarray(array, dtype=np.float64)
+        batch = cls.__new__(cls)
+        batch._init_columns(array, sides, names)
+        return batch
+
+    @classmethod
+    def from_handposes(cls, poses: List[HandPose]) -> "HandPoseBatch":
+        """
+        Stack a list of HandPoses into a batch.
+
+        Parameters
+        ----------
+        poses : list of HandPose
+            Poses to stack, in order.
+
+        Returns
+        -------
+        HandPoseBatch
+            Batch of len(poses) rows, with each pose's side and name.
+        """
+        array = np.empty((len(poses), 21, 3), dtype=np.float64)
+        for i, pose in enumerate(poses):
+            array[i] = pose.array
+        return cls.from_array(array, [p.side for p in poses], [p.name for p in poses], copy=False)
+
+    @classmethod
+    def from_sequence(cls, sequence) -> "HandPoseBatch":
+        """
+        Stack the poses of a HandPoseSequence into a batch, in time order.
+
+        Parameters
+        ----------
+        sequence : HandPoseSequence
+            Sequence whose poses to stack. Timing information is dropped.
+
+        Returns
+        -------
+        HandPoseBatch
+            Batch with one row per frame of the sequence.
+        """
+        return cls.from_array(sequence.array, sequence.sides, sequence.names)
+
+    # --- Access ---
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        The (N, 21, 3) float64 array holding every pose.
+
+        This is the batch's own storage, not a copy.
+        """
+        return self._array
+
+    def _with_array(self, array: np.ndarray) -> "HandPoseBatch":
+        """Return a new batch with this batch's sides and names, wrapping `array` without copying."""
+        return HandPoseBatch.from_array(array, self.sides.copy(), self.names.copy(), copy=False)
+
+    def copy(self) -> "HandPoseBatch":
+        """
+        Return an independent copy of the batch.
+
+        Returns
+        -------
+        HandPoseBatch
+            A new batch with its own array and copies of the side and name columns.
+        """
+        return self._with_array(self._array.copy())
+
+    def to_handposes(self) -> List[HandPose]:
+        """
+        Split the batch into independent HandPose objects (copies of each row).
+
+        Returns
+        -------
+        list of HandPose
+            One pose per row, with its side and name.
+        """
+        return [HandPose.from_array(self._array[i], self.sides[i], self.names[i]) for i in range(len(self))]
+
+    def __len__(self) -> int:
+        return self._array.shape[0]
+
+    def __getitem__(self, index):
+        """
+        Get a single pose or a sub-batch.
+
+        Parameters
+        ----------
+        index : int, slice, or array of indices/booleans
+            Row selector.
+
+        Returns
+        -------
+        HandPose or HandPoseBatch
+            For an int, a HandPose viewing that row (edits write back to the batch).
+            Otherwise a new HandPoseBatch; slices share memory with this batch.
+        """
+        if isinstance(index, (int, np.integer)):
+            return HandPose.from_array(self._array[index], self.sides[index], self.names[index], copy=False)
+        return HandPoseBatch.from_array(self._array[index], self.sides[index], self.names[index], copy=False)
+
+    def iter_chunks(self, chunk_size: int = 4096) -> Iterator["HandPoseBatch"]:
+        """
+        Iterate over consecutive sub-batches of at most `chunk_size` poses.
+
+        Chunks share memory with this batch, so iterating over a memory-mapped batch
+        (see `DataReader.open_pose_library`) only pages in one chunk at a time.
+
+        Parameters
+        ----------
+        chunk_size : int, default=4096
+            Poses per chunk (the last one may be smaller).
+
+        Yields
+        ------
+        HandPoseBatch
+            Views of rows [k * chunk_size, (k + 1) * chunk_size).
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        for start in range(0, len(self), chunk_size):
+            yield self[start:start + chunk_size]
+
+    def __str__(self) -> str:
+        return f"<HandPoseBatch with {len(self)} poses>"
+
+    # --- Transforms ---
+
+    def normalize(self, inplace: bool = False) -> "HandPoseBatch":
+        """
+        Normalize every pose in both position and scale.
+
+        Parameters
+        ----------
+        inplace : bool, default=False
+            Modify this batch itself instead of returning a new HandPoseBatch. Not possible
+            for a read-only memory-mapped batch (see `DataReader.open_pose_library`).
+
+        Returns
+        -------
+        HandPoseBatch
+            A new `HandPoseBatch`, or this batch when `inplace` is True.
+        """
+        return transforms.normalize_handpose(self, inplace=inplace)
+
+    def normalize_scaling(self, inplace: bool = False) -> "HandPoseBatch":
+        """
+        Normalize the scale of every pose (without changing position).
+
+        Parameters
+        ----------
+        inplace : bool, default=False
+            Modify this batch itself instead of returning a new HandPoseBatch. Not possible
+            for a read-only memory-mapped batch (see `DataReader.open_pose_library`).
+
+        Returns
+        -------
+        HandPoseBatch
+            A new `HandPoseBatch`, or this batch when `inplace` is True.
+        """
+        return transforms.normalize_handpose_scaling(self, inplace=inplace)
+
+    def normalize_position(self, inplace: bool = False) -> "HandPoseBatch":
+        """
+        Center every pose at the origin (without scaling).
+
+        Parameters
+        ----------
+        inplace : bool, default=False
+            Modify this batch itself instead of returning a new HandPoseBatch. Not possible
+            for a read-only memory-mapped batch (see `DataReader.open_pose_library`).
+
+        Returns
+        -------
+        HandPoseBatch
+            A new `HandPoseBatch`, or this batch when `inplace` is True.
+        """
+        return transforms.normalize_handpose_positioning(self, inplace=inplace)
+
+    def mirror(self, axis: Literal['x', 'y', 'z'] = 'x', inplace: bool = False) -> "HandPoseBatch":
+        """
+        Mirror every pose across a specified axis.
+
+        Parameters
+        ----------
+        axis : {'x', 'y', 'z'}, default='x'
+            The axis to mirror across.
+        inplace : bool, default=False
+            Modify this batch itself instead of returning a new HandPoseBatch. Not possible
+            for a read-only memory-mapped batch (see `DataReader.open_pose_library`).
+
+        Returns
+        -------
+        HandPoseBatch
+            A new `HandPoseBatch`, or this batch when `inplace` is True.
+        """
+        return transforms.mirror_pose(self, axis, inplace=inplace)
+
+    def rotate(self, degrees: float, axis: Literal['x', 'y', 'z'] = 'z', inplace: bool = False) -> "HandPoseBatch":
+        """
+        Rotate every pose around a specified axis.
+
+        Parameters
+        ----------
+        degrees : float
+            The angle of rotation in degrees.
+        axis : {'x', 'y', 'z'}, default='z'
+            The axis to rotate around.
+        inplace : bool, default=False
+            Modify this batch itself instead of returning a new HandPoseBatch. Not possible
+            for a read-only memory-mapped batch (see `DataReader.open_pose_library`).
+
+        Returns
+        -------
+        HandPoseBatch
+            A new `HandPoseBatch`, or this batch when `inplace` is True.
+        """
+        return transforms.rotate_pose_by_axis(self, degrees, axis, inplace=inplace)
+
+    def straighten_finger(self, finger: str, inplace: bool = False) -> "HandPoseBatch":
+        """
+        Straighten the specified finger in every pose.
+
+        Parameters
+        ----------
+        finger : str
+            The name of the finger to straighten (e.g., "INDEX", "THUMB").
+        inplace : bool, default=False
+            Modify this batch itself instead of returning a new HandPoseBatch. Not possible
+            for a read-only memory-mapped batch (see `DataReader.open_pose_library`).
+
+        Returns
+        -------
+        HandPoseBatch
+            A new `HandPoseBatch`, or this batch when `inplace` is True.
+        """
+        return transforms.straighten_finger(self, finger, inplace=inplace)
+
+    def straighten_fingers(self, fingers=None, inplace: bool = False) -> "HandPoseBatch":
+        """
+        Straighten several fingers in every pose in one pass.
+
+        Parameters
+        ----------
+        fingers : str or iterable of str, optional
+            The names of the fingers to straighten (e.g., ["INDEX", "MIDDLE"]). Defaults to all five.
+        inplace : bool, default=False
+            Modify this batch itself instead of returning a new HandPoseBatch. Not possible
+            for a read-only memory-mapped batch (see `DataReader.open_pose_library`).
+
+        Returns
+        -------
+        HandPoseBatch
+            A new `HandPoseBatch`, or this batch when `inplace` is True.
+        """
+        return transforms.straighten_fingers(self, fingers, inplace=inplace)
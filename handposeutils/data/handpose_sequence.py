@@ -1,6 +1,12 @@
-from typing import List, Optional, Callable
+from typing import List, Literal, Optional, Callable, Iterator, Sequence, Tuple, Union
 from dataclasses import dataclass
+import copy
+import heapq
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from .handpose import HandPose
+from .handpose_batch import HandPoseBatch
+import asyncio
 import threading
 import time
 
@@ -23,6 +29,114 @@ class TimedHandPose:
     end_time: float    # seconds
 
 
+@dataclass
+class RecordingStats:
+    """
+    Timing statistics of a recording session.
+
+    Attributes
+    ----------
+    target_fps : float
+        The frame rate recording was asked to run at.
+    elapsed : float
+        Seconds since recording started (until it stopped, once stopped).
+    ticks : int
+        Number of capture slots in which `get_pose_fn` was called.
+    frames_recorded : int
+        Number of poses appended to the sequence.
+    empty_frames : int
+        Ticks where `get_pose_fn` returned no pose.
+    late_frames : int
+        Ticks whose capture finished after the next frame was already due.
+    dropped_frames : int
+        Capture slots skipped entirely because recording had fallen behind.
+    latency_p50 : float
+        Median `get_pose_fn` call duration in seconds, over recent ticks.
+    latency_p99 : float
+        99th-percentile `get_pose_fn` call duration in seconds, over recent ticks.
+    """
+    target_fps: float
+    elapsed: float = 0.0
+    ticks: int = 0
+    frames_recorded: int = 0
+    empty_frames: int = 0
+    late_frames: int = 0
+    dropped_frames: int = 0
+    latency_p50: float = 0.0
+    latency_p99: float = 0.0
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames actually recorded per second of recording."""
+        return self.frames_recorded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _RecordingClock:
+    """
+    Deadline scheduler and bookkeeping for one recording session.
+
+    Frame k is due at `start + k / fps` on the monotonic `perf_counter` clock, so sleep
+    inaccuracies never accumulate. When a capture overruns, the slots it missed are
+    counted as dropped and skipped instead of being captured in a burst.
+    """
+
+    LATENCY_WINDOW = 1024  # Percentiles are taken over this many recent ticks
+
+    def __init__(self, fps: float):
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.fps = fps
+        self.interval = 1.0 / fps
+        self.start = time.perf_counter()
+        self.stop_time = None
+        self.slot = 0
+        self.stats = RecordingStats(target_fps=fps)
+        self._latencies = np.zeros(self.LATENCY_WINDOW)
+
+    def now(self) -> float:
+        """Seconds since the session started."""
+        return time.perf_counter() - self.start
+
+    def wait_time(self) -> float:
+        """Seconds left until the current slot is due (negative if already overdue)."""
+        return self.slot * self.interval - self.now()
+
+    def record_tick(self, captured_at: float, latency: float, recorded: bool):
+        """Account for one capture that started at `captured_at` and took `latency` seconds."""
+        stats = self.stats
+        self._latencies[stats.ticks % self.LATENCY_WINDOW] = latency
+        stats.ticks += 1
+        if recorded:
+            stats.frames_recorded += 1
+        else:
+            stats.empty_frames += 1
+
+        # If the next slot is already due, capture it right away and skip any older ones
+        self.slot += 1
+        last_due = int((captured_at + latency) // self.interval)
+        if last_due >= self.slot:
+            stats.late_frames += 1
+            stats.dropped_frames += last_due - self.slot
+            self.slot = last_due
+
+    def record_arrival(self, recorded: bool):
+        """Account for one frame pushed by the source, which has no capture slots."""
+        self.stats.ticks += 1
+        if recorded:
+            self.stats.frames_recorded += 1
+        else:
+            self.stats.empty_frames += 1
+
+    def snapshot(self) -> RecordingStats:
+        stats = RecordingStats(**vars(self.stats))
+        end = self.stop_time if self.stop_time is not None else time.perf_counter()
+        stats.elapsed = end - self.start
+        window = self._latencies[:min(stats.ticks, self.LATENCY_WINDOW)]
+        if window.size:
+            stats.latency_p50, stats.latency_p99 = (float(v) for v in np.percentile(window, [50, 99]))
+        return stats
+
+
 class HandPoseSequence:
     """
     A sequence of hand poses with their timing information.
@@ -30,39 +144,523 @@ class HandPoseSequence:
     This class allows you to store, retrieve, and record hand poses over time,
     enabling playback, analysis, and live capture from a pose source.
 
+    The sequence is stored column by column: one (T, 21, 3) float64 array of landmarks
+    (`array`), float arrays of `start_times` and `end_times`, and `sides`/`names` columns.
+    `TimedHandPose` objects are only built when asked for (indexing, iteration or
+    `sequence`); their poses are views onto rows of `array`, so editing a pose edits the
+    sequence, while their times are copies.
+
+    One thread may append (e.g. the recording thread) while any number of others read,
+    without locks: every read works on one consistent published window, so it never sees
+    a frame before it is completely written. A ring buffer (`start_recording` with
+    `max_frames` or `max_duration`) reuses its rows for later frames, so there reads
+    return copies instead of views, taken between two appends; editing them does not
+    edit the sequence. Once that recording stops, the sequence is an ordinary one again
+    and reads return views. Consumers can block on `wait_for_new_frame` (or await
+    `wait_for_new_frame_async`) instead of polling.
+
     Parameters
     ----------
     timed_poses : list of TimedHandPose, optional
         Initial list of timed hand poses. If provided, they are sorted
-        by `start_time`.
+        by `start_time`. Their landmarks are copied into the sequence. For HandPose
+        subclasses (such as `VisualizedPose`), a copy of their other attributes is kept
+        too, and reading the frame rebuilds an instance of the subclass viewing its row.
 
     Attributes
     ----------
     sequence : list of TimedHandPose
-        The ordered list of timed poses.
+        The ordered list of timed poses, built on access.
     _recording_thread : threading.Thread or None
         The background thread for live recording.
     _recording : bool
         Whether a recording session is currently active.
     _record_start_time : float or None
-        The wall-clock time when recording started.
+        The `time.perf_counter` time when recording started.
 
     See Also
     ----------
     HandPose
         HandPoseSequence is effectively a storage system for multiple HandPoses, indexed by time.
+    HandPoseBatch
+        The same columnar layout without timing.
     """
 
+    _COLUMNS = ("_points", "_start_times", "_end_times", "_sides", "_names", "_end_reach")
+
     def __init__(self, timed_poses: List[TimedHandPose] = None):
-        self.sequence = sorted(timed_poses, key=lambda x: x.start_time) if timed_poses else []
+        timed_poses = sorted(timed_poses, key=lambda x: x.start_time) if timed_poses else []
+        self._init_recording_state()
+        self._init_storage(len(timed_poses))
+        for timed in timed_poses:
+            self._append_pose(timed.pose, timed.start_time, timed.end_time)
+
+    def _init_recording_state(self):
         self._recording_thread = None
+        self._recording_async = False
         self._recording = False
         self._record_start_time = None
+        self._clock = None
+        self._sink = None
+        self._frame_duration = 1.0 / 30.0
+        self._new_frame = threading.Condition()
+        self._frame_waiters = []  # (event loop, future) pairs of `wait_for_new_frame_async` callers
+        self._consumers = {}  # `async for` iterator -> absolute index of the last frame it consumed
+        self._consumer_advanced = None  # asyncio.Event of the running `record_async` session
+
+    def _init_storage(self, capacity: int):
+        capacity = max(capacity, 16)
+        self._points = np.empty((capacity, 21, 3), dtype=np.float64)
+        self._start_times = np.empty(capacity, dtype=np.float64)
+        self._end_times = np.empty(capacity, dtype=np.float64)
+        self._sides = np.empty(capacity, dtype=object)
+        self._names = np.empty(capacity, dtype=object)
+        self._end_reach = np.empty(capacity, dtype=np.float64)  # Running maximum of end times, see `_active_indices`
+        self._offset = 0  # Row of the first frame; only moves in ring-buffer mode
+        self._length = 0
+        self._custom_poses = {}  # frame index -> HandPose subclass template, see `_pose_template`
+        self._ring_capacity = None
+        self._max_duration = None
+        self._version = 0  # Odd while a frame is being written, see `snapshot`
+        self._frames_appended = 0
+        self._publish()
+
+    def _publish(self):
+        """
+        Make the writer's current buffers and window visible to readers.
+
+        Readers take this one tuple (a single atomic attribute read) and slice everything
+        from it, so they always see matching columns without taking a lock.
+        """
+        self._published = (self._points, self._start_times, self._end_times, self._sides, self._names,
+                           self._offset, self._length, self._frames_appended, self._end_reach)
+
+    def _columns(self, reach: bool = False):
+        """
+        Consistent (points, start_times, end_times, sides, names) columns: views, or
+        copies in ring-buffer mode (see `_read`). With `reach`, the running maximum of
+        the end times is added as a sixth column.
+        """
+        return self._read(lambda published: self._columns_of(published, reach))
+
+    @staticmethod
+    def _columns_of(published, reach: bool = False):
+        buffers = published[:5] + published[8:] if reach else published[:5]
+        window = slice(published[5], published[5] + published[6])
+        return tuple(buffer[window] for buffer in buffers)
+
+    def _column(self, k: int) -> np.ndarray:
+        return self._read(lambda published: published[k][published[5]:published[5] + published[6]])
+
+    def _read(self, select: Callable, copy: Optional[bool] = None):
+        """
+        Return `select(published)`, where `select` slices arrays out of the published window.
+
+        The slices are views, which stay valid while frames are appended, except in
+        ring-buffer mode, where rows are reused by later frames. There (or if `copy` is
+        True) every array of the result is copied, and the copy is retried if a frame
+        was written meanwhile, so it never mixes two frames.
+        """
+        if copy is None:
+            copy = self._ring_capacity is not None
+        if not copy:
+            return select(self._published)
+        while True:
+            version = self._version
+            if version % 2 == 0:
+                result = _copy_arrays(select(self._published))
+                if self._version == version:
+                    return result
+            time.sleep(0)  # Let the writer finish its frame
+
+    def _locate(self, locate: Callable):
+        """
+        Find one frame with `locate(columns)` (its index, or None) and return
+        (columns, index) to read it from. In ring-buffer mode only that frame is copied.
+        `locate` also gets the running maximum of the end times, as a sixth column.
+        """
+        def select(published):
+            index = locate(self._columns_of(published, reach=True))
+            columns = self._columns_of(published)
+            if index is None or self._ring_capacity is None:
+                return columns, index
+            return tuple(column[index:index + 1] for column in columns), 0
+        return self._read(select)
+
+    def _ensure_capacity(self, needed: int):
+        """Grow the column buffers (geometrically) so they hold at least `needed` rows."""
+        capacity = len(self._start_times)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        window = slice(self._offset, self._offset + self._length)
+        for attr in self._COLUMNS:
+            old = getattr(self, attr)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._length] = old[window]
+            setattr(self, attr, new)
+        self._offset = 0
+
+    def _configure_ring(self, max_frames: Optional[int], max_duration: Optional[float], fps: float):
+        """
+        Switch to a bounded ring buffer keeping at most `max_frames` frames and/or the
+        frames of the last `max_duration` seconds.
+
+        Storage is preallocated for twice the capacity. Frames are appended after the
+        current window and, when the end of the storage is reached, the window is copied
+        back to the front, so the live frames always form one contiguous block of rows.
+        """
+        capacities = []
+        if max_frames is not None:
+            if max_frames < 1:
+                raise ValueError("max_frames must be at least 1")
+            capacities.append(int(max_frames))
+        if max_duration is not None:
+            if max_duration <= 0:
+                raise ValueError("max_duration must be positive")
+            # Deadline scheduling never captures more than one frame per slot (+1 for jitter)
+            capacities.append(int(np.ceil(max_duration * fps)) + 2)
+        capacity = min(capacities)
+
+        keep = slice(max(self._length - capacity, 0), self._length)
+        columns = {attr: getattr(self, attr)[self._offset:self._offset + self._length][keep]
+                   for attr in self._COLUMNS}
+        n = len(columns["_start_times"])
+        for attr, old in columns.items():
+            new = np.empty((2 * capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old
+            setattr(self, attr, new)
+        self._offset = 0
+        self._length = n
+        self._custom_poses = {}  # Frame indices shift as the ring drops frames, so templates are not kept
+        self._ring_capacity = capacity
+        self._max_duration = max_duration
+        self._trim_to_duration()
+        self._publish()
+
+    def _release_ring(self):
+        """
+        Leave ring-buffer mode once recording has stopped.
+
+        The live window is copied into fresh storage starting at row 0 (readers may
+        still hold the old buffers), so reads return views again and the sequence
+        grows normally if more frames are appended.
+        """
+        if self._ring_capacity is None:
+            return
+        window = slice(self._offset, self._offset + self._length)
+        for attr in self._COLUMNS:
+            setattr(self, attr, getattr(self, attr)[window].copy())
+        self._offset = 0
+        self._ring_capacity = None
+        self._max_duration = None
+        self._refresh_end_reach()  # Frames dropped by the ring no longer count
+        self._publish()
+
+    def _refresh_end_reach(self):
+        """Recompute the running maximum of the end times, after they were changed in place."""
+        window = slice(self._offset, self._offset + self._length)
+        np.maximum.accumulate(self._end_times[window], out=self._end_reach[window])
+
+    def _trim_to_duration(self):
+        """Drop frames older than `max_duration` before the newest one."""
+        if self._max_duration is None or self._length < 2:
+            return
+        starts = self._start_times[self._offset:self._offset + self._length]
+        cutoff = starts[-1] - self._max_duration
+        drop = int(np.searchsorted(starts, cutoff, side="left"))
+        drop = min(drop, self._length - 1)
+        self._offset += drop
+        self._length -= drop
+
+    # --- Constructors ---
+
+    @classmethod
+    def from_arrays(cls, points: np.ndarray, start_times: Sequence[float],
+                    end_times: Optional[Sequence[float]] = None, sides: Optional[Sequence[str]] = None,
+                    names: Optional[Sequence[str]] = None, copy: bool = True) -> "HandPoseSequence":
+        """
+        Build a sequence directly from its columns.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Landmark positions of shape (T, 21, 3), in time order.
+        start_times : sequence of float
+            Start time of each frame in seconds, non-decreasing.
+        end_times : sequence of float, optional
+            End time of each frame in seconds. Defaults to the next frame's start time
+            (and `start_time + 1/30` for the last frame).
+        sides : sequence of str or str, optional
+            Handedness per frame, or one value for all of them.
+        names : sequence of str, optional
+            Identifier per frame.
+        copy : bool, default=True
+            If False and the inputs are already float64 arrays, the sequence wraps them
+            without copying.
+
+        Returns
+        -------
+        HandPoseSequence
+            The new sequence.
+
+        Raises
+        ------
+        ValueError
+            If the columns do not have matching lengths or `points` is not (T, 21, 3).
+        """
+        points = np.array(points, dtype=np.float64, copy=True) if copy else np.asarray(points, dtype=np.float64)
+        if points.ndim != 3 or points.shape[1:] != (21, 3):
+            raise ValueError(f"Expected pose array of shape (T, 21, 3), got {points.shape}")
+        n = points.shape[0]
+        start_times = cls._time_column(start_times, n, "start_times", copy)
+        if end_times is None:
+            end_times = np.empty(n, dtype=np.float64)
+            end_times[:-1] = start_times[1:]
+            end_times[-1:] = start_times[-1:] + 1.0 / 30.0
+        else:
+            end_times = cls._time_column(end_times, n, "end_times", copy)
+
+        return cls._from_columns(points, start_times, end_times, cls._object_column(sides, n, "sides"),
+                                 cls._object_column(names, n, "names"), np.maximum.accumulate(end_times))
+
+    @classmethod
+    def _from_columns(cls, points: np.ndarray, start_times: np.ndarray, end_times: np.ndarray,
+                      sides: np.ndarray, names: np.ndarray, end_reach: np.ndarray) -> "HandPoseSequence":
+        """
+        Wrap validated columns without copying. `end_reach` must be at least the running
+        maximum of `end_times` (it only has to be exact for lookups to stay O(log T)).
+        """
+        n = len(start_times)
+        sequence = cls.__new__(cls)
+        sequence._init_recording_state()
+        sequence._points = points
+        sequence._start_times = start_times
+        sequence._end_times = end_times
+        sequence._sides = sides
+        sequence._names = names
+        sequence._end_reach = end_reach
+        sequence._offset = 0
+        sequence._length = n
+        sequence._custom_poses = {}
+        sequence._ring_capacity = None
+        sequence._max_duration = None
+        sequence._version = 0
+        sequence._frames_appended = n
+        sequence._publish()
+        return sequence
+
+    @staticmethod
+    def _time_column(values, n: int, label: str, copy: bool) -> np.ndarray:
+        column = np.array(values, dtype=np.float64, copy=True) if copy else np.asarray(values, dtype=np.float64)
+        if column.shape != (n,):
+            raise ValueError(f"Expected {n} {label}, got shape {column.shape}")
+        return column
+
+    @staticmethod
+    def _object_column(values, n: int, label: str) -> np.ndarray:
+        column = np.empty(n, dtype=object)
+        if values is None:
+            return column
+        if isinstance(values, str):
+            column[:] = values
+            return column
+        if len(values) != n:
+            raise ValueError(f"Expected {n} {label}, got {len(values)}")
+        column[:] = list(values)
+        return column
+
+    def _with_array(self, array: np.ndarray) -> "HandPoseSequence":
+        """Return a new sequence with this sequence's timing, sides and names, wrapping `array` without copying."""
+        _, start_times, end_times, sides, names = self._columns()
+        return HandPoseSequence.from_arrays(array, start_times.copy(), end_times.copy(),
+                                            sides.copy(), names.copy(), copy=False)
+
+    def copy(self) -> "HandPoseSequence":
+        """
+        Return an independent copy of the sequence.
+
+        Returns
+        -------
+        HandPoseSequence
+            A new sequence with its own copies of every column.
+        """
+        return self._with_array(self.array.copy())
+
+    @classmethod
+    def concat(cls, sequences: Sequence["HandPoseSequence"],
+               offset: Union[Literal["auto"], float, None] = "auto") -> "HandPoseSequence":
+        """
+        Join sequences one after another.
+
+        Parameters
+        ----------
+        sequences : sequence of HandPoseSequence
+            The clips to join, in order.
+        offset : 'auto', float or None, default='auto'
+            How to place the clips in time. 'auto' shifts each clip to start when the
+            previous one ends (the last `end_time` so far); a float does the same and
+            leaves that many seconds of gap between clips; None keeps every time as it is.
+
+        Returns
+        -------
+        HandPoseSequence
+            A new sequence with copies of every frame, each column filled in one allocation.
+
+        Raises
+        ------
+        ValueError
+            If `offset` is None and the clips overlap in time (use `merge` for that).
+        """
+        columns = [seq._columns() for seq in sequences]
+        lengths = np.array([len(c[1]) for c in columns], dtype=np.intp)
+        row_starts = np.concatenate([[0], np.cumsum(lengths)]).astype(np.intp)
+        points, start_times, end_times, sides, names = _scatter_columns(
+            columns, [slice(row_starts[k], row_starts[k + 1]) for k in range(len(columns))]
+        )
+
+        if offset is not None:
+            gap = 0.0 if offset == "auto" else float(offset)
+            clip_end = None
+            for k, c in enumerate(columns):
+                if not lengths[k]:
+                    continue
+                rows = slice(row_starts[k], row_starts[k + 1])
+                shift = 0.0 if clip_end is None else clip_end + gap - c[1][0]
+                start_times[rows] += shift
+                end_times[rows] += shift
+                clip_end = end_times[rows].max()
+        elif np.any(np.diff(start_times) < 0):
+            raise ValueError("Sequences overlap in time; use HandPoseSequence.merge to interleave them")
+
+        return cls.from_arrays(points, start_times, end_times, sides, names, copy=False)
+
+    @classmethod
+    def merge(cls, sequences: Sequence["HandPoseSequence"],
+              return_sources: bool = False) -> Union["HandPoseSequence", Tuple["HandPoseSequence", np.ndarray]]:
+        """
+        Interleave sequences by start time, e.g. streams of several cameras.
+
+        The sequences, each already sorted by start time, are k-way merged in
+        O(n log k). Frames with equal start times keep the order of `sequences`.
+
+        Parameters
+        ----------
+        sequences : sequence of HandPoseSequence
+            The streams to merge. Times are kept as they are.
+        return_sources : bool, default=False
+            Also return where each merged frame came from.
+
+        Returns
+        -------
+        HandPoseSequence
+            A new sequence with copies of every frame, each column filled in one allocation.
+        np.ndarray, optional
+            If `return_sources`, an (n, 2) int array of (index into `sequences`, frame
+            index within that sequence) per merged frame.
+        """
+        columns = [seq._columns() for seq in sequences]
+        lengths = np.array([len(c[1]) for c in columns], dtype=np.intp)
+        row_starts = np.concatenate([[0], np.cumsum(lengths)]).astype(np.intp)
+        n = int(row_starts[-1])
+
+        # Merge (start time, global row) pairs; the global row breaks ties by input order
+        streams = [zip(c[1].tolist(), range(row_starts[k], row_starts[k + 1])) for k, c in enumerate(columns)]
+        order = np.fromiter((row for _, row in heapq.merge(*streams)), dtype=np.intp, count=n)
+        destination = np.empty(n, dtype=np.intp)
+        destination[order] = np.arange(n)
+
+        merged = cls.from_arrays(*_scatter_columns(
+            columns, [destination[row_starts[k]:row_starts[k + 1]] for k in range(len(columns))]
+        ), copy=False)
+        if not return_sources:
+            return merged
+        source = np.repeat(np.arange(len(columns)), lengths)[order]
+        return merged, np.stack([source, order - row_starts[source]], axis=1)
+
+    # --- Columns ---
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        The (T, 21, 3) float64 array holding every frame's landmarks, in time order.
+
+        This is a view onto the sequence's own storage, not a copy. Appending to the
+        sequence may move its storage, after which older views no longer track it.
+        While recording into a ring buffer, it is a copy instead (see the class notes).
+        """
+        return self._column(0)
+
+    @property
+    def start_times(self) -> np.ndarray:
+        """The (T,) array of frame start times in seconds (a view, like `array`)."""
+        return self._column(1)
+
+    @property
+    def end_times(self) -> np.ndarray:
+        """
+        The (T,) array of frame end times in seconds (a view, like `array`).
+
+        Time lookups keep their own running maximum of these times, so frames made
+        longer by editing this array in place may be missed; use `from_arrays` to build
+        a sequence with new end times instead.
+        """
+        return self._column(2)
+
+    @property
+    def sides(self) -> np.ndarray:
+        """The (T,) object array of each frame's handedness (a view, like `array`)."""
+        return self._column(3)
+
+    @property
+    def names(self) -> np.ndarray:
+        """The (T,) object array of each frame's pose name (a view, like `array`)."""
+        return self._column(4)
+
+    @property
+    def sequence(self) -> List[TimedHandPose]:
+        """
+        The ordered list of timed poses.
+
+        The list is built on every access: poses are views onto the sequence's storage
+        (copies in ring-buffer mode), times are copies.
+        """
+        columns = self._columns()
+        return [self._timed(i, columns) for i in range(len(columns[0]))]
+
+    def _pose(self, i: int, columns=None) -> HandPose:
+        points, _, _, sides, names = columns or self._columns()
+        template = self._custom_poses.get(i)
+        if template is None:
+            return HandPose.from_array(points[i], sides[i], names[i], copy=False)
+        pose = copy.copy(template)
+        pose._array = points[i]
+        pose._coordinates = None
+        pose.side = sides[i]
+        pose.name = names[i]
+        return pose
+
+    def _timed(self, i: int, columns=None) -> TimedHandPose:
+        columns = columns or self._columns()
+        return TimedHandPose(self._pose(i, columns), float(columns[1][i]), float(columns[2][i]))
+
+    @staticmethod
+    def _check_index(index: int, n: int) -> int:
+        if not -n <= index < n:
+            raise IndexError("HandPoseSequence index out of range")
+        return index % n
+
+    # --- Access ---
 
     def get_pose_at_time(self, timestamp: float) -> Optional[HandPose]:
         """
         Get the hand pose active at a given timestamp.
 
+        The frame is found by binary search over `start_times`, in O(log T). Where frames
+        overlap (e.g. after `merge`), an earlier, longer frame may still be active after
+        the last one started has ended; the sequence keeps the running maximum of the end
+        times to tell, and only then steps back to that frame.
+
         Parameters
         ----------
         timestamp : float
@@ -72,12 +670,142 @@ class HandPoseSequence:
         -------
         HandPose or None
             The hand pose active at the specified time, or None if no
-            pose was active.
+            pose was active. If frames overlap, the one that started last wins.
+        """
+        def locate(columns):
+            index = int(_active_indices(columns[1], columns[2], columns[5], [timestamp])[0])
+            return index if index >= 0 else None
+
+        columns, index = self._locate(locate)
+        return None if index is None else self._pose(index, columns)
+
+    def get_indices_at_times(self, timestamps) -> np.ndarray:
+        """
+        Find the frame active at each of many timestamps at once.
+
+        Parameters
+        ----------
+        timestamps : float or array-like of float
+            Query times in seconds, in any order.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of the same shape as `timestamps`, holding the index of the frame
+            whose [start_time, end_time) contains each query, or -1 where no frame is active.
+        """
+        _, start_times, end_times, _, _, end_reach = self._columns(reach=True)
+        return _active_indices(start_times, end_times, end_reach, timestamps)
+
+    def get_poses_at_times(self, timestamps) -> HandPoseBatch:
+        """
+        Get the poses active at many timestamps at once.
+
+        Parameters
+        ----------
+        timestamps : array-like of float
+            Query times in seconds, in any order.
+
+        Returns
+        -------
+        HandPoseBatch
+            One row per query, copied from the active frame. Rows for times where no
+            frame is active are filled with NaN and have no side or name.
+
+        See Also
+        --------
+        get_indices_at_times : The frame indices behind this lookup.
+        """
+        columns = self._columns(reach=True)
+        indices = _active_indices(columns[1], columns[2], columns[5], np.atleast_1d(timestamps))
+        found = indices >= 0
+
+        points = np.full((len(indices), 21, 3), np.nan)
+        points[found] = columns[0][indices[found]]
+        batch = HandPoseBatch.from_array(points, copy=False)
+        batch.sides[found] = columns[3][indices[found]]
+        batch.names[found] = columns[4][indices[found]]
+        return batch
+
+    def slice_time(self, start: float, end: float) -> "HandPoseSequence":
+        """
+        Get the frames that start within a time range, without copying.
+
+        Parameters
+        ----------
+        start : float
+            Start of the range in seconds (inclusive).
+        end : float
+            End of the range in seconds (exclusive).
+
+        Returns
+        -------
+        HandPoseSequence
+            A sequence whose columns are views onto this one: editing its poses edits
+            this sequence. Times keep their original values.
+        """
+        columns = self._columns(reach=True)
+        first, stop = np.searchsorted(columns[1], [start, end], side="left")
+        return self._view(int(first), int(max(first, stop)), columns=columns)
+
+    def windows(self, size: int, stride: int = 1) -> np.ndarray:
+        """
+        Overlapping fixed-size windows of the landmarks, without copying.
+
+        Parameters
+        ----------
+        size : int
+            Frames per window.
+        stride : int, default=1
+            Frames between the starts of consecutive windows.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only strided view of shape (W, size, 21, 3), where window w holds frames
+            [w * stride, w * stride + size). W = (T - size) // stride + 1, or 0 when the
+            sequence is shorter than `size`. See `window_times` for the matching times.
+
+        Raises
+        ------
+        ValueError
+            If `size` or `stride` is less than 1.
+        """
+        return _sliding_windows(self.array, size, stride)
+
+    def window_times(self, size: int, stride: int = 1) -> np.ndarray:
+        """
+        Start times of the frames in each of `windows(size, stride)`, without copying.
+
+        Returns
+        -------
+        np.ndarray
+            Read-only strided view of shape (W, size).
+        """
+        return _sliding_windows(self.start_times, size, stride)
+
+    def iter_chunks(self, chunk_size: int = 4096) -> Iterator["HandPoseSequence"]:
         """
-        for timed_pose in self.sequence:
-            if timed_pose.start_time <= timestamp < timed_pose.end_time:
-                return timed_pose.pose
-        return None
+        Iterate over consecutive runs of at most `chunk_size` frames, without copying.
+
+        Each chunk is a view (see `__getitem__`), so iterating over a memory-mapped
+        sequence (see `DataReader.open_pose_library`) only pages in one chunk at a time.
+
+        Parameters
+        ----------
+        chunk_size : int, default=4096
+            Frames per chunk (the last one may be smaller).
+
+        Yields
+        ------
+        HandPoseSequence
+            Views of frames [k * chunk_size, (k + 1) * chunk_size).
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        columns = self._columns(reach=True)
+        for start in range(0, len(columns[0]), chunk_size):
+            yield self._view(start, min(start + chunk_size, len(columns[0])), columns=columns)
 
     def get_all_timestamps(self) -> List[float]:
         """
@@ -88,7 +816,7 @@ class HandPoseSequence:
         list of float
             List of all pose start times in seconds.
         """
-        return [tp.start_time for tp in self.sequence]
+        return self.start_times.tolist()
 
     def get_pose_by_index(self, index: int) -> HandPose:
         """
@@ -102,14 +830,15 @@ class HandPoseSequence:
         Returns
         -------
         HandPose
-            The pose at the given index.
+            The pose at the given index, viewing the sequence's storage.
 
         Raises
         ------
         IndexError
             If the index is out of range.
         """
-        return self.sequence[index].pose
+        columns, index = self._locate(lambda columns: self._check_index(index, len(columns[0])))
+        return self._pose(index, columns)
 
     @property
     def current_pose(self) -> Optional[HandPose]:
@@ -124,25 +853,75 @@ class HandPoseSequence:
         HandPose or None
             The latest recorded pose, or None if the sequence is empty.
         """
-        if self.sequence:
-            return self.sequence[-1].pose
-        return None
+        columns, index = self._locate(lambda columns: len(columns[0]) - 1 if len(columns[0]) else None)
+        return None if index is None else self._pose(index, columns)
 
-    def __getitem__(self, index: int) -> TimedHandPose:
+    def __getitem__(self, index):
         """
-        Get a timed pose by its index.
+        Get a timed pose by its index, or a range of frames.
 
         Parameters
         ----------
-        index : int
-            Index of the timed pose.
+        index : int or slice
+            Index of the timed pose, or a slice of frames.
 
         Returns
         -------
-        TimedHandPose
-            The timed pose at the given index.
+        TimedHandPose or HandPoseSequence
+            The timed pose at the given index. For a slice, a new sequence sharing
+            this sequence's storage (a copy in ring-buffer mode).
         """
-        return self.sequence[index]
+        if isinstance(index, slice):
+            columns = self._columns(reach=True)
+            return self._view(*index.indices(len(columns[0])), columns=columns)
+        columns, index = self._locate(lambda columns: self._check_index(index, len(columns[0])))
+        return self._timed(index, columns)
+
+    def _view(self, start: int, stop: int, step: int = 1, columns=None) -> "HandPoseSequence":
+        """Return a sequence whose columns are views onto frames [start:stop:step] of this one."""
+        points, start_times, end_times, sides, names, end_reach = columns or self._columns(reach=True)
+        rows = slice(start, stop, step)
+        # The running maximum over this sequence's frames bounds the view's own from above
+        view = HandPoseSequence._from_columns(points[rows], start_times[rows], end_times[rows],
+                                              sides[rows], names[rows], end_reach[rows])
+        for new_row, old_row in enumerate(range(*rows.indices(len(points)))):
+            if old_row in self._custom_poses:
+                view._custom_poses[new_row] = self._custom_poses[old_row]
+        return view
+
+    def resample(self, fps: float, method: Literal["linear", "nearest", "cubic"] = "linear") -> "HandPoseSequence":
+        """
+        Resample the sequence onto evenly spaced timestamps.
+
+        All 63 coordinates of every frame are interpolated at once over `start_times`,
+        which smooths out the jitter of recorded timestamps.
+
+        Parameters
+        ----------
+        fps : float
+            Frame rate of the output. Frames start at this sequence's first start time
+            and are spaced 1/fps apart, up to its last start time.
+        method : {'linear', 'nearest', 'cubic'}, default='linear'
+            Interpolation between recorded frames. 'cubic' uses a Catmull-Rom style
+            Hermite spline that accounts for uneven frame spacing.
+
+        Returns
+        -------
+        HandPoseSequence
+            A new sequence. Each frame takes its side and name from the nearest recorded
+            frame, and ends when the next one starts.
+
+        See Also
+        --------
+        resample_sequences : Resample many sequences of different lengths in one pass.
+        """
+        return resample_sequences([self], fps, method)[0]
+
+    def __iter__(self) -> Iterator[TimedHandPose]:
+        # Iterates over the frames present when iteration started
+        columns = self._columns()
+        for i in range(len(columns[0])):
+            yield self._timed(i, columns)
 
     def __len__(self) -> int:
         """
@@ -153,7 +932,7 @@ class HandPoseSequence:
         int
             Number of timed poses.
         """
-        return len(self.sequence)
+        return self._published[6]
 
     def __str__(self) -> str:
         """
@@ -164,74 +943,503 @@ class HandPoseSequence:
         str
             Human-readable description of the sequence.
         """
-        return f"<HandPoseSequence with {len(self.sequence)} poses>"
+        return f"<HandPoseSequence with {len(self)} poses>"
+
+    # --- Recording ---
 
-    def start_recording(self, get_pose_fn: Callable[[], Optional[HandPose]], fps: int = 30):
+    def start_recording(self, get_pose_fn: Callable[[], Optional[HandPose]], fps: int = 30,
+                        max_frames: Optional[int] = None, max_duration: Optional[float] = None, sink=None):
         """
         Start recording poses from a callable source at a fixed frame rate.
 
+        Frames are scheduled against deadlines on the monotonic `time.perf_counter` clock,
+        so the frame rate does not drift. If `get_pose_fn` is too slow to keep up, the
+        missed frames are skipped and counted in `recording_stats`.
+
         Parameters
         ----------
         get_pose_fn : callable
             A function returning a `HandPose` or None when no pose is available.
         fps : int, default=30
-            Frames per second to capture.
+            Frames per second to capture. Recorded frames last 1/fps seconds.
+        max_frames : int, optional
+            Keep only the most recent `max_frames` frames.
+        max_duration : float, optional
+            Keep only the frames of the last `max_duration` seconds.
+            With either limit, the sequence becomes a ring buffer in preallocated storage
+            that stays the same size however long recording runs; use `snapshot` to read
+            it consistently while recording. Once recording stops, the kept frames are
+            compacted into ordinary storage.
+        sink : SequenceWriter, optional
+            Also append every recorded frame to this writer (any object with an
+            `append(pose, start_time)` method, a `frame_duration` attribute and a `close()`
+            method), e.g. to stream the recording to disk. Combined with `max_frames` or
+            `max_duration`, long recordings run in constant memory. The sink is closed
+            by `stop_recording`.
 
         Notes
         -----
         Recording is performed in a background thread and continues until
-        `stop_recording` is called.
+        `stop_recording` is called. Timestamps are the moments `get_pose_fn` was
+        called, in seconds since recording started.
         """
         if self._recording:
             print("[!] Already recording.")
             return
-
-        self._recording = True
-        self._record_start_time = time.time()
-        interval = 1.0 / fps
+        clock = self._begin_recording(fps, max_frames, max_duration, sink)
 
         def _record_loop():
             print(f"[HandPoseSequence] Started recording at {fps} FPS.")
             while self._recording:
-                start = time.time()
-                current_time = start - self._record_start_time
+                wait = clock.wait_time()
+                if wait > 0:
+                    time.sleep(wait)
+                captured_at = clock.now()
                 pose = get_pose_fn()
+                latency = clock.now() - captured_at
                 if pose:
-                    self._append_pose(pose, current_time)
-                elapsed = time.time() - start
-                time.sleep(max(0, interval - elapsed))
+                    self._append_pose(pose, captured_at)
+                    if sink is not None:
+                        sink.append(pose, captured_at)
+                clock.record_tick(captured_at, latency, recorded=bool(pose))
+            clock.stop_time = time.perf_counter()
             print("[HandPoseSequence] Stopped recording.")
 
         self._recording_thread = threading.Thread(target=_record_loop, daemon=True)
         self._recording_thread.start()
 
+    def record_async(self, source, fps: float = 30, max_frames: Optional[int] = None,
+                     max_duration: Optional[float] = None, sink=None, max_pending: Optional[int] = None):
+        """
+        Record poses from an asynchronous source, without a thread.
+
+        Must be called from a coroutine, i.e. with a running event loop. The session
+        starts when `record_async` is called, so an `async for` over the sequence started
+        right after it waits for the recorded frames. Recording runs in the returned task
+        until the source is exhausted, `stop_recording` is called, or the task is
+        cancelled, so hundreds of sessions can run as tasks of one event loop.
+
+        Parameters
+        ----------
+        source : async iterable or async callable
+            Either an async iterable of poses (e.g. decoded websocket messages), recorded
+            as they arrive, or an async function returning a `HandPose` or None, which is
+            polled at `fps` on the same deadline schedule as `start_recording`.
+            None items are counted as empty frames.
+        fps : float, default=30
+            Polling rate for async callables. For async iterables it only sets the
+            duration of the last frame and the capacity of a `max_duration` ring buffer.
+        max_frames, max_duration, sink
+            As in `start_recording`.
+        max_pending : int, optional
+            Backpressure: stop pulling from `source` while an `async for` consumer of this
+            sequence (in the same event loop) is this many frames behind. By default the
+            source is never paused.
+
+        Returns
+        -------
+        asyncio.Task
+            The task running the recording loop. Await it to wait for the session to
+            finish. Cancelling it, even before it first runs, ends the session once the
+            task is done.
+
+        Raises
+        ------
+        RuntimeError
+            If the sequence is already recording, or no event loop is running.
+
+        Notes
+        -----
+        Timestamps are the moments frames arrived (async iterables) or polls started
+        (async callables), in seconds since recording started. For async iterables,
+        `recording_stats` counts frames but not slots or latencies.
+        """
+        if self._recording:
+            raise RuntimeError("HandPoseSequence is already recording")
+        loop = asyncio.get_running_loop()
+        if hasattr(source, "__aiter__"):
+            frames = source.__aiter__()
+        elif callable(source):
+            frames = None
+        else:
+            raise TypeError("source must be an async iterable or an async callable")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        clock = self._begin_recording(fps, max_frames, max_duration, sink)
+        self._recording_async = True
+        self._consumer_advanced = asyncio.Event()
+        task = loop.create_task(self._record_async_loop(source, frames, clock, sink, max_pending))
+        # A task cancelled before its first step never enters the loop's `finally`
+        task.add_done_callback(lambda _: self._end_async_recording(clock))
+        return task
+
+    async def _record_async_loop(self, source, frames, clock: "_RecordingClock", sink, max_pending: Optional[int]):
+        print(f"[HandPoseSequence] Started recording at {clock.fps} FPS.")
+        try:
+            while self._recording:
+                if max_pending is not None:
+                    await self._wait_for_consumers(max_pending)
+                if frames is not None:
+                    try:
+                        pose = await frames.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    captured_at = clock.now()
+                else:
+                    wait = clock.wait_time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    captured_at = clock.now()
+                    pose = await source()
+                    latency = clock.now() - captured_at
+                if not self._recording:
+                    break
+                if pose:
+                    self._append_pose(pose, captured_at)
+                    if sink is not None:
+                        sink.append(pose, captured_at)
+                if frames is not None:
+                    clock.record_arrival(recorded=bool(pose))
+                else:
+                    clock.record_tick(captured_at, latency, recorded=bool(pose))
+        finally:
+            self._end_async_recording(clock)
+
+    def _end_async_recording(self, clock: "_RecordingClock"):
+        """Finish the `record_async` session of `clock`, unless that has already happened."""
+        if clock.stop_time is not None:
+            return
+        clock.stop_time = time.perf_counter()
+        self._recording = False
+        self._recording_async = False
+        self._consumer_advanced = None
+        self._finish_recording()
+        print("[HandPoseSequence] Stopped recording.")
+
+    def __aiter__(self):
+        """
+        Asynchronously iterate over the frames, including those recorded from now on.
+
+        Yields every frame already in the sequence, then each new frame as it is
+        recorded (by `start_recording` or `record_async`), and ends once recording has
+        stopped and every frame has been yielded. In a ring buffer, frames dropped before
+        a slow consumer reached them are skipped; `record_async(max_pending=...)` pauses
+        the source instead.
+
+        Example
+        -------
+        >>> recording = asyncio.create_task(seq.record_async(websocket_poses()))
+        >>> async for frame in seq:
+        ...     handle(frame.pose, frame.start_time)
+        """
+        return self._iter_frames_async()
+
+    async def _iter_frames_async(self):
+        loop = asyncio.get_running_loop()
+        seen = self.first_frame_index - 1
+        key = object()
+        self._consumers[key] = seen
+        try:
+            while True:
+                first, new = self._frames_after(seen)
+                for i in range(len(new)):
+                    yield new._timed(i)
+                    seen = first + i
+                    self._advance_consumer(key, seen)
+                with self._new_frame:
+                    if self.latest_frame_index > seen:
+                        continue
+                    if not self._recording:
+                        return
+                    future = loop.create_future()
+                    self._frame_waiters.append((loop, future))
+                await future
+        finally:
+            del self._consumers[key]
+            self._advance_consumer(None, None)
+
+    def _advance_consumer(self, key, seen):
+        if key is not None:
+            self._consumers[key] = seen
+        if self._consumer_advanced is not None:
+            self._consumer_advanced.set()
+
+    async def _wait_for_consumers(self, max_pending: int):
+        while self._recording and self._consumers:
+            if self.latest_frame_index - min(self._consumers.values()) < max_pending:
+                return
+            self._consumer_advanced.clear()
+            await self._consumer_advanced.wait()
+
+    def _begin_recording(self, fps: float, max_frames: Optional[int], max_duration: Optional[float],
+                         sink) -> "_RecordingClock":
+        clock = _RecordingClock(fps)
+        if max_frames is not None or max_duration is not None:
+            self._configure_ring(max_frames, max_duration, fps)
+        if sink is not None:
+            sink.frame_duration = clock.interval
+        self._clock = clock
+        self._sink = sink
+        self._frame_duration = clock.interval
+        self._recording = True
+        self._record_start_time = clock.start
+        return clock
+
+    def _finish_recording(self):
+        """
+        Leave ring-buffer mode, settle end times, close the sink and wake waiters once
+        recording has stopped.
+        """
+        self._release_ring()
+        self._fix_end_times()
+        sink, self._sink = self._sink, None
+        if sink is not None:
+            sink.close()
+        self._notify_new_frame()
+
+    def snapshot(self, last_seconds: Optional[float] = None) -> "HandPoseSequence":
+        """
+        Take a consistent copy of the sequence, safe to call while recording.
+
+        Parameters
+        ----------
+        last_seconds : float, optional
+            Only copy the frames that started within this many seconds of the newest frame.
+            By default every frame is copied.
+
+        Returns
+        -------
+        HandPoseSequence
+            An independent sequence. If a frame was appended during the copy, the copy is
+            retried, so it never contains a half-written frame.
+        """
+        points, start_times, end_times, sides, names = self._read(self._columns_of, copy=True)
+        first = 0
+        if last_seconds is not None and len(start_times):
+            first = int(np.searchsorted(start_times, start_times[-1] - last_seconds, side="left"))
+        rows = slice(first, None)
+        return HandPoseSequence.from_arrays(points[rows], start_times[rows], end_times[rows],
+                                            sides[rows], names[rows], copy=False)
+
+    @property
+    def recording_stats(self) -> Optional[RecordingStats]:
+        """
+        Timing statistics of the current (or last) recording session.
+
+        Returns
+        -------
+        RecordingStats or None
+            A snapshot of the statistics, or None if this sequence was never recorded into.
+        """
+        return self._clock.snapshot() if self._clock is not None else None
+
+    # --- Waiting for frames ---
+
+    @property
+    def latest_frame_index(self) -> int:
+        """
+        Absolute index of the newest frame, counting every frame ever appended.
+
+        Unlike positions in the sequence, absolute indices do not shift when a ring buffer
+        drops old frames. -1 while the sequence is empty.
+        """
+        return self._published[7] - 1
+
+    @property
+    def first_frame_index(self) -> int:
+        """Absolute index of the oldest frame still in the sequence (`seq[0]`)."""
+        published = self._published
+        return published[7] - published[6]
+
+    def frames_after(self, after_index: int) -> "HandPoseSequence":
+        """
+        View of the frames whose absolute index is greater than `after_index`.
+
+        Parameters
+        ----------
+        after_index : int
+            Absolute index of the last frame already seen, e.g. as returned by
+            `wait_for_new_frame`. Use -1 for every frame.
+
+        Returns
+        -------
+        HandPoseSequence
+            A view of the newer frames still in the sequence (see `__getitem__`).
+        """
+        return self._frames_after(after_index)[1]
+
+    def _frames_after(self, after_index: int):
+        """`frames_after`, plus the absolute index of the first frame of the view."""
+        def select(published):
+            columns = self._columns_of(published, reach=True)
+            first = published[7] - published[6]
+            start = min(max(after_index + 1 - first, 0), published[6])
+            if self._ring_capacity is not None:  # Only the new frames get copied
+                return first + start, 0, tuple(column[start:] for column in columns)
+            return first + start, start, columns
+
+        first, start, columns = self._read(select)
+        return first, self._view(start, len(columns[0]), columns=columns)
+
+    def wait_for_new_frame(self, after_index: Optional[int] = None,
+                           timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Block until a frame newer than `after_index` has been appended.
+
+        Parameters
+        ----------
+        after_index : int, optional
+            Absolute index of the last frame already seen. Defaults to the current
+            `latest_frame_index`, i.e. wait for the next frame.
+        timeout : float, optional
+            Give up after this many seconds. By default waits indefinitely.
+
+        Returns
+        -------
+        int or None
+            The `latest_frame_index` once it passes `after_index`, or None on timeout.
+
+        Example
+        -------
+        >>> seen = -1
+        >>> while True:
+        ...     latest = seq.wait_for_new_frame(seen, timeout=1.0)
+        ...     if latest is not None:
+        ...         process(seq.frames_after(seen))
+        ...         seen = latest
+        """
+        if after_index is None:
+            after_index = self.latest_frame_index
+        with self._new_frame:
+            arrived = self._new_frame.wait_for(lambda: self.latest_frame_index > after_index, timeout)
+        return self.latest_frame_index if arrived else None
+
+    async def wait_for_new_frame_async(self, after_index: Optional[int] = None,
+                                       timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Awaitable version of `wait_for_new_frame`, which does not block the event loop.
+
+        Parameters
+        ----------
+        after_index : int, optional
+            Absolute index of the last frame already seen. Defaults to the current
+            `latest_frame_index`.
+        timeout : float, optional
+            Give up after this many seconds. By default waits indefinitely.
+
+        Returns
+        -------
+        int or None
+            The `latest_frame_index` once it passes `after_index`, or None on timeout.
+        """
+        if after_index is None:
+            after_index = self.latest_frame_index
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._new_frame:
+                if self.latest_frame_index > after_index:
+                    return self.latest_frame_index
+                future = loop.create_future()
+                self._frame_waiters.append((loop, future))
+            try:
+                await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                with self._new_frame:
+                    if (loop, future) in self._frame_waiters:
+                        self._frame_waiters.remove((loop, future))
+                return None
+
     def stop_recording(self):
         """
         Stop an active recording session.
 
         Notes
         -----
-        This waits for the recording thread to finish and fixes the end
-        times for recorded poses.
+        This waits for the recording thread to finish, fixes the end
+        times for recorded poses and closes the recording's sink, if any.
+        A `record_async` session finishes the same way once its task
+        next resumes.
         """
         self._recording = False
-        if self._recording_thread:
-            self._recording_thread.join()
-        self._fix_end_times()
+        if self._recording_async:
+            return
+        thread, self._recording_thread = self._recording_thread, None
+        if thread:
+            thread.join()
+        self._finish_recording()
 
-    def _append_pose(self, pose: HandPose, start_time: float):
+    def _append_pose(self, pose: HandPose, start_time: float, end_time: Optional[float] = None):
         """
-        Append a new pose to the sequence with an estimated end time.
+        Append a new pose to the end of the sequence.
 
         Parameters
         ----------
         pose : HandPose
-            The pose to append.
+            The pose to append. Its landmarks are copied into the sequence; for a HandPose
+            subclass, a copy of its other attributes is kept as well. `pose` itself is
+            not modified or referenced afterwards.
         start_time : float
             The start time of the pose in seconds.
+        end_time : float, optional
+            The end time of the pose in seconds. Estimated as `start_time` plus one frame
+            at the recording frame rate (1/30 s when not recording) if omitted.
+
+        Notes
+        -----
+        Only one thread may append at a time. When `end_time` is omitted, the previous
+        frame's end time is set to `start_time`, so end times are already final while
+        recording. The new frame is published to readers, and `wait_for_new_frame`
+        callers are woken, once it is completely written.
         """
-        frame_duration = 1.0 / 30.0  # could make dynamic later
-        self.sequence.append(TimedHandPose(pose, start_time, start_time + frame_duration))
+        estimated = end_time is None
+        if estimated:
+            end_time = start_time + self._frame_duration
+        self._version += 1
+        if self._ring_capacity is None:
+            self._ensure_capacity(self._length + 1)
+        else:
+            if self._length == self._ring_capacity:
+                self._offset += 1  # Drop the oldest frame
+                self._length -= 1
+            if self._offset + self._length == len(self._start_times):
+                # End of storage: move the live window back to the front. The rows it is
+                # copied into are all older than the window, so the window itself is untouched.
+                window = slice(self._offset, self._offset + self._length)
+                for attr in self._COLUMNS:
+                    column = getattr(self, attr)
+                    column[:self._length] = column[window]
+                self._offset = 0
+
+        row = self._offset + self._length
+        self._points[row] = pose.array
+        self._start_times[row] = start_time
+        self._end_times[row] = end_time
+        if estimated and self._length:
+            self._end_times[row - 1] = start_time
+            self._end_reach[row - 1] = max(self._end_reach[row - 2], start_time) if self._length > 1 else start_time
+        self._end_reach[row] = max(self._end_reach[row - 1], end_time) if self._length else end_time
+        self._sides[row] = pose.side
+        self._names[row] = pose.name
+        if type(pose) is not HandPose and self._ring_capacity is None:
+            self._custom_poses[self._length] = _pose_template(pose)
+        self._length += 1
+        self._frames_appended += 1
+        self._trim_to_duration()
+        self._publish()
+        self._version += 1
+        self._notify_new_frame()
+
+    def _notify_new_frame(self):
+        with self._new_frame:
+            self._new_frame.notify_all()
+            waiters, self._frame_waiters = self._frame_waiters, []
+        latest = self._frames_appended - 1
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future, latest)
+            except RuntimeError:  # The waiter's event loop has been closed
+                pass
 
     def _fix_end_times(self):
         """
@@ -240,9 +1448,199 @@ class HandPoseSequence:
 
         Notes
         -----
-        For the last pose, the end time is estimated as `start_time + 1/30s`.
+        For the last pose, the end time is estimated as `start_time` plus one frame
+        at the recording frame rate. Recorded frames already get their end times as
+        they arrive, so this only settles the last one.
         """
-        for i in range(len(self.sequence) - 1):
-            self.sequence[i].end_time = self.sequence[i + 1].start_time
-        if self.sequence:
-            self.sequence[-1].end_time = self.sequence[-1].start_time + 1.0 / 30.0
+        starts, ends = self.start_times, self.end_times
+        if len(starts):
+            ends[:-1] = starts[1:]
+            ends[-1] = starts[-1] + self._frame_duration
+            self._refresh_end_reach()
+
+
+def _pose_template(pose: HandPose) -> HandPose:
+    """
+    Deep copy of a HandPose subclass instance without its landmarks, from which
+    `HandPoseSequence._pose` rebuilds the instance over a row of the sequence.
+    """
+    return copy.deepcopy(pose, {id(pose._array): None, id(pose._coordinates): None})
+
+
+def _scatter_columns(columns, destinations):
+    """
+    Allocate output columns for every frame of `columns` (one (points, start_times,
+    end_times, sides, names) tuple per sequence) and copy sequence k's frames to rows
+    `destinations[k]`.
+    """
+    n = sum(len(c[1]) for c in columns)
+    output = (np.empty((n, 21, 3), dtype=np.float64), np.empty(n, dtype=np.float64),
+              np.empty(n, dtype=np.float64), np.empty(n, dtype=object), np.empty(n, dtype=object))
+    for c, rows in zip(columns, destinations):
+        for out, column in zip(output, c):
+            out[rows] = column
+    return output
+
+
+def _active_indices(start_times: np.ndarray, end_times: np.ndarray, end_reach: np.ndarray,
+                    timestamps) -> np.ndarray:
+    """
+    Index of the frame whose [start_time, end_time) contains each timestamp, or -1.
+
+    Binary search finds the latest frame started by each timestamp. If that frame has
+    already ended, an earlier, longer frame may still be active when frames overlap:
+    `end_reach`, the running maximum of `end_times` (or any upper bound of it), tells
+    whether one can be, and only then is it searched for by stepping back. Where several
+    frames are active, the one that started last wins.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    indices = np.atleast_1d(np.searchsorted(start_times, timestamps, side="right") - 1)
+    flat = np.atleast_1d(timestamps)
+    if not len(end_times):
+        return np.full(timestamps.shape, -1, dtype=np.intp)
+    candidates = np.maximum(indices, 0)
+    active = (indices >= 0) & (flat < end_times[candidates])
+    behind = (indices >= 0) & ~active & (flat < end_reach[candidates])
+    if behind.any():
+        back, times = indices[behind], flat[behind]
+        pending = np.ones(len(back), dtype=bool)
+        while pending.any():
+            back[pending] -= 1
+            pending &= back >= 0
+            pending[pending] = end_times[back[pending]] <= times[pending]
+        indices[behind] = back
+        active[behind] = back >= 0
+    return np.where(active, indices, -1).reshape(timestamps.shape)
+
+
+def _sliding_windows(array: np.ndarray, size: int, stride: int) -> np.ndarray:
+    """Windows of `size` rows every `stride` rows of `array`, as a (W, size, ...) view."""
+    if size < 1 or stride < 1:
+        raise ValueError("Window size and stride must be at least 1")
+    if len(array) < size:
+        return np.empty((0, size) + array.shape[1:], dtype=array.dtype)
+    windows = sliding_window_view(array, size, axis=0)[::stride]  # (W, ..., size)
+    return np.moveaxis(windows, -1, 1)
+
+
+def _copy_arrays(value):
+    """Copy every array in `value`, an array or a (nested) tuple of arrays and scalars."""
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_arrays(item) for item in value)
+    return value
+
+
+def _resolve_future(future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def _interpolate_frames(times: np.ndarray, points: np.ndarray, targets: np.ndarray,
+                        first: np.ndarray, last: np.ndarray, method: str):
+    """
+    Interpolate (T, 21, 3) `points` sampled at sorted `times` at each of `targets`.
+
+    `first` and `last` give, per target, the row range it may draw from, so that several
+    sequences laid end to end in one array are never blended together.
+
+    Returns the interpolated (K, 21, 3) points and, per target, the nearest source row.
+    """
+    i = np.searchsorted(times, targets, side="right") - 1
+    i = np.clip(i, first, np.maximum(last - 1, first))
+    j = np.minimum(i + 1, last)
+    h = times[j] - times[i]
+    w = np.divide(targets - times[i], h, out=np.zeros_like(targets), where=h > 0)
+    w = np.clip(w, 0.0, 1.0)
+    nearest = np.where(w < 0.5, i, j)
+
+    if method == "nearest":
+        return points[nearest], nearest
+    if method == "linear":
+        w = w[:, None, None]
+        return points[i] + w * (points[j] - points[i]), nearest
+
+    # Cubic Hermite with finite-difference (Catmull-Rom) tangents over uneven spacing
+    k = np.maximum(i - 1, first)
+    m = np.minimum(j + 1, last)
+
+    def tangent(a, b):
+        dt = (times[b] - times[a])[:, None, None]
+        return np.divide(points[b] - points[a], dt, out=np.zeros((len(a), 21, 3)), where=dt > 0)
+
+    w2, w3 = w * w, w * w * w
+    h00 = (2 * w3 - 3 * w2 + 1)[:, None, None]
+    h10 = ((w3 - 2 * w2 + w) * h)[:, None, None]
+    h01 = (-2 * w3 + 3 * w2)[:, None, None]
+    h11 = ((w3 - w2) * h)[:, None, None]
+    return h00 * points[i] + h10 * tangent(k, j) + h01 * points[j] + h11 * tangent(i, m), nearest
+
+
+def resample_sequences(sequences: List[HandPoseSequence], fps: float,
+                       method: Literal["linear", "nearest", "cubic"] = "linear") -> List[HandPoseSequence]:
+    """
+    Resample several sequences onto evenly spaced timestamps in a single pass.
+
+    The sequences may have different lengths and time ranges. They are laid end to end
+    in one array (with their times offset so they cannot overlap) and interpolated
+    together, as in `HandPoseSequence.resample`.
+
+    Parameters
+    ----------
+    sequences : list of HandPoseSequence
+        The sequences to resample.
+    fps : float
+        Frame rate of the outputs.
+    method : {'linear', 'nearest', 'cubic'}, default='linear'
+        Interpolation between recorded frames.
+
+    Returns
+    -------
+    list of HandPoseSequence
+        One resampled sequence per input, in order.
+
+    Raises
+    ------
+    ValueError
+        If `fps` is not positive or `method` is unknown.
+    """
+    if fps <= 0:
+        raise ValueError("fps must be positive")
+    if method not in ("linear", "nearest", "cubic"):
+        raise ValueError(f"Unknown resampling method '{method}'; use 'linear', 'nearest' or 'cubic'.")
+
+    # Per-sequence layout: source rows [row_start, row_start + length), output frame counts,
+    # and a time offset that places each sequence after the previous one
+    columns = [seq._columns() for seq in sequences]  # One consistent view per sequence, even while recording
+    lengths = np.array([len(c[1]) for c in columns], dtype=np.intp)
+    firsts = np.array([c[1][0] if len(c[1]) else 0.0 for c in columns])
+    spans = np.array([c[1][-1] - c[1][0] if len(c[1]) else 0.0 for c in columns])
+    counts = np.where(lengths > 0, np.floor(spans * fps + 1e-9).astype(np.intp) + 1, 0)
+    row_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.intp)
+    offsets = np.concatenate([[0.0], np.cumsum(spans + 1.0)[:-1]])
+
+    if lengths.sum() == 0:
+        return [HandPoseSequence() for _ in sequences]
+    times = np.concatenate([c[1] - first + offset for c, first, offset in zip(columns, firsts, offsets)])
+    points = np.concatenate([c[0] for c in columns])
+    sides = np.concatenate([c[3] for c in columns])
+    names = np.concatenate([c[4] for c in columns])
+
+    owner = np.repeat(np.arange(len(sequences)), counts)  # source sequence of each output frame
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    targets = offsets[owner] + local / fps
+    first = row_starts[owner]
+    last = first + lengths[owner] - 1
+
+    resampled, nearest = _interpolate_frames(times, points, targets, first, last, method)
+
+    results = []
+    for index, (start, count) in enumerate(zip(np.cumsum(counts) - counts, counts)):
+        rows = slice(start, start + count)
+        start_times = firsts[index] + local[rows] / fps
+        results.append(HandPoseSequence.from_arrays(
+            resampled[rows], start_times, start_times + 1.0 / fps,
+            sides[nearest[rows]], names[nearest[rows]], copy=False
+        ))
+    return results
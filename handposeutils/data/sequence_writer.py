@@ -0,0 +1,465 @@
+# sequence_writer.py
+# Append-only storage for hand pose sequences (binary chunks or JSON Lines), written incrementally while recording.
+from __future__ import annotations
+from typing import BinaryIO, Iterator, Optional, Tuple
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+import numpy as np
+
+from .data_reader import DataReader
+from .handpose import HandPose
+from .handpose_sequence import HandPoseSequence
+
+# File layout:
+#   header : MAGIC (6 bytes) + format version (uint16)
+#   chunk  : payload length (uint32) + CRC32 of the payload (uint32) + payload
+#   payload: frame count n (uint32), n*21*3 float64 landmarks, n float64 start times,
+#            n float64 end times, then a UTF-8 JSON list [sides, names, last_end_open]
+#            (last_end_open: the last end time is an estimate, superseded by the next
+#            chunk's first start time; lists without it are read as false)
+# All integers and floats are little-endian.
+MAGIC = b"HPSEQ\x00"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sH")
+_CHUNK_HEADER = struct.Struct("<II")
+_COUNT = struct.Struct("<I")
+
+
+class SequenceWriter:
+    """
+    Appends hand pose frames to a binary file in self-contained, checksummed chunks.
+
+    Frames are collected in memory until a chunk is full (or `flush_interval` seconds
+    have passed since the chunk was started, even if no frame arrives meanwhile). A
+    background thread then takes the chunk, swapping in an empty one, and encodes,
+    writes and syncs it to disk, so `append` never waits for the disk. While that thread
+    is still writing, the next chunk stays open and keeps collecting frames, up to
+    `max_buffered_frames`; further frames are dropped and counted in `frames_dropped`.
+    Memory use is therefore bounded however long the recording runs.
+
+    If the process crashes, the frames not yet on disk are lost: those of the open chunk
+    (`chunk_frames` frames, or `flush_interval` seconds' worth, unless the disk has
+    fallen behind) plus, at most, the one closed chunk the background thread is writing.
+
+    A writer can be passed as the `sink` of `HandPoseSequence.start_recording`, or fed
+    directly with `append`. Read files back with `read_sequence_file` or
+    `iter_sequence_file`.
+
+    Parameters
+    ----------
+    path : str
+        File to create. An existing file is overwritten.
+    chunk_frames : int, default=256
+        Number of frames per chunk.
+    flush_interval : float, optional, default=1.0
+        Also close a chunk once its first frame is this many seconds old, so slow
+        recordings reach the disk regularly. None only closes full chunks.
+    max_buffered_frames : int, optional
+        Frames the open chunk may hold while the previous one is still being written
+        (default 16 * `chunk_frames`). Must be at least `chunk_frames`.
+    fsync : bool, default=True
+        Sync every chunk to the storage device, not just to the operating system,
+        so chunks also survive a power loss.
+
+    Attributes
+    ----------
+    frame_duration : float
+        Duration given to the last frame when its end time was not specified.
+        `start_recording` sets it to the recording interval.
+    frames_written : int
+        Number of frames written to the file so far.
+    frames_dropped : int
+        Number of frames dropped because the disk fell `max_buffered_frames` behind.
+
+    Example
+    -------
+    >>> with SequenceWriter("session.hps") as writer:
+    ...     seq.start_recording(get_pose, fps=30, max_frames=300, sink=writer)
+    ...     time.sleep(60)
+    ...     seq.stop_recording()
+    >>> recorded = read_sequence_file("session.hps")
+    """
+
+    def __init__(self, path: str, chunk_frames: int = 256, flush_interval: Optional[float] = 1.0,
+                 max_buffered_frames: Optional[int] = None, fsync: bool = True):
+        if chunk_frames < 1:
+            raise ValueError("chunk_frames must be at least 1")
+        if max_buffered_frames is None:
+            max_buffered_frames = 16 * chunk_frames
+        if max_buffered_frames < chunk_frames:
+            raise ValueError("max_buffered_frames must be at least chunk_frames")
+        self.path = path
+        self.chunk_frames = int(chunk_frames)
+        self.max_buffered_frames = int(max_buffered_frames)
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.frame_duration = 1.0 / 30.0
+        self.frames_written = 0
+        self.frames_dropped = 0
+
+        self._new_chunk()
+        self._spare = None  # Buffers of the last written chunk, reused by `_take_chunk`
+        self._last_end_estimated = False
+        self._closed = False
+        self._error = None
+        # Guards the open chunk; `_chunk_ready` wakes the background thread when one starts or fills
+        self._lock = threading.Lock()
+        self._chunk_ready = threading.Condition(self._lock)
+
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION))
+        self._sync()
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def append(self, pose: HandPose, start_time: float, end_time: Optional[float] = None):
+        """
+        Append one frame.
+
+        Parameters
+        ----------
+        pose : HandPose
+            The pose to store. Its landmarks are copied.
+        start_time : float
+            Start time of the frame in seconds, not earlier than the previous frame's.
+        end_time : float, optional
+            End time of the frame in seconds. If omitted, the frame lasts until the next
+            frame starts (or `frame_duration` for the last frame), as in `HandPoseSequence`.
+
+        Raises
+        ------
+        ValueError
+            If the writer has been closed.
+        """
+        if self._closed:
+            raise ValueError("Cannot append to a closed SequenceWriter")
+        with self._lock:
+            n = len(self._sides)
+            if self._last_end_estimated and n:
+                self._end_times[n - 1] = start_time
+                self._last_end_estimated = False
+            if n == self.max_buffered_frames:
+                self.frames_dropped += 1
+                return
+            if n == len(self._start_times):
+                self._grow_chunk(min(2 * n, self.max_buffered_frames))
+            if n == 0:
+                self._chunk_started = time.perf_counter()
+
+            self._points[n] = pose.array
+            self._start_times[n] = start_time
+            self._last_end_estimated = end_time is None
+            self._end_times[n] = start_time + self.frame_duration if end_time is None else end_time
+            self._sides.append(pose.side)
+            self._names.append(pose.name)
+            if n == 0 or n + 1 == self.chunk_frames:
+                self._chunk_ready.notify()  # Start the chunk's flush timer, or hand over the full chunk
+
+    def close(self):
+        """
+        Write the remaining frames, wait for the background thread and close the file.
+
+        Safe to call more than once.
+
+        Raises
+        ------
+        OSError
+            If writing any chunk failed.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._chunk_ready.notify()
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "SequenceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # --- Internals ---
+
+    def _new_chunk(self, buffers=None):
+        """Start an empty open chunk, in the (points, start_times, end_times) `buffers` if given."""
+        if buffers is None:
+            buffers = (np.empty((self.chunk_frames, 21, 3), dtype=np.float64),
+                       np.empty(self.chunk_frames, dtype=np.float64),
+                       np.empty(self.chunk_frames, dtype=np.float64))
+        self._points, self._start_times, self._end_times = buffers
+        self._sides = []
+        self._names = []
+        self._chunk_started = None
+
+    def _grow_chunk(self, capacity: int):
+        """Enlarge the open chunk's buffers, while the previous chunk is still being written."""
+        n = len(self._sides)
+        for attr in ("_points", "_start_times", "_end_times"):
+            old = getattr(self, attr)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, attr, new)
+
+    def _chunk_due(self) -> bool:
+        """Whether the open chunk should be closed now. Call with `_lock` held."""
+        n = len(self._sides)
+        if not n:
+            return False
+        if self._closed or n >= self.chunk_frames:
+            return True
+        return self.flush_interval is not None and time.perf_counter() - self._chunk_started >= self.flush_interval
+
+    def _seal_timeout(self) -> Optional[float]:
+        """Seconds the background thread may wait before the open chunk expires."""
+        if self.flush_interval is None or not self._sides:
+            return None
+        return max(self._chunk_started + self.flush_interval - time.perf_counter(), 0.001)
+
+    def _take_chunk(self):
+        """
+        Swap the open chunk for an empty one and return its buffers and labels as
+        (points, start_times, end_times, sides, names, last_end_open). Call with `_lock` held.
+        """
+        # A last end time still estimated is replaced by the next chunk's first start when read
+        chunk = (self._points, self._start_times, self._end_times, self._sides, self._names,
+                 self._last_end_estimated)
+        self._new_chunk(self._spare)
+        self._spare = None
+        return chunk
+
+    def _write_loop(self):
+        while True:
+            with self._chunk_ready:
+                while not self._chunk_due():
+                    if self._closed:
+                        return
+                    self._chunk_ready.wait(self._seal_timeout())
+                points, start_times, end_times, sides, names, last_end_open = self._take_chunk()
+            n = len(sides)
+            try:
+                if self._error is None:  # After a failed write, keep emptying chunks but stop writing
+                    self._file.write(_encode_chunk(points[:n], start_times[:n], end_times[:n],
+                                                   sides, names, last_end_open))
+                    self._sync()
+                    self.frames_written += n
+            except OSError as error:
+                self._error = error
+            self._spare = (points, start_times, end_times)  # Reused as the chunk after next
+
+    def _sync(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+
+class SequenceJsonlWriter:
+    """
+    Appends hand pose frames to a JSON Lines file, one frame per line.
+
+    Each line has the same layout as the items of `DataReader.convert_HandPoseSequence_to_json`:
+    {"start_time": float, "end_time": float, "pose": {...}}. Lines are flushed as they
+    are written, so the file can be followed with `tail -f` and read back lazily with
+    `DataReader.iter_sequence_jsonl` while it is still being written. A frame whose end
+    time is not given is written once the next frame arrives (or on `close`), because
+    its end time is the next frame's start.
+
+    Like `SequenceWriter`, it can be passed as the `sink` of `HandPoseSequence.start_recording`.
+
+    Parameters
+    ----------
+    path : str
+        File to write.
+    append : bool, default=False
+        Add frames to the end of an existing file instead of overwriting it.
+
+    Attributes
+    ----------
+    frame_duration : float
+        Duration given to the last frame when its end time was not specified.
+        `start_recording` sets it to the recording interval.
+    frames_written : int
+        Number of frames appended so far.
+    """
+
+    def __init__(self, path: str, append: bool = False):
+        self.path = path
+        self.frame_duration = 1.0 / 30.0
+        self.frames_written = 0
+        self._pending = None  # Frame dict waiting for the next frame's start time
+        self._file = open(path, "a" if append else "w", encoding="utf-8", buffering=1)  # Line-buffered
+
+    def append(self, pose: HandPose, start_time: float, end_time: Optional[float] = None):
+        """
+        Append one frame.
+
+        Parameters
+        ----------
+        pose : HandPose
+            The pose to write. It is serialized immediately.
+        start_time : float
+            Start time of the frame in seconds.
+        end_time : float, optional
+            End time of the frame in seconds. If omitted, the frame lasts until the next
+            frame starts (or `frame_duration` for the last frame).
+
+        Raises
+        ------
+        ValueError
+            If the writer has been closed.
+        """
+        if self._file.closed:
+            raise ValueError("Cannot append to a closed SequenceJsonlWriter")
+        if self._pending is not None:
+            self._pending["end_time"] = start_time
+            self._write(self._pending)
+            self._pending = None
+
+        frame = {"start_time": start_time, "end_time": end_time, "pose": DataReader.export_HandPose_to_json(pose)}
+        if end_time is None:
+            self._pending = frame
+        else:
+            self._write(frame)
+        self.frames_written += 1
+
+    def close(self):
+        """Write the last pending frame and close the file. Safe to call more than once."""
+        if self._file.closed:
+            return
+        if self._pending is not None:
+            self._pending["end_time"] = self._pending["start_time"] + self.frame_duration
+            self._write(self._pending)
+            self._pending = None
+        self._file.close()
+
+    def __enter__(self) -> "SequenceJsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write(self, frame: dict):
+        self._file.write(json.dumps(frame, separators=(",", ":")) + "\n")
+
+
+def iter_sequence_file(path: str) -> Iterator[HandPoseSequence]:
+    """
+    Read a file written by `SequenceWriter` one chunk at a time.
+
+    Reading stops quietly at the first incomplete or corrupted chunk, which is what a
+    crash during recording leaves behind. A chunk closed by `flush_interval` while its
+    last frame was still open is held back until the next chunk is read, whose first
+    start time becomes that frame's end time.
+
+    Parameters
+    ----------
+    path : str
+        File to read.
+
+    Yields
+    ------
+    HandPoseSequence
+        The frames of each chunk, in order.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a hand pose sequence file.
+    """
+    held = None  # Columns of a chunk whose last end time waits for the next chunk
+    for columns, last_end_open in _iter_chunks(path):
+        if held is not None:
+            points, start_times, end_times, sides, names = held
+            end_times = end_times.copy()
+            end_times[-1] = columns[1][0]
+            yield HandPoseSequence.from_arrays(points, start_times, end_times, sides, names)
+            held = None
+        if last_end_open:
+            held = columns
+        else:
+            yield HandPoseSequence.from_arrays(*columns)
+    if held is not None:
+        yield HandPoseSequence.from_arrays(*held)
+
+
+def read_sequence_file(path: str) -> HandPoseSequence:
+    """
+    Read a whole file written by `SequenceWriter` into one sequence.
+
+    Parameters
+    ----------
+    path : str
+        File to read.
+
+    Returns
+    -------
+    HandPoseSequence
+        Every intact frame of the file (see `iter_sequence_file`).
+    """
+    chunks = [chunk._columns() for chunk in iter_sequence_file(path)]
+    if not chunks:
+        return HandPoseSequence()
+    points, start_times, end_times, sides, names = (np.concatenate(column) for column in zip(*chunks))
+    return HandPoseSequence.from_arrays(points, start_times, end_times, sides, names, copy=False)
+
+
+def _iter_chunks(path: str) -> Iterator[Tuple[tuple, bool]]:
+    """
+    Yield ((points, start_times, end_times, sides, names), last_end_open) for each
+    intact chunk of a `SequenceWriter` file. The arrays are read-only views of the chunk.
+    """
+    with open(path, "rb") as f:
+        _read_header(f)
+        while True:
+            header = f.read(_CHUNK_HEADER.size)
+            if len(header) < _CHUNK_HEADER.size:
+                return
+            length, crc = _CHUNK_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+            yield _decode_chunk(payload)
+
+
+def _encode_chunk(points: np.ndarray, start_times: np.ndarray, end_times: np.ndarray,
+                  sides: list, names: list, last_end_open: bool) -> bytes:
+    payload = b"".join((
+        _COUNT.pack(len(sides)),
+        points.tobytes(),
+        start_times.tobytes(),
+        end_times.tobytes(),
+        json.dumps([sides, names, last_end_open]).encode("utf-8"),
+    ))
+    return _CHUNK_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _read_header(f: BinaryIO):
+    header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError("Not a hand pose sequence file: missing header")
+    magic, version = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Not a hand pose sequence file: bad magic bytes")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported hand pose sequence file version {version}")
+
+
+def _decode_chunk(payload: bytes) -> Tuple[tuple, bool]:
+    n, = _COUNT.unpack_from(payload)
+    offset = _COUNT.size
+    points = np.frombuffer(payload, dtype="<f8", count=n * 63, offset=offset).reshape(n, 21, 3)
+    offset += points.nbytes
+    start_times = np.frombuffer(payload, dtype="<f8", count=n, offset=offset)
+    offset += start_times.nbytes
+    end_times = np.frombuffer(payload, dtype="<f8", count=n, offset=offset)
+    offset += end_times.nbytes
+    sides, names, *rest = json.loads(payload[offset:].decode("utf-8"))
+    last_end_open = bool(rest and rest[0])
+    return (points, start_times, end_times, sides, names), last_end_open
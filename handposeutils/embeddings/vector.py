@@ -7,6 +7,36 @@ from typing import List
 from handposeutils.data.handpose import HandPose
 from handposeutils.data.coordinate import Coordinate
 from typing import Callable, Optional, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from handposeutils.calculations.similarity import _stacked_points
+
+# Angle triplets (a, b, c) of `get_joint_angle_vector`, the angle being measured at b
+_JOINT_ANGLE_TRIPLETS: List[tuple[int, int, int]] = [
+    # Thumb
+    (1, 2, 3), (2, 3, 4), (0, 1, 2),
+    # Index
+    (5, 6, 7), (6, 7, 8), (0, 5, 6),
+    # Middle
+    (9, 10, 11), (10, 11, 12), (0, 9, 10),
+    # Ring
+    (13, 14, 15), (14, 15, 16), (0, 13, 14),
+    # Pinky
+    (17, 18, 19), (18, 19, 20), (0, 17, 18),
+]
+
+# Landmark pairs of `get_bone_length_vector`
+_BONE_PAIRS: List[tuple[int, int]] = [
+    # Thumb
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    # Index
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    # Middle
+    (0, 9), (9, 10), (10, 11), (11, 12),
+    # Ring
+    (0, 13), (13, 14), (14, 15), (15, 16),
+    # Pinky
+    (0, 17), (17, 18), (18, 19), (19, 20)
+]
 
 
 def get_joint_angle_vector(pose: HandPose) -> np.ndarray:
@@ -43,22 +73,8 @@ def get_joint_angle_vector(pose: HandPose) -> np.ndarray:
         cos_angle = np.clip(dot / norm, -1.0, 1.0)
         return acos(cos_angle)
 
-    # Define angle triplets (a, b, c)
-    triplets: List[tuple[int, int, int]] = [
-        # Thumb
-        (1, 2, 3), (2, 3, 4), (0, 1, 2),
-        # Index
-        (5, 6, 7), (6, 7, 8), (0, 5, 6),
-        # Middle
-        (9, 10, 11), (10, 11, 12), (0, 9, 10),
-        # Ring
-        (13, 14, 15), (14, 15, 16), (0, 13, 14),
-        # Pinky
-        (17, 18, 19), (18, 19, 20), (0, 17, 18),
-    ]
-
     angles = []
-    for a_idx, b_idx, c_idx in triplets:
+    for a_idx, b_idx, c_idx in _JOINT_ANGLE_TRIPLETS:
         a, b, c = pose[a_idx], pose[b_idx], pose[c_idx]
         angle = compute_angle(a, b, c)
         angles.append(angle)
@@ -88,21 +104,8 @@ def get_bone_length_vector(pose: HandPose) -> np.ndarray:
     np.ndarray
         Array of shape (20,) representing lengths of each bone segment.
     """
-    bone_pairs: List[tuple[int, int]] = [
-        # Thumb
-        (0, 1), (1, 2), (2, 3), (3, 4),
-        # Index
-        (0, 5), (5, 6), (6, 7), (7, 8),
-        # Middle
-        (0, 9), (9, 10), (10, 11), (11, 12),
-        # Ring
-        (0, 13), (13, 14), (14, 15), (15, 16),
-        # Pinky
-        (0, 17), (17, 18), (18, 19), (19, 20)
-    ]
-
     lengths = []
-    for i, j in bone_pairs:
+    for i, j in _BONE_PAIRS:
         coord_i = pose[i]
         coord_j = pose[j]
         dist = np.linalg.norm(np.array(coord_j.as_tuple()) - np.array(coord_i.as_tuple()))
@@ -172,6 +175,46 @@ def get_fused_pose_embedding(pose: HandPose) -> np.ndarray:
 
     return np.concatenate([angles, lengths, rel])
 
+
+def get_fused_pose_embeddings(poses, chunk_size: int = 4096) -> np.ndarray:
+    """
+    Compute `get_fused_pose_embedding` for many poses at once.
+
+    Poses are embedded one chunk at a time with array operations, so only one chunk of
+    poses is held in working memory and memory-mapped libraries
+    (see `DataReader.open_pose_library`) are never loaded whole.
+
+    Parameters
+    ----------
+    poses : HandPoseBatch, HandPoseSequence, list of HandPose, or np.ndarray of shape (N, 21, 3)
+        Normalized hand poses to encode.
+    chunk_size : int, optional
+        Poses embedded at a time (default 4096).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (N, 98); row i is the fused embedding of pose i.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    points = _stacked_points(poses)
+    triplets = np.array(_JOINT_ANGLE_TRIPLETS)
+    bones = np.array(_BONE_PAIRS)
+
+    embeddings = np.empty((len(points), 98))
+    for start in range(0, len(points), chunk_size):
+        chunk = np.asarray(points[start:start + chunk_size], dtype=float)
+        out = embeddings[start:start + chunk_size]
+
+        v1 = chunk[:, triplets[:, 0]] - chunk[:, triplets[:, 1]]
+        v2 = chunk[:, triplets[:, 2]] - chunk[:, triplets[:, 1]]
+        norms = np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1) + 1e-8
+        out[:, :15] = np.arccos(np.clip(np.sum(v1 * v2, axis=-1) / norms, -1.0, 1.0))
+        out[:, 15:35] = np.linalg.norm(chunk[:, bones[:, 1]] - chunk[:, bones[:, 0]], axis=-1)
+        out[:, 35:] = (chunk - chunk[:, :1]).reshape(len(chunk), 63)
+    return embeddings
+
 from handposeutils.data.handpose_sequence import HandPoseSequence
 
 def _sinusoidal_time_encoding(timestamps: np.ndarray, dim: int, time_scale: float = 1.0) -> np.ndarray:
@@ -379,19 +422,21 @@ def structured_temporal_embedding(
             per_frame_dim = pose_dim * (2 + (1 if include_velocity else 0))  # pose + posenc + velocity
             return np.zeros((max_length, per_frame_dim), dtype=float)
 
-    timestamps = np.array(sequence.get_all_timestamps(), dtype=float)  # (T,)
+    timestamps = sequence.start_times.copy()  # (T,)
 
     # 2) Compute per-frame pose embeddings
-    per_frame = []
-    for timed in sequence.sequence:
-        e = pose_embedding_fn(timed.pose)
-        if e is None:
-            raise ValueError("pose_embedding_fn returned None for a pose")
-        per_frame.append(np.asarray(e, dtype=float))
-    per_frame = np.vstack(per_frame)  # (T, D_pose)
+    per_frame = FrameEmbeddingCache(sequence, pose_embedding_fn)[:]  # (T, D_pose)
     if verbose:
         print(f"[structured] raw per-frame embeddings shape: {per_frame.shape}")
 
+    return _compose_temporal_embedding(per_frame, timestamps, max_length, include_velocity,
+                                       time_scale, downsample, pca_components, verbose)
+
+
+def _compose_temporal_embedding(per_frame: np.ndarray, timestamps: np.ndarray, max_length: Optional[int],
+                                include_velocity: bool, time_scale: float, downsample: Optional[str],
+                                pca_components: Optional[int], verbose: bool) -> np.ndarray:
+    """Steps 3-8 of `structured_temporal_embedding`, from per-frame embeddings (T, D_pose) and their timestamps."""
     # 3) Optional downsample/truncate to max_length
     T, D_pose = per_frame.shape
     if max_length is not None and T > max_length and downsample == "uniform":
@@ -432,6 +477,128 @@ def structured_temporal_embedding(
     return composed  # shape (T_out, D_out)
 
 
+class FrameEmbeddingCache:
+    """
+    Per-frame pose embeddings of a sequence, each computed once on first use.
+
+    Useful when the same frames are embedded many times, e.g. by overlapping windows
+    (see `windowed_temporal_embeddings`).
+
+    Parameters
+    ----------
+    sequence : HandPoseSequence
+        Sequence whose frames are embedded. Its frames must not change while the cache
+        is in use (take a `snapshot` of a sequence that is being recorded).
+    pose_embedding_fn : Callable[[HandPose], np.ndarray]
+        Function computing the static embedding of one HandPose.
+
+    Example
+    -------
+    >>> cache = FrameEmbeddingCache(sequence, get_fused_pose_embedding)
+    >>> cache[10:40].shape  # frames 10-39 are embedded now...
+    (30, 98)
+    >>> cache[20:50].shape  # ...so only frames 40-49 are embedded here
+    (30, 98)
+    """
+
+    def __init__(self, sequence: HandPoseSequence, pose_embedding_fn: Callable[[object], np.ndarray]):
+        self.sequence = sequence
+        self.pose_embedding_fn = pose_embedding_fn
+        self._embeddings = None  # (T, D_pose), allocated once the dimension is known
+        self._computed = np.zeros(len(sequence), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self._computed)
+
+    @property
+    def computed_count(self) -> int:
+        """Number of frames embedded so far."""
+        return int(self._computed.sum())
+
+    def __getitem__(self, frames) -> np.ndarray:
+        """
+        Embeddings of the given frames (an index, slice or index array), computing missing ones.
+
+        Returns
+        -------
+        np.ndarray
+            Rows of the cache, shape (D_pose,) for an index or (n, D_pose) otherwise.
+            Slices return views onto the cache.
+        """
+        requested = np.atleast_1d(np.arange(len(self))[frames])
+        for i in requested[~self._computed[requested]]:
+            e = self.pose_embedding_fn(self.sequence.get_pose_by_index(int(i)))
+            if e is None:
+                raise ValueError("pose_embedding_fn returned None for a pose")
+            e = np.asarray(e, dtype=float)
+            if self._embeddings is None:
+                self._embeddings = np.empty((len(self), e.shape[0]), dtype=float)
+            self._embeddings[i] = e
+            self._computed[i] = True
+        if self._embeddings is None:  # Nothing requested yet, so the dimension is unknown
+            return np.zeros(np.arange(len(self))[frames].shape + (0,), dtype=float)
+        return self._embeddings[frames]
+
+
+def windowed_temporal_embeddings(
+    sequence: HandPoseSequence,
+    pose_embedding_fn: Callable[[object], np.ndarray],
+    size: int,
+    stride: int = 1,
+    cache: Optional[FrameEmbeddingCache] = None,
+    max_length: Optional[int] = None,
+    include_velocity: bool = True,
+    time_scale: float = 1.0,
+    downsample: Optional[str] = "uniform",
+    pca_components: Optional[int] = None,
+    verbose: bool = False
+) -> np.ndarray:
+    """
+    Structured temporal embeddings of overlapping windows of a sequence.
+
+    Equivalent to calling `structured_temporal_embedding` on every window of
+    `sequence.windows(size, stride)`, but each frame is embedded only once, and windows
+    are strided views, so no per-window sequences are built.
+
+    Parameters
+    ----------
+    sequence : HandPoseSequence
+        Sequence of timed hand poses.
+    pose_embedding_fn : Callable[[HandPose], np.ndarray]
+        Function to compute static embedding for each HandPose frame.
+    size : int
+        Frames per window.
+    stride : int, optional
+        Frames between consecutive window starts (default 1).
+    cache : FrameEmbeddingCache, optional
+        Cache of `sequence`'s frame embeddings to use and fill, e.g. to share
+        embedded frames between several window sizes. A new cache is used by default.
+    max_length, include_velocity, time_scale, downsample, pca_components, verbose
+        As in `structured_temporal_embedding`, applied per window.
+
+    Returns
+    -------
+    np.ndarray, shape (W, T_out, D_out)
+        One structured temporal embedding per window, in window order.
+    """
+    if cache is None:
+        cache = FrameEmbeddingCache(sequence, pose_embedding_fn)
+    elif cache.sequence is not sequence:
+        raise ValueError("cache belongs to a different sequence")
+
+    times = sequence.window_times(size, stride)  # (W, size)
+    if len(times) == 0:
+        return np.zeros((0, 0, 0), dtype=float)
+    per_frame = cache[:len(times[0]) + (len(times) - 1) * stride]  # Every frame covered by a window
+    per_frame_windows = np.moveaxis(sliding_window_view(per_frame, size, axis=0)[::stride], -1, 1)
+
+    return np.stack([
+        _compose_temporal_embedding(frames, timestamps, max_length, include_velocity,
+                                    time_scale, downsample, pca_components, verbose)
+        for frames, timestamps in zip(per_frame_windows, times)
+    ])
+
+
 def flatten_temporal_embedding(
     sequence: HandPoseSequence,
     pose_embedding_fn: Callable[[object], np.ndarray],
@@ -172,8 +172,7 @@ class HandPoseVisualizer:
         self.geometry.clear()
 
         for hand_pose in self.hand_poses:
-            coords = hand_pose.get_all_coordinates()
-            landmark_points = np.array([[pt.x, pt.y, pt.z] for pt in coords])
+            landmark_points = hand_pose.array
 
             highlighted_finger = getattr(hand_pose, "getHighlightedFinger", lambda: None)()
             highlight_color = np.array(getattr(hand_pose, "getHighlightColor", lambda: (1.0, 1.0, 0.0))()) * 0.3
@@ -300,7 +299,7 @@ class HandPoseVisualizer:
 
         Parameters
         ----------
-        hand_pose_sequence : list
+        hand_pose_sequence : HandPoseSequence or list of TimedHandPose
             HandPoseSequence to play.
         fps : int, optional
             Frames per second playback rate.
@@ -319,20 +318,23 @@ class HandPoseVisualizer:
             print("[!] Empty sequence.")
             return
 
-        first_pose = hand_pose_sequence[0].pose
-        self.build_cached_geometry([first_pose])
+        # Read frames straight from the sequence's (T, 21, 3) array, through one reused pose
+        if hasattr(hand_pose_sequence, "array"):
+            frames = hand_pose_sequence.array
+        else:
+            frames = np.stack([timed_pose.pose.array for timed_pose in hand_pose_sequence])
+        pose = hand_pose_sequence[0].pose.copy()
+        self.build_cached_geometry([pose])
 
         try:
             while True:
-                if index >= len(hand_pose_sequence):
+                if index >= len(frames):
                     if loop:
                         index = 0
                     else:
                         break
 
-                timed_pose = hand_pose_sequence[index]
-                pose = timed_pose.pose
-
+                pose.array[...] = frames[index]
                 self.update_cached_geometry([pose])
 
                 time.sleep(frame_duration)
@@ -359,8 +361,7 @@ class HandPoseVisualizer:
 
 
         for pose in hand_poses:
-            coords = pose.get_all_coordinates()
-            landmark_points = np.array([[pt.x, pt.y, pt.z] for pt in coords])
+            landmark_points = pose.array
 
             scale = self._compute_pose_scale(pose)
             scale_factor = scale * 0.05  # Tunable coefficient
@@ -423,8 +424,7 @@ class HandPoseVisualizer:
             # return
 
         for h_index, pose in enumerate(hand_poses):
-            coords = pose.get_all_coordinates()
-            landmark_points = np.array([[pt.x, pt.y, pt.z] for pt in coords])
+            landmark_points = pose.array
 
             # === Update Landmarks ===
             for i, pt in enumerate(landmark_points):
@@ -474,19 +474,8 @@ class HandPoseVisualizer:
         float
             Maximum span of pose coordinates across x, y, z axes.
         """
-        coords = hand_pose.get_all_coordinates()
-        min_x = min(c.x for c in coords)
-        max_x = max(c.x for c in coords)
-        min_y = min(c.y for c in coords)
-        max_y = max(c.y for c in coords)
-        min_z = min(c.z for c in coords)
-        max_z = max(c.z for c in coords)
-
-        range_x = max_x - min_x
-        range_y = max_y - min_y
-        range_z = max_z - min_z
-
-        return max(range_x, range_y, range_z)  # largest dimension span
+        points = hand_pose.array
+        return float(np.ptp(points, axis=0).max())  # largest dimension span
 
     def visualize_pose_similarity(self, pose1, pose2, method='euclidean', offset=False):
         """
@@ -506,8 +495,8 @@ class HandPoseVisualizer:
         if not pose1 or not pose2:
             raise ValueError("Both poses must be provided.")
 
-        coords1 = np.array([c.as_tuple() for c in pose1.get_all_coordinates()])
-        coords2 = np.array([c.as_tuple() for c in pose2.get_all_coordinates()])
+        coords1 = pose1.array
+        coords2 = pose2.array
 
         if offset:
             coords2 = coords2 + np.array([0.15, 0.0, 0.0])
@@ -0,0 +1,29 @@
+import json
+import numpy as np
+
+from handposeutils.data.data_reader import DataReader
+from handposeutils.data.handpose_batch import HandPoseBatch
+from handposeutils.calculations.augmentation import Augmenter
+
+poses = []
+for name in ['rock_on', 'shocker']:
+    with open(f'poses/{name}.json') as f:
+        poses.append(DataReader.convert_json_to_HandPose(json_data=json.load(f)))
+
+batch = HandPoseBatch.from_handposes(poses)
+augmenter = Augmenter(max_rotation_degrees=45, mirror_probability=0.5, scale_jitter=0.1,
+                      straighten_probability=0.2, noise_std=0.005)
+
+augmented = augmenter.augment(batch, copies=8, rng=0)
+print(augmented, augmented.array.shape)
+print("Sides:", list(augmented.sides))
+
+# Same seed, same output, whether produced at once or streamed in chunks of any size
+again = augmenter.augment(batch, copies=8, rng=0)
+print("Reproducible:", np.array_equal(augmented.array, again.array))
+for chunk_size in [5, 3, 16]:
+    chunks = list(augmenter.iter_augmented(batch, copies=8, chunk_size=chunk_size, rng=0))
+    streamed = np.concatenate([chunk.array for chunk in chunks])
+    sides = np.concatenate([chunk.sides for chunk in chunks])
+    print(f"Chunks of {chunk_size} match augment():", np.allclose(streamed, augmented.array),
+          list(sides) == list(augmented.sides))
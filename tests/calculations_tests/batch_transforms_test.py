@@ -0,0 +1,49 @@
+import json
+import numpy as np
+
+from handposeutils.data.data_reader import DataReader
+from handposeutils.data.handpose_batch import HandPoseBatch
+from handposeutils.calculations.transforms import TransformPipeline, rotate_pose_by_axis_angle
+
+poses = []
+for name in ['rock_on', 'shocker']:
+    with open(f'poses/{name}.json') as f:
+        poses.append(DataReader.convert_json_to_HandPose(json_data=json.load(f)))
+
+batch = HandPoseBatch.from_handposes(poses)
+print(batch, batch.array.shape)
+
+# The same chain as one fused pipeline, applied to an untouched copy of the batch
+pipeline = TransformPipeline().normalize().rotate(30, "x").mirror("z")
+fused = pipeline.apply(batch)
+print(pipeline)
+
+# Same transforms, once over the whole batch and once pose by pose
+batch.normalize(inplace=True)
+batch.rotate(degrees=30, axis="x", inplace=True)
+batch.mirror("z", inplace=True)
+print("Pipeline matches step-by-step batch:", np.allclose(fused.array, batch.array))
+
+# Repeated normalize steps fold a per-pose scale into the pipeline more than once
+renormalize = TransformPipeline().normalize().rotate(30, "x").normalize()
+fused = renormalize.apply(batch)
+stepwise = batch.copy()
+stepwise.normalize(inplace=True)
+stepwise.rotate(degrees=30, axis="x", inplace=True)
+stepwise.normalize(inplace=True)
+print("Repeated normalize matches step-by-step batch:", np.allclose(fused.array, stepwise.array))
+
+batch.straighten_finger("index", inplace=True)
+
+for i, pose in enumerate(poses):
+    pose.normalize()
+    pose.rotate(degrees=30, axis="x")
+    pose.mirror("z")
+    pose.straighten_finger("index")
+    print(f"Pose {i} matches batch row:", np.allclose(pose.array, batch.array[i]))
+
+# A different rotation per row, in one call
+rotated = rotate_pose_by_axis_angle(batch, axis=[[1, 0, 0], [0, 1, 1]], degrees=[30, -45])
+for i, pose in enumerate(poses):
+    expected = rotate_pose_by_axis_angle(pose, axis=[[1, 0, 0], [0, 1, 1]][i], degrees=[30, -45][i])
+    print(f"Pose {i} matches per-row rotation:", np.allclose(expected.array, rotated.array[i]))
@@ -16,3 +16,7 @@ with open('poses/rock_on.json') as f:
     #pose2.straighten_finger("ring")
 
 print(pose_similarity(pose1, pose2, "procrustes"))
+
+# Palm-frame comparison is unaffected by rotating either pose
+pose2.rotate(degrees=60, axis="y")
+print(pose_similarity(pose1, pose2, "canonical"))
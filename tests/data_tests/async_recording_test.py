@@ -0,0 +1,38 @@
+import asyncio
+import numpy as np
+
+from handposeutils.data.handpose import HandPose
+from handposeutils.data.handpose_sequence import HandPoseSequence
+
+async def incoming_poses(count):
+    # Stands in for landmarks arriving over a websocket
+    for i in range(count):
+        await asyncio.sleep(0.005)
+        yield HandPose.from_array(np.full((21, 3), float(i)), "right_hand")
+
+async def session(count):
+    sequence = HandPoseSequence()
+    recording = sequence.record_async(incoming_poses(count), max_frames=10, max_pending=10)
+    received = [frame.pose.array[0, 0] async for frame in sequence]
+    await recording
+    return received == list(range(count))
+
+async def main():
+    results = await asyncio.gather(*[session(40) for _ in range(100)])
+    print("Sessions that received every frame in order:", sum(results), "of", len(results))
+
+asyncio.run(main())
+
+async def cancelled_before_start():
+    # Cancelling the task before it first runs still ends the session
+    sequence = HandPoseSequence()
+    recording = sequence.record_async(incoming_poses(5))
+    recording.cancel()
+    try:
+        await recording
+    except asyncio.CancelledError:
+        pass
+    await sequence.record_async(incoming_poses(5))
+    return len(sequence)
+
+print("Frames recorded after a cancelled session:", asyncio.run(cancelled_before_start()), "of 5")
@@ -0,0 +1,30 @@
+import numpy as np
+import time
+
+from handposeutils.data.handpose import HandPose
+from handposeutils.data.handpose_sequence import HandPoseSequence
+from handposeutils.calculations import transforms as T
+
+rng = np.random.default_rng(0)
+
+def get_pose():
+    return HandPose.from_array(rng.normal(size=(21, 3)), "left_hand")
+
+# Keep only the last 10 frames while recording
+sequence = HandPoseSequence()
+sequence.start_recording(get_pose, fps=120, max_frames=10)
+time.sleep(0.3)
+sequence.stop_recording()
+print(sequence, "(at most 10 kept)")
+
+# Once stopped, the sequence is ordinary again: in-place transforms edit its storage
+before = sequence.array.copy()
+T.mirror_pose(sequence, inplace=True)
+print("Mirrored in place:", np.allclose(sequence.array[..., 0], -before[..., 0]))
+
+T.canonicalize(sequence, mirror_left=True, inplace=True)
+print("Canonicalized in place:", not np.allclose(sequence.array, before), set(sequence.sides))
+
+sequence[0].pose.array[:] = 0.0
+print("Edits through frames stick:", not sequence.array[0].any())
+print("Time slices share memory:", np.shares_memory(sequence.slice_time(0.0, 1e9).array, sequence.array))
@@ -0,0 +1,22 @@
+import numpy as np
+
+from handposeutils.data.handpose import HandPose
+from handposeutils.data.handpose_sequence import HandPoseSequence, TimedHandPose
+from handposeutils.visualization.visualized_pose import VisualizedPose
+
+# A HandPose subclass is copied in, like a plain HandPose, and rebuilt when read back
+pose = VisualizedPose(np.ones((21, 3)), "left_hand")
+pose.annotation = "rock"
+own_array = pose.array
+sequence = HandPoseSequence([TimedHandPose(pose, 0.0, 1.0)])
+print("Caller's pose untouched:", pose.array is own_array)
+
+pose.array[:] = 5.0
+print("Caller's edits stay out of the sequence:", sequence.array[0, 0])
+
+# Growing the storage does not detach rebuilt poses from it
+for i in range(40):
+    sequence._append_pose(HandPose.from_array(np.zeros((21, 3)), "right_hand"), i + 1.0)
+frame = sequence[0].pose
+frame.array[:] = 7.0
+print("Rebuilt:", type(frame).__name__, frame.annotation, "edits write back:", sequence.array[0, 0])
@@ -0,0 +1,67 @@
+import numpy as np
+import os
+import tempfile
+import time
+
+from handposeutils.data.handpose import HandPose
+from handposeutils.data.handpose_sequence import HandPoseSequence
+from handposeutils.data.sequence_writer import SequenceWriter, read_sequence_file, iter_sequence_file
+
+rng = np.random.default_rng(0)
+
+def get_pose():
+    return HandPose.from_array(rng.normal(size=(21, 3)), "right_hand")
+
+# Files go to a temporary folder, so nothing is left in the working directory
+with tempfile.TemporaryDirectory() as folder:
+    recording_path = os.path.join(folder, "recording.hps")
+    truncated_path = os.path.join(folder, "recording_truncated.hps")
+    idle_path = os.path.join(folder, "recording_idle.hps")
+
+    # Record for a second while streaming every frame to disk
+    sequence = HandPoseSequence()
+    with SequenceWriter(recording_path, chunk_frames=16) as writer:
+        sequence.start_recording(get_pose, fps=60, sink=writer)
+        time.sleep(1.0)
+        sequence.stop_recording()
+
+    recorded = read_sequence_file(recording_path)
+    print(recorded, "chunks:", [len(chunk) for chunk in iter_sequence_file(recording_path)])
+    print("Landmarks match:", np.array_equal(sequence.array, recorded.array))
+    print("Timing matches:", np.allclose(sequence.start_times, recorded.start_times),
+          np.allclose(sequence.end_times, recorded.end_times))
+
+    # Cutting the file mid-chunk, as a crash would, only loses that chunk
+    with open(recording_path, "rb") as f:
+        data = f.read()
+    with open(truncated_path, "wb") as f:
+        f.write(data[:-100])
+    print("Frames after truncation:", len(read_sequence_file(truncated_path)), "of", len(recorded))
+
+    # An open chunk reaches the disk after flush_interval even if no further frame arrives
+    writer = SequenceWriter(idle_path, chunk_frames=16, flush_interval=0.1)
+    for i in range(3):
+        writer.append(get_pose(), i / 30)
+    time.sleep(0.5)
+    print("Idle frames on disk before close:", len(read_sequence_file(idle_path)), "of", writer.frames_written)
+    for i in range(3, 5):
+        writer.append(get_pose(), i / 30)
+    writer.close()
+    idle = read_sequence_file(idle_path)
+    print("End time of the idle chunk's last frame fixed up:", idle.end_times[2] == idle.start_times[3])
+
+    # A slow disk never blocks append; frames beyond max_buffered_frames are dropped and counted
+    class SlowDiskWriter(SequenceWriter):
+        def _sync(self):
+            super()._sync()
+            time.sleep(0.2)
+
+    writer = SlowDiskWriter(os.path.join(folder, "recording_slow.hps"), chunk_frames=4, max_buffered_frames=8)
+    append_times = []
+    for i in range(20):
+        started = time.perf_counter()
+        writer.append(get_pose(), i / 30)
+        append_times.append(time.perf_counter() - started)
+    writer.close()
+    print("Slowest append (s):", round(max(append_times), 4), "dropped:", writer.frames_dropped,
+          "written:", writer.frames_written, "on disk:", len(read_sequence_file(writer.path)))
@@ -0,0 +1,19 @@
+import numpy as np
+
+from handposeutils.data.handpose_sequence import HandPoseSequence
+
+# Frame 1 ends before frame 0, so frame 0 is still active after it
+points = np.arange(3, dtype=np.float64)[:, None, None] * np.ones((3, 21, 3))
+sequence = HandPoseSequence.from_arrays(points, [0.0, 0.05, 0.1], [0.1, 0.06, 0.2])
+
+print("Active at 0.08:", sequence.get_pose_at_time(0.08).array[0, 0], "(frame 0)")
+print("Active at 0.055:", sequence.get_pose_at_time(0.055).array[0, 0], "(frame 1, started last)")
+print("Indices:", sequence.get_indices_at_times([-1.0, 0.0, 0.055, 0.08, 0.15, 0.3]), "(expected [-1 0 1 0 2 -1])")
+print("Batch lookup:", sequence.get_poses_at_times([0.08, 0.3]).array[:, 0, 0], "(expected [0 nan])")
+
+# Merged streams overlap the same way
+a = HandPoseSequence.from_arrays(points[:2], [0.0, 1.0], [1.0, 2.0], ["right_hand"] * 2)
+b = HandPoseSequence.from_arrays(points[:2] + 10, [0.2, 0.3], [0.3, 0.4], ["left_hand"] * 2)
+merged = HandPoseSequence.merge([a, b])
+print("Merged lookups:", merged.get_indices_at_times([0.1, 0.25, 0.5, 1.5]), "(expected [0 1 0 3])")
+print("Lookups in a view:", merged[1:].get_indices_at_times([0.25, 0.5, 1.5]), "(expected [0 -1 2])")
@@ -0,0 +1,36 @@
+import json
+import tempfile
+import numpy as np
+
+from handposeutils.data.data_reader import DataReader
+from handposeutils.data.handpose_batch import HandPoseBatch
+from handposeutils.calculations.geometry import get_palm_frame
+from handposeutils.embeddings.vector import get_fused_pose_embedding, get_fused_pose_embeddings
+
+poses = []
+for name in ['rock_on', 'shocker']:
+    with open(f'poses/{name}.json') as f:
+        pose = DataReader.convert_json_to_HandPose(json_data=json.load(f))
+        pose.normalize()
+        poses.append(pose)
+
+# Many noisy copies, saved as a memory-mapped library and processed a chunk at a time
+rng = np.random.default_rng(0)
+points = np.repeat(np.stack([pose.array for pose in poses]), 500, axis=0)
+points += rng.normal(0.0, 0.01, points.shape)
+with tempfile.TemporaryDirectory() as folder:
+    DataReader.save_pose_library(HandPoseBatch.from_array(points, "right_hand"), folder)
+    library = DataReader.open_pose_library(folder)
+    print(library)
+    print("Labels:", set(library.sides), library.names[:2])
+
+    embeddings = get_fused_pose_embeddings(library, chunk_size=128)
+    expected = np.stack([get_fused_pose_embedding(library[i]) for i in range(len(library))])
+    print("Embeddings:", embeddings.shape, "match per-pose:", np.allclose(embeddings, expected))
+
+    frames = get_palm_frame(library, chunk_size=128)
+    print("Palm frames:", frames.shape, "match unchunked:", np.allclose(frames, get_palm_frame(points)))
+
+    # The library is mapped read-only; transforms return new batches by default
+    normalized = library.normalize()
+    print("Normalized copy of read-only library:", normalized.array.flags.writeable, not library.array.flags.writeable)
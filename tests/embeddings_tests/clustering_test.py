@@ -1,31 +1,27 @@
-import json
 import numpy as np
-import os
 from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
 from sklearn.decomposition import PCA
 import matplotlib.pyplot as plt
 
 from handposeutils.data.data_reader import DataReader
-from handposeutils.embeddings.vector import get_fused_pose_embedding
+from handposeutils.embeddings.vector import get_fused_pose_embeddings
 
 
 def load_handposes(base_dirs):
     data = []
     for gesture_name, folder in base_dirs.items():
-        for filename in os.listdir(folder):
-            if filename.endswith(".json"):
-                with open(os.path.join(folder, filename), "r") as f:
-                    pose_data = json.load(f)
+        result = DataReader.load_folder(folder, "*.json", workers=8)
+        for path, error in result.errors:
+            print(f"[!] Skipped {path}: {error}")
 
-                pose = DataReader.convert_json_to_HandPose(pose_data)
-                pose.normalize()
-                embedding = get_fused_pose_embedding(pose)
-
-                data.append({
-                    "name": pose_data["pose"]["name"],
-                    "gesture_class": gesture_name,
-                    "embedding": embedding
-                })
+        poses = result.batch.normalize()
+        embeddings = get_fused_pose_embeddings(poses)
+        for i in range(len(poses)):
+            data.append({
+                "name": poses.names[i],
+                "gesture_class": gesture_name,
+                "embedding": embeddings[i]
+            })
     return data
 
 